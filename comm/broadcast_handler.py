@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+#
+# -*- coding: utf-8 -*-
+#
+# © Copyright 2023 GSI Helmholtzzentrum für Schwerionenforschung
+#
+# This software is distributed under
+# the terms of the GNU General Public Licence version 3 (GPL Version 3),
+# copied verbatim in the file "LICENCE".
+
+import zmq
+
+from comm.base_handler import BaseHandler
+
+class BroadcastCommHandler(BaseHandler):
+    """Communication handler of the master for broadcasting control messages to the controllers (PUB socket).
+
+    Messages are sent as two frames, the topic and the message.
+    The topic is either BroadcastCommHandler.TOPIC_ALL or the FQDN of a controller.
+    """
+
+    TOPIC_ALL = 'ALL'
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.disconnect()
+
+    def connect(self):
+
+        self.context = zmq.Context()
+
+        if not self.context:
+            raise RuntimeError('Failed to create ZMQ context!')
+
+        self.socket = self.context.socket(zmq.PUB)
+
+        if not self.socket:
+            raise RuntimeError('Failed to create ZMQ socket!')
+
+        self.socket.bind(self.endpoint)
+
+        self.poller = None
+
+        self.is_connected = True
+
+    def recv_string(self):
+        raise RuntimeError('Operation not supported')
+
+    def send_string(self, message: str) -> None:
+        self.send_message(BroadcastCommHandler.TOPIC_ALL, message)
+
+    def send_message(self, topic: str, message: str) -> None:
+        self.socket.send_multipart([topic.encode(), message.encode()])
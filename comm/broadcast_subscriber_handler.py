@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+#
+# -*- coding: utf-8 -*-
+#
+# © Copyright 2023 GSI Helmholtzzentrum für Schwerionenforschung
+#
+# This software is distributed under
+# the terms of the GNU General Public Licence version 3 (GPL Version 3),
+# copied verbatim in the file "LICENCE".
+
+import zmq
+
+from comm.base_handler import BaseHandler
+from comm.broadcast_handler import BroadcastCommHandler
+
+class BroadcastSubscriberCommHandler(BaseHandler):
+    """Communication handler of the controller for receiving control messages broadcasted by the master (SUB socket).
+
+    The controller subscribes to messages for all controllers and to messages for its own FQDN.
+    """
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.disconnect()
+
+    def connect(self):
+
+        self.context = zmq.Context()
+
+        if not self.context:
+            raise RuntimeError('Failed to create ZMQ context!')
+
+        self.socket = self.context.socket(zmq.SUB)
+
+        if not self.socket:
+            raise RuntimeError('Failed to create ZMQ socket!')
+
+        self.socket.setsockopt(zmq.SUBSCRIBE, BroadcastCommHandler.TOPIC_ALL.encode())
+        self.socket.setsockopt(zmq.SUBSCRIBE, self.fqdn.encode())
+        self.socket.connect(self.endpoint)
+
+        self.poller = zmq.Poller()
+        self.poller.register(self.socket, zmq.POLLIN)
+
+        self.is_connected = True
+
+    def send_string(self, message: str) -> None:
+        raise RuntimeError('Operation not supported')
+
+    def recv_string(self):
+        """Returns the next message for the controller or None, if no message is received within the timeout."""
+
+        events = dict(self.poller.poll(self.timeout))
+
+        while events.get(self.socket) == zmq.POLLIN:
+
+            topic, message = self.socket.recv_multipart()
+            topic = topic.decode()
+
+            # Subscriptions match by prefix, so the topic is checked for exact match.
+            if topic in (BroadcastCommHandler.TOPIC_ALL, self.fqdn) and message:
+                return message.decode()
+
+            events = dict(self.poller.poll(0))
+
+        return None
+
+    def wait(self, timeout: int) -> bool:
+        """Waits up to the timeout in milliseconds for a message and returns True, if a message is pending."""
+
+        events = dict(self.poller.poll(timeout))
+
+        return events.get(self.socket) == zmq.POLLIN
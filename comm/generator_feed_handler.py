@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+#
+# -*- coding: utf-8 -*-
+#
+# © Copyright 2023 GSI Helmholtzzentrum für Schwerionenforschung
+#
+# This software is distributed under
+# the terms of the GNU General Public Licence version 3 (GPL Version 3),
+# copied verbatim in the file "LICENCE".
+
+import zmq
+
+from comm.base_handler import BaseHandler
+
+class GeneratorFeedCommHandler(BaseHandler):
+    """Communication handler of the master for task generators connected from remote (ROUTER socket)."""
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.disconnect()
+
+    def connect(self):
+
+        self.context = zmq.Context()
+
+        if not self.context:
+            raise RuntimeError('Failed to create ZMQ context!')
+
+        self.socket = self.context.socket(zmq.ROUTER)
+
+        if not self.socket:
+            raise RuntimeError('Failed to create ZMQ socket!')
+
+        # A restarted task generator with the same name takes over the routing identity.
+        self.socket.setsockopt(zmq.ROUTER_HANDOVER, 1)
+        self.socket.bind(self.endpoint)
+
+        self.poller = zmq.Poller()
+        self.poller.register(self.socket, zmq.POLLIN)
+
+        self.is_connected = True
+
+    def recv_string(self):
+        raise RuntimeError('Operation not supported')
+
+    def send_string(self, message: str) -> None:
+        raise RuntimeError('Operation not supported')
+
+    def recv_message(self):
+        """Returns a tuple of the routing identity and the message or (None, None) on poll timeout."""
+
+        events = dict(self.poller.poll(self.timeout))
+
+        if events.get(self.socket) == zmq.POLLIN:
+
+            identity, message = self.socket.recv_multipart()
+
+            if message:
+                return identity.decode(), message.decode()
+
+        return None, None
+
+    def send_message(self, identity: str, message: str) -> None:
+        self.socket.send_multipart([identity.encode(), message.encode()])
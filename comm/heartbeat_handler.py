@@ -0,0 +1,44 @@
+#!/usr/bin/env python3
+#
+# -*- coding: utf-8 -*-
+#
+# © Copyright 2023 GSI Helmholtzzentrum für Schwerionenforschung
+#
+# This software is distributed under
+# the terms of the GNU General Public Licence version 3 (GPL Version 3),
+# copied verbatim in the file "LICENCE".
+
+import zmq
+
+from comm.base_handler import BaseHandler
+
+class HeartbeatCommHandler(BaseHandler):
+    """Communication handler of the master for receiving heartbeats of the controllers (PULL socket)."""
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.disconnect()
+
+    def connect(self):
+
+        self.context = zmq.Context()
+
+        if not self.context:
+            raise RuntimeError('Failed to create ZMQ context!')
+
+        self.socket = self.context.socket(zmq.PULL)
+
+        if not self.socket:
+            raise RuntimeError('Failed to create ZMQ socket!')
+
+        self.socket.bind(self.endpoint)
+
+        self.poller = zmq.Poller()
+        self.poller.register(self.socket, zmq.POLLIN)
+
+        self.is_connected = True
+
+    def send_string(self, message: str) -> None:
+        raise RuntimeError('Operation not supported')
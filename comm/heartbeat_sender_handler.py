@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+#
+# -*- coding: utf-8 -*-
+#
+# © Copyright 2023 GSI Helmholtzzentrum für Schwerionenforschung
+#
+# This software is distributed under
+# the terms of the GNU General Public Licence version 3 (GPL Version 3),
+# copied verbatim in the file "LICENCE".
+
+import zmq
+
+from comm.base_handler import BaseHandler
+
+class HeartbeatSenderCommHandler(BaseHandler):
+    """Communication handler of the controller for sending heartbeats to the master (PUSH socket).
+
+    Heartbeats are fire-and-forget: if a heartbeat cannot be queued immediately, it is dropped.
+    """
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.disconnect()
+
+    def connect(self):
+
+        self.context = zmq.Context()
+
+        if not self.context:
+            raise RuntimeError('Failed to create ZMQ context!')
+
+        self.socket = self.context.socket(zmq.PUSH)
+
+        if not self.socket:
+            raise RuntimeError('Failed to create ZMQ socket!')
+
+        # Outdated heartbeats are worthless, so just one heartbeat is queued.
+        self.socket.setsockopt(zmq.SNDHWM, 1)
+        self.socket.setsockopt(zmq.LINGER, 0)
+        self.socket.connect(self.endpoint)
+
+        self.poller = None
+
+        self.is_connected = True
+
+    def recv_string(self):
+        raise RuntimeError('Operation not supported')
+
+    def send_string(self, message: str) -> bool:
+        """Returns False, if the heartbeat was dropped."""
+
+        try:
+            self.socket.send_string(message, zmq.NOBLOCK)
+        except zmq.Again:
+            return False
+
+        return True
@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+#
+# -*- coding: utf-8 -*-
+#
+# © Copyright 2023 GSI Helmholtzzentrum für Schwerionenforschung
+#
+# This software is distributed under
+# the terms of the GNU General Public Licence version 3 (GPL Version 3),
+# copied verbatim in the file "LICENCE".
+
+import zmq
+import zmq.asyncio
+
+from comm.base_handler import BaseHandler
+
+class MasterAsyncCommHandler(BaseHandler):
+    """Communication handler of the master for the asyncio engine based on zmq.asyncio."""
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.disconnect()
+
+    def connect(self):
+
+        self.context = zmq.asyncio.Context()
+
+        if not self.context:
+            raise RuntimeError('Failed to create ZMQ context!')
+
+        self.socket = self.context.socket(zmq.REP)
+
+        if not self.socket:
+            raise RuntimeError('Failed to create ZMQ socket!')
+
+        self.socket.bind(self.endpoint)
+
+        self.poller = zmq.asyncio.Poller()
+        self.poller.register(self.socket, zmq.POLLIN)
+
+        self.is_connected = True
+
+    async def recv_string(self):
+
+        events = dict(await self.poller.poll(self.timeout))
+
+        if events.get(self.socket) == zmq.POLLIN:
+
+            message = await self.socket.recv_string()
+
+            if message:
+                return message
+
+        return None
+
+    async def send_string(self, message: str) -> None:
+        await self.socket.send_string(message)
+
+    async def recv_pyobj(self):
+        """Receives a pickled object e.g. from a master frontend process or None on poll timeout."""
+
+        events = dict(await self.poller.poll(self.timeout))
+
+        if events.get(self.socket) == zmq.POLLIN:
+            return await self.socket.recv_pyobj()
+
+        return None
+
+    async def send_pyobj(self, obj) -> None:
+        await self.socket.send_pyobj(obj)
@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+#
+# -*- coding: utf-8 -*-
+#
+# © Copyright 2023 GSI Helmholtzzentrum für Schwerionenforschung
+#
+# This software is distributed under
+# the terms of the GNU General Public Licence version 3 (GPL Version 3),
+# copied verbatim in the file "LICENCE".
+
+import zmq
+
+from comm.base_handler import BaseHandler
+
+class MasterFrontendCommHandler(BaseHandler):
+    """Communication handler of a master frontend process.
+
+    Messages of the controllers are received by a REP socket connected to the backend of the master frontend proxy.
+    Decoded messages are forwarded by a REQ socket to the scheduling core of the master.
+    """
+
+    def __init__(self, target: str, port: int, core_port: int, timeout: int) -> None:
+
+        super().__init__(target, port, timeout)
+
+        if not core_port in range(1024, 65535):
+            raise RuntimeError('Communication port of the core must be a number between 1024 and 65535!')
+
+        self.core_endpoint = "tcp://" + self.target + ":" + str(core_port)
+        self.core_socket : zmq.Socket
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.disconnect()
+
+    def connect(self):
+
+        self.context = zmq.Context()
+
+        if not self.context:
+            raise RuntimeError('Failed to create ZMQ context!')
+
+        self.socket = self.context.socket(zmq.REP)
+        self.core_socket = self.context.socket(zmq.REQ)
+
+        if not self.socket or not self.core_socket:
+            raise RuntimeError('Failed to create ZMQ socket!')
+
+        self.socket.connect(self.endpoint)
+        self.core_socket.connect(self.core_endpoint)
+
+        self.poller = zmq.Poller()
+        self.poller.register(self.socket, zmq.POLLIN)
+
+        self.is_connected = True
+
+    def disconnect(self) -> None:
+
+        if self.is_connected and self.core_socket:
+
+            self.core_socket.setsockopt(zmq.LINGER, 0)
+            self.core_socket.close()
+
+        super().disconnect()
+
+    def exchange_pyobj(self, obj):
+        """Sends the object to the core and waits for its response."""
+
+        self.core_socket.send_pyobj(obj)
+
+        return self.core_socket.recv_pyobj()
@@ -38,3 +38,16 @@ class MasterCommHandler(BaseHandler):
         self.poller.register(self.socket, zmq.POLLIN)
 
         self.is_connected = True
+
+    def recv_pyobj(self):
+        """Receives a pickled object e.g. from a master frontend process or None on poll timeout."""
+
+        events = dict(self.poller.poll(self.timeout))
+
+        if events.get(self.socket) == zmq.POLLIN:
+            return self.socket.recv_pyobj()
+
+        return None
+
+    def send_pyobj(self, obj) -> None:
+        self.socket.send_pyobj(obj)
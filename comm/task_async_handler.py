@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+#
+# -*- coding: utf-8 -*-
+#
+# © Copyright 2023 GSI Helmholtzzentrum für Schwerionenforschung
+#
+# This software is distributed under
+# the terms of the GNU General Public Licence version 3 (GPL Version 3),
+# copied verbatim in the file "LICENCE".
+
+import zmq
+import zmq.asyncio
+
+from comm.base_handler import BaseHandler
+
+class TaskAsyncCommHandler(BaseHandler):
+    """Communication handler of tasks executed asynchronously based on zmq.asyncio.
+
+    The handlers of a process share a single context, which is not terminated on disconnect,
+    so closing a socket does not block the event loop, while its pending messages are still sent
+    within the timeout by the I/O thread of the context.
+    """
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.disconnect()
+
+    def connect(self) -> None:
+
+        self.context = zmq.asyncio.Context.instance()
+
+        self.socket = self.context.socket(zmq.PUSH)
+        self.socket.setsockopt(zmq.LINGER, self.timeout)
+        self.socket.SNDTIMEO = self.timeout
+        self.socket.connect(self.endpoint)
+
+        self.is_connected = True
+
+    def disconnect(self) -> None:
+
+        if self.is_connected:
+
+            self.socket.close(linger=self.timeout)
+
+            self.is_connected = False
+
+    def recv_string(self):
+        raise RuntimeError('Operation not supported')
+
+    async def send_string(self, message: str) -> None:
+        await self.socket.send_string(message)
@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+#
+# -*- coding: utf-8 -*-
+#
+# © Copyright 2023 GSI Helmholtzzentrum für Schwerionenforschung
+#
+# This software is distributed under
+# the terms of the GNU General Public Licence version 3 (GPL Version 3),
+# copied verbatim in the file "LICENCE".
+
+import zmq
+
+from comm.base_handler import BaseHandler
+
+class TaskGeneratorCommHandler(BaseHandler):
+    """Communication handler of a remote task generator connecting to the generator feed of the master (DEALER socket)."""
+
+    def __init__(self, target: str, port: int, timeout: int, name: str) -> None:
+
+        super().__init__(target, port, timeout)
+
+        if not name:
+            raise RuntimeError('No name set for task generator!')
+
+        self.name = name
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.disconnect()
+
+    def connect(self):
+
+        self.context = zmq.Context()
+
+        if not self.context:
+            raise RuntimeError('Failed to create ZMQ context!')
+
+        self.socket = self.context.socket(zmq.DEALER)
+
+        if not self.socket:
+            raise RuntimeError('Failed to create ZMQ socket!')
+
+        # The name is used as routing identity by the master.
+        self.socket.setsockopt(zmq.ROUTING_ID, self.name.encode())
+        self.socket.connect(self.endpoint)
+
+        self.poller = zmq.Poller()
+        self.poller.register(self.socket, zmq.POLLIN)
+
+        self.is_connected = True
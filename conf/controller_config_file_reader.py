@@ -12,6 +12,7 @@ import configparser
 import os
 
 from conf.config_value_error import ConfigValueError
+from executor.executor_factory import ExecutorFactory
 
 class ControllerConfigFileReader:
 
@@ -26,18 +27,92 @@ class ControllerConfigFileReader:
         self.pid_file = config.get('control', 'pid_file')
         self.request_retry_wait_duration = config.getint('control', 'request_retry_wait_duration')
         self.max_num_request_retries = config.getint('control', 'max_num_request_retries')
+        self.heartbeat_interval = config.getint('control', 'heartbeat_interval', fallback=10)
 
         self.comm_target = config.get('comm', 'target')
         self.comm_port = config.getint('comm', 'port')
         self.poll_timeout = config.getint('comm', 'poll_timeout') * 1000
+        self.broadcast_port = config.getint('comm', 'broadcast_port', fallback=0)
+        self.heartbeat_port = config.getint('comm', 'heartbeat_port', fallback=0)
 
         self.log_filename = config.get('log', 'filename')
 
         self.worker_count = config.getint('processing', 'worker_count')
+        self.executor = config.get('processing', 'executor', fallback=ExecutorFactory.EXECUTOR_PROCESS)
+        self.prefetch_depth = config.getint('processing', 'prefetch_depth', fallback=0)
+        self.prefetch_timeout = config.getfloat('processing', 'prefetch_timeout', fallback=300)
+        self.finish_batch_size = config.getint('processing', 'finish_batch_size', fallback=50)
+        self.finish_batch_window = config.getfloat('processing', 'finish_batch_window', fallback=0.1)
+
+        # Autoscaling is enabled by a min worker count below the worker count.
+        self.worker_count_min = config.getint('processing', 'worker_count_min', fallback=self.worker_count)
+        self.autoscale_max_load = config.getfloat('processing', 'autoscale_max_load', fallback=1.0)
+        self.autoscale_min_mem_available = \
+            config.getfloat('processing', 'autoscale_min_mem_available', fallback=0.1)
+        self.autoscale_idle_timeout = config.getfloat('processing', 'autoscale_idle_timeout', fallback=60)
+        self.autoscale_interval = config.getfloat('processing', 'autoscale_interval', fallback=5)
+
+        self.worker_respawn = config.getboolean('processing', 'worker_respawn', fallback=True)
+        self.worker_respawn_backoff = config.getfloat('processing', 'worker_respawn_backoff', fallback=1)
+        self.worker_respawn_backoff_max = config.getfloat('processing', 'worker_respawn_backoff_max', fallback=300)
+        self.worker_max_tasks = config.getint('processing', 'worker_max_tasks', fallback=0)
+        # Max RSS of a worker is specified in MiB.
+        self.worker_max_rss = config.getint('processing', 'worker_max_rss', fallback=0)
 
         self.validate()
 
     def validate(self):
 
+        if self.heartbeat_port and self.heartbeat_interval < 1:
+            raise ConfigValueError(f"Not supported heartbeat interval detected: {self.heartbeat_interval}")
+
         if self.worker_count < 1 or self.worker_count > 1000:
             raise ConfigValueError(f"Not supported worker count detected: {self.worker_count}")
+
+        if self.executor not in ExecutorFactory.EXECUTORS:
+            raise ConfigValueError(f"Not supported executor detected: {self.executor}")
+
+        if self.prefetch_depth < 0 or self.prefetch_depth > 1000:
+            raise ConfigValueError(f"Not supported prefetch depth detected: {self.prefetch_depth}")
+
+        if self.prefetch_timeout < 0:
+            raise ConfigValueError(f"Not supported prefetch timeout detected: {self.prefetch_timeout}")
+
+        if self.finish_batch_size < 1 or self.finish_batch_size > 1000:
+            raise ConfigValueError(f"Not supported finish batch size detected: {self.finish_batch_size}")
+
+        if self.finish_batch_window < 0:
+            raise ConfigValueError(f"Not supported finish batch window detected: {self.finish_batch_window}")
+
+        if self.worker_count_min < 1 or self.worker_count_min > self.worker_count:
+            raise ConfigValueError(f"Not supported min worker count detected: {self.worker_count_min}")
+
+        if self.autoscale and self.executor not in ExecutorFactory.SCALABLE_EXECUTORS:
+            raise ConfigValueError(f"Autoscaling not supported by executor: {self.executor}")
+
+        if self.autoscale_max_load <= 0:
+            raise ConfigValueError(f"Not supported autoscale max load detected: {self.autoscale_max_load}")
+
+        if self.autoscale_min_mem_available < 0 or self.autoscale_min_mem_available >= 1:
+            raise ConfigValueError(f"Not supported autoscale min available memory detected: "
+                                   f"{self.autoscale_min_mem_available}")
+
+        if self.autoscale_idle_timeout < 0:
+            raise ConfigValueError(f"Not supported autoscale idle timeout detected: {self.autoscale_idle_timeout}")
+
+        if self.autoscale_interval <= 0:
+            raise ConfigValueError(f"Not supported autoscale interval detected: {self.autoscale_interval}")
+
+        if self.worker_respawn_backoff < 0 or self.worker_respawn_backoff_max < self.worker_respawn_backoff:
+            raise ConfigValueError(f"Not supported worker respawn backoff detected: "
+                                   f"{self.worker_respawn_backoff} - {self.worker_respawn_backoff_max}")
+
+        if self.worker_max_tasks < 0:
+            raise ConfigValueError(f"Not supported worker max tasks detected: {self.worker_max_tasks}")
+
+        if self.worker_max_rss < 0:
+            raise ConfigValueError(f"Not supported worker max RSS detected: {self.worker_max_rss}")
+
+    @property
+    def autoscale(self):
+        return self.worker_count_min < self.worker_count
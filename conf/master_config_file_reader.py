@@ -11,8 +11,20 @@
 import configparser
 import os
 
+from conf.config_value_error import ConfigValueError
+from scheduler.scheduler_factory import SchedulerFactory
+
 class MasterConfigFileReader:
 
+    ENGINE_SYNC    = 'sync'
+    ENGINE_ASYNCIO = 'asyncio'
+
+    CONTROLLER_GROUP_SECTION_PREFIX = 'controller_group.'
+    CLASS_MAX_IN_FLIGHT_PREFIX = 'max_in_flight.'
+
+    SCHEDULER_WINDOW = 1000
+    SCHEDULER_SHARE_PREFIX = 'share.'
+
     def __init__(self, config_file):
 
         if not os.path.isfile(config_file):
@@ -26,13 +38,189 @@ class MasterConfigFileReader:
         self.controller_timeout = config.getfloat('control', 'controller_timeout')
         self.controller_wait_duration = config.getint('control', 'controller_wait_duration')
         self.task_resend_timeout = config.getint('control', 'task_resend_timeout')
+        self.engine = config.get('control', 'engine', fallback=MasterConfigFileReader.ENGINE_SYNC)
+        self.deadline_order_window = config.getint('control', 'deadline_order_window', fallback=0)
+        self.task_templates = config.getboolean('control', 'task_templates', fallback=False)
+
+        # A deadline order window without scheduling policy selects the deadline policy with that window.
+        if self.deadline_order_window:
+            default_policy, default_window = SchedulerFactory.POLICY_DEADLINE, self.deadline_order_window
+        else:
+            default_policy, default_window = SchedulerFactory.POLICY_FIFO, MasterConfigFileReader.SCHEDULER_WINDOW
+
+        self.scheduler_policy = config.get('scheduler', 'policy', fallback=default_policy)
+        self.scheduler_window = config.getint('scheduler', 'window', fallback=default_window)
+        self.scheduler_half_life = config.getfloat('scheduler', 'half_life', fallback=3600)
+        self.scheduler_sticky_wait = config.getfloat('scheduler', 'sticky_wait', fallback=2)
+        self.scheduler_shares = dict[str, float]()
+
+        if config.has_section('scheduler'):
+
+            for option in config.options('scheduler'):
+
+                if option.startswith(MasterConfigFileReader.SCHEDULER_SHARE_PREFIX):
+
+                    task_source_name = option[len(MasterConfigFileReader.SCHEDULER_SHARE_PREFIX):]
+                    self.scheduler_shares[task_source_name] = config.getfloat('scheduler', option)
 
         self.comm_target = config.get('comm', 'target')
         self.comm_port = config.getint('comm', 'port')
         self.poll_timeout = config.getint('comm', 'poll_timeout') * 1000
 
+        self.frontend_processes = config.getint('frontend', 'processes', fallback=0)
+        self.frontend_backend_port = config.getint('frontend', 'backend_port', fallback=0)
+        self.frontend_core_port = config.getint('frontend', 'core_port', fallback=0)
+
         self.log_filename = config.get('log', 'filename')
 
-        self.task_gen_module = config.get('task_generator', 'module')
-        self.task_gen_class = config.get('task_generator', 'class')
-        self.task_gen_config_file = config.get('task_generator', 'config_file')
+        if config.has_section('task_generator'):
+
+            self.task_gen_module = config.get('task_generator', 'module')
+            self.task_gen_class = config.get('task_generator', 'class')
+            self.task_gen_config_file = config.get('task_generator', 'config_file')
+
+        else:
+
+            self.task_gen_module = None
+            self.task_gen_class = None
+            self.task_gen_config_file = None
+
+        self.generator_feed_target = config.get('generator_feed', 'target', fallback='*')
+        self.generator_feed_port = config.getint('generator_feed', 'port', fallback=0)
+        self.generator_feed_credit = config.getint('generator_feed', 'credit', fallback=100)
+        self.generator_feed_timeout = config.getfloat('generator_feed', 'timeout', fallback=60)
+
+        self.broadcast_target = config.get('broadcast', 'target', fallback='*')
+        self.broadcast_port = config.getint('broadcast', 'port', fallback=0)
+        self.broadcast_interval = config.getfloat('broadcast', 'interval', fallback=10)
+        self.broadcast_command_file = config.get('broadcast', 'command_file', fallback='')
+
+        self.heartbeat_target = config.get('heartbeat', 'target', fallback='*')
+        self.heartbeat_port = config.getint('heartbeat', 'port', fallback=0)
+        self.heartbeat_timeout = config.getfloat('heartbeat', 'timeout', fallback=60)
+
+        self.task_limits_file = config.get('task_limits', 'config_file', fallback='')
+
+        self.controller_health = config.getboolean('controller_health', 'enabled', fallback=False)
+        self.controller_health_window = config.getint('controller_health', 'window', fallback=50)
+        self.controller_health_min_samples = config.getint('controller_health', 'min_samples', fallback=10)
+        self.controller_health_slow_factor = config.getfloat('controller_health', 'slow_factor', fallback=3.0)
+        self.controller_health_failure_margin = config.getfloat('controller_health', 'failure_margin', fallback=0.25)
+        self.controller_health_quarantine = config.getfloat('controller_health', 'quarantine', fallback=600)
+        self.controller_health_probation = config.getfloat('controller_health', 'probation', fallback=1800)
+        self.controller_health_max_fraction = config.getfloat('controller_health', 'max_fraction', fallback=0.25)
+
+        # Controller groups are kept in order of the config file as tuples of:
+        # name, host patterns, max tasks in flight and max tasks in flight by lower-case task class name.
+        self.controller_groups = []
+
+        for section in config.sections():
+
+            if not section.startswith(MasterConfigFileReader.CONTROLLER_GROUP_SECTION_PREFIX):
+                continue
+
+            name = section[len(MasterConfigFileReader.CONTROLLER_GROUP_SECTION_PREFIX):]
+            host_patterns = config.get(section, 'hosts').replace(',', ' ').split()
+            max_in_flight = config.getint(section, 'max_in_flight', fallback=0)
+
+            class_max_in_flight = {}
+
+            for option in config.options(section):
+
+                if option.startswith(MasterConfigFileReader.CLASS_MAX_IN_FLIGHT_PREFIX):
+                    class_max_in_flight[option[len(MasterConfigFileReader.CLASS_MAX_IN_FLIGHT_PREFIX):]] = \
+                        config.getint(section, option)
+
+            self.controller_groups.append((name, host_patterns, max_in_flight, class_max_in_flight))
+
+        self.validate()
+
+    def validate(self):
+
+        if self.engine not in (MasterConfigFileReader.ENGINE_SYNC, MasterConfigFileReader.ENGINE_ASYNCIO):
+            raise ConfigValueError(f"Not supported master engine detected: {self.engine}")
+
+        if self.deadline_order_window < 0:
+            raise ConfigValueError(f"Not supported deadline order window detected: {self.deadline_order_window}")
+
+        if self.scheduler_policy not in SchedulerFactory.POLICIES:
+            raise ConfigValueError(f"Not supported scheduling policy detected: {self.scheduler_policy}")
+
+        if self.scheduler_window < 1:
+            raise ConfigValueError(f"Not supported scheduler window detected: {self.scheduler_window}")
+
+        if self.scheduler_sticky_wait < 0:
+            raise ConfigValueError(f"Not supported scheduler sticky wait detected: {self.scheduler_sticky_wait}")
+
+        if self.scheduler_half_life <= 0:
+            raise ConfigValueError(f"Not supported scheduler half-life detected: {self.scheduler_half_life}")
+
+        for task_source_name, share in self.scheduler_shares.items():
+
+            if share <= 0:
+                raise ConfigValueError(f"Not supported share for task source detected: {task_source_name}")
+
+        if not self.task_gen_module and not self.generator_feed_port:
+            raise ConfigValueError('Neither a task generator nor a generator feed is configured')
+
+        if self.task_limits_file and not os.path.isfile(self.task_limits_file):
+            raise ConfigValueError(f"The task limits file does not exist or is not a file: {self.task_limits_file}")
+
+        for name, host_patterns, max_in_flight, class_max_in_flight in self.controller_groups:
+
+            if not name or not host_patterns:
+                raise ConfigValueError(f"Controller group requires a name and hosts: {name}")
+
+            if max_in_flight < 0 or any(value < 0 for value in class_max_in_flight.values()):
+                raise ConfigValueError(f"Not supported max_in_flight for controller group detected: {name}")
+
+        if self.controller_health:
+
+            if self.controller_health_window < 1 \
+                    or not 1 <= self.controller_health_min_samples <= self.controller_health_window:
+                raise ConfigValueError('Not supported controller health window or min_samples detected')
+
+            if self.controller_health_slow_factor <= 1 or self.controller_health_failure_margin <= 0:
+                raise ConfigValueError('Not supported controller health slow_factor or failure_margin detected')
+
+            if self.controller_health_quarantine <= 0 or self.controller_health_probation < 0:
+                raise ConfigValueError('Not supported controller health quarantine or probation detected')
+
+            if not 0 < self.controller_health_max_fraction <= 1:
+                raise ConfigValueError(f"Not supported controller health max_fraction detected: "
+                                       f"{self.controller_health_max_fraction}")
+
+        if self.frontend_processes < 0:
+            raise ConfigValueError(f"Not supported number of frontend processes detected: {self.frontend_processes}")
+
+        if self.frontend_processes:
+
+            frontend_ports = {self.comm_port, self.frontend_backend_port, self.frontend_core_port}
+
+            if not self.frontend_backend_port or not self.frontend_core_port or len(frontend_ports) != 3:
+                raise ConfigValueError('Frontend requires a backend_port and core_port different from the comm port')
+
+        if self.broadcast_port and self.broadcast_interval <= 0:
+            raise ConfigValueError(f"Not supported broadcast interval detected: {self.broadcast_interval}")
+
+        if self.heartbeat_port and self.heartbeat_timeout <= 0:
+            raise ConfigValueError(f"Not supported heartbeat timeout detected: {self.heartbeat_timeout}")
+
+        if self.generator_feed_port and self.generator_feed_credit < 1:
+            raise ConfigValueError(f"Not supported generator feed credit detected: {self.generator_feed_credit}")
+
+    @property
+    def frontend_enabled(self):
+        return bool(self.frontend_processes)
+
+    @property
+    def broadcast_enabled(self):
+        return bool(self.broadcast_port)
+
+    @property
+    def heartbeat_enabled(self):
+        return bool(self.heartbeat_port)
+
+    @property
+    def generator_feed_enabled(self):
+        return bool(self.generator_feed_port)
@@ -0,0 +1,45 @@
+#!/usr/bin/env python3
+#
+# -*- coding: utf-8 -*-
+#
+# © Copyright 2023 GSI Helmholtzzentrum für Schwerionenforschung
+#
+# This software is distributed under
+# the terms of the GNU General Public Licence version 3 (GPL Version 3),
+# copied verbatim in the file "LICENCE".
+
+import configparser
+import os
+
+from conf.config_value_error import ConfigValueError
+
+class TaskGeneratorConfigFileReader:
+
+    def __init__(self, config_file):
+
+        if not os.path.isfile(config_file):
+            raise IOError(f"The config file does not exist or is not a file: {config_file}")
+
+        config = configparser.ConfigParser()
+        config.read(config_file)
+
+        self.pid_file = config.get('control', 'pid_file')
+        self.heartbeat_interval = config.getint('control', 'heartbeat_interval')
+
+        self.comm_target = config.get('comm', 'target')
+        self.comm_port = config.getint('comm', 'port')
+        self.poll_timeout = config.getint('comm', 'poll_timeout') * 1000
+        self.comm_name = config.get('comm', 'name', fallback='')
+
+        self.log_filename = config.get('log', 'filename')
+
+        self.task_gen_module = config.get('task_generator', 'module')
+        self.task_gen_class = config.get('task_generator', 'class')
+        self.task_gen_config_file = config.get('task_generator', 'config_file')
+
+        self.validate()
+
+    def validate(self):
+
+        if self.heartbeat_interval < 1:
+            raise ConfigValueError(f"Not supported heartbeat interval detected: {self.heartbeat_interval}")
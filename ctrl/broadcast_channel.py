@@ -0,0 +1,190 @@
+#!/usr/bin/env python3
+#
+# -*- coding: utf-8 -*-
+#
+# © Copyright 2023 GSI Helmholtzzentrum für Schwerionenforschung
+#
+# This software is distributed under
+# the terms of the GNU General Public Licence version 3 (GPL Version 3),
+# copied verbatim in the file "LICENCE".
+
+"""Module for additional control components"""
+
+import logging
+import os
+import time
+
+from comm.broadcast_handler import BroadcastCommHandler
+from msg.control_command import ControlCommand
+
+class BroadcastChannel:
+    """Channel of the master for broadcasting control commands to all or single controllers.
+
+    Commands are sent by the master itself e.g. EXIT on shutdown,
+    or by an operator writing commands into the command file, one per line:
+
+        <exit|drain|pause|resume> [<controller FQDN>]
+        epoch
+        cancel <TID>
+
+    Without a controller FQDN the command is sent to all controllers.
+    The epoch command increments the configuration epoch, so the controllers reload their config file.
+    The cancel command is passed to the master, that knows the controller running the task if it is dispatched.
+    The command file is removed after it has been processed.
+
+    Since controllers connected later miss earlier messages, the configuration epoch, the exit
+    and the pause or drain of all or single controllers are repeated on each interval.
+    A resume stops repeating the pause or drain of the controller and a resume of all controllers
+    stops repeating any pause, while a drain is kept, since drained controllers do not resume anyway.
+    """
+
+    COMMAND_FILE_CHECK_INTERVAL = 1
+
+    def __init__(self, target: str, port: int, interval: float, command_file: str) -> None:
+
+        if interval <= 0:
+            raise RuntimeError(f"Invalid interval for broadcast channel: {interval}")
+
+        self._comm_handler = BroadcastCommHandler(target, port, 0)
+        self._interval = interval
+        self._command_file = command_file
+
+        self._next_repeat_timestamp = 0
+        self._next_command_file_check = 0
+
+        # Pause or drain command repeated by its target, that is either all or a single controller.
+        self._state_command_dict = dict[str, str]()
+        self._exit = False
+
+        self.epoch = int(time.time())
+
+        self._cancel_tid_list = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.disconnect()
+
+    def connect(self) -> None:
+        self._comm_handler.connect()
+
+    def disconnect(self) -> None:
+        self._comm_handler.disconnect()
+
+    def send(self, command: str, target: str = BroadcastCommHandler.TOPIC_ALL, value: str = '') -> None:
+
+        logging.debug("Broadcasting control command %s to: %s", command, target)
+
+        self._comm_handler.send_message(target, ControlCommand(command, value).to_string())
+
+    def pop_cancel_tids(self) -> list[str]:
+        """Returns the TIDs of the tasks to cancel read from the command file since the last call."""
+
+        cancel_tid_list = self._cancel_tid_list
+        self._cancel_tid_list = []
+
+        return cancel_tid_list
+
+    def check(self, task_distribution: bool) -> None:
+        """Broadcasts pending commands, called periodically by the master loop."""
+
+        now = time.time()
+
+        if not task_distribution and not self._exit:
+
+            logging.info('Broadcasting exit to all controllers')
+
+            self._exit = True
+            self._next_repeat_timestamp = 0
+
+        if now >= self._next_repeat_timestamp:
+
+            self._next_repeat_timestamp = now + self._interval
+
+            if self._exit:
+                self.send(ControlCommand.EXIT)
+            else:
+                for target, command in self._state_command_dict.items():
+                    self.send(command, target)
+
+            self.send(ControlCommand.EPOCH, value=str(self.epoch))
+
+        # Processed after the repetition, so a new command is not sent twice.
+        if self._command_file and now >= self._next_command_file_check:
+
+            self._next_command_file_check = now + BroadcastChannel.COMMAND_FILE_CHECK_INTERVAL
+
+            if os.path.isfile(self._command_file):
+                self._process_command_file()
+
+    def _process_command_file(self) -> None:
+
+        try:
+
+            with open(self._command_file, 'r', encoding='UTF-8') as command_file:
+                lines = command_file.readlines()
+
+            os.remove(self._command_file)
+
+        except Exception:
+
+            logging.exception("Failed to read command file: %s", self._command_file)
+            return
+
+        for line in lines:
+
+            items = line.split()
+
+            if not items or items[0].startswith('#'):
+                continue
+
+            command = items[0].upper()
+            target = BroadcastCommHandler.TOPIC_ALL
+
+            if len(items) > 1:
+                target = items[1]
+
+            if command == ControlCommand.EPOCH:
+
+                self.epoch += 1
+                logging.info("Broadcasting configuration epoch: %i", self.epoch)
+                self.send(ControlCommand.EPOCH, value=str(self.epoch))
+
+            elif command == ControlCommand.CANCEL:
+
+                if len(items) > 1:
+                    self._cancel_tid_list.append(items[1])
+                else:
+                    logging.error("No TID found for cancel command in command file: %s", line.strip())
+
+            elif command in ControlCommand.COMMANDS:
+
+                self._set_state(command, target)
+
+                logging.info("Broadcasting control command %s to: %s", command, target)
+                self.send(command, target)
+
+            else:
+                logging.error("Not supported command found in command file: %s", line.strip())
+
+    def _set_state(self, command: str, target: str) -> None:
+        """Keeps the pause or drain command of the target to repeat it or forgets about it on resume."""
+
+        if command == ControlCommand.DRAIN:
+            self._state_command_dict[target] = command
+
+        elif command == ControlCommand.PAUSE:
+
+            # A drained controller does not request tasks anymore anyway.
+            if self._state_command_dict.get(target) != ControlCommand.DRAIN:
+                self._state_command_dict[target] = command
+
+        elif command == ControlCommand.RESUME:
+
+            if target != BroadcastCommHandler.TOPIC_ALL:
+                self._state_command_dict.pop(target, None)
+            else:
+                self._state_command_dict = {state_target: state_command
+                                            for state_target, state_command in self._state_command_dict.items()
+                                            if state_command == ControlCommand.DRAIN}
@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+#
+# -*- coding: utf-8 -*-
+#
+# © Copyright 2023 GSI Helmholtzzentrum für Schwerionenforschung
+#
+# This software is distributed under
+# the terms of the GNU General Public Licence version 3 (GPL Version 3),
+# copied verbatim in the file "LICENCE".
+
+"""Module for additional control components"""
+
+import fnmatch
+
+from task.base_task import BaseTask
+
+class ControllerGroup:
+    """Group of controllers matched by FQDN patterns with caps on the number of tasks in flight.
+
+    A cap of 0 means unlimited. Caps per task class are keyed by the lower-case class name.
+    """
+
+    def __init__(self, name: str, host_patterns: list[str], max_in_flight: int, class_max_in_flight: dict) -> None:
+
+        if not name:
+            raise RuntimeError('No name set for controller group!')
+
+        if not host_patterns:
+            raise RuntimeError(f"No hosts set for controller group: {name}")
+
+        self.name = name
+        self.host_patterns = host_patterns
+        self.max_in_flight = max_in_flight
+        self.class_max_in_flight = class_max_in_flight
+
+    def match(self, controller: str) -> bool:
+
+        for host_pattern in self.host_patterns:
+
+            if fnmatch.fnmatch(controller, host_pattern):
+                return True
+
+        return False
+
+class ControllerGroupQuota:
+    """Tracks the tasks in flight per controller group and caps them by the limits of the group.
+
+    A controller belongs to the first group matching its FQDN.
+    Controllers not matching any group are not capped.
+    """
+
+    def __init__(self, controller_groups: list[ControllerGroup]) -> None:
+
+        self._controller_groups = controller_groups
+
+        self._controller_group_dict = dict[str, ControllerGroup]()
+        self._in_flight_dict = dict[tuple, int]()
+        self._tid_key_dict = dict[str, tuple]()
+
+    def group(self, controller: str) -> ControllerGroup:
+
+        if controller in self._controller_group_dict:
+            return self._controller_group_dict[controller]
+
+        controller_group = None
+
+        for candidate in self._controller_groups:
+
+            if candidate.match(controller):
+
+                controller_group = candidate
+                break
+
+        self._controller_group_dict[controller] = controller_group
+
+        return controller_group
+
+    def is_capped(self, controller: str) -> bool:
+        """Checks if the group of the controller has reached its cap on all tasks in flight."""
+
+        controller_group = self.group(controller)
+
+        return bool(controller_group
+                    and controller_group.max_in_flight
+                    and self._in_flight_dict.get((controller_group.name, None), 0) >= controller_group.max_in_flight)
+
+    def limited_key(self, controller: str, task: BaseTask) -> str:
+        """Returns the key of the cap not passed by the task on the controller, otherwise None."""
+
+        controller_group = self.group(controller)
+
+        if not controller_group or task.tid in self._tid_key_dict:
+            return None
+
+        if self.is_capped(controller):
+            return controller_group.name
+
+        task_class = task.class_name.lower()
+        class_max_in_flight = controller_group.class_max_in_flight.get(task_class, 0)
+
+        if class_max_in_flight \
+                and self._in_flight_dict.get((controller_group.name, task_class), 0) >= class_max_in_flight:
+            return f"{controller_group.name}:{task.class_name}"
+
+        return None
+
+    def acquire(self, controller: str, task: BaseTask) -> None:
+
+        controller_group = self.group(controller)
+
+        if not controller_group or task.tid in self._tid_key_dict:
+            return
+
+        keys = ((controller_group.name, None), (controller_group.name, task.class_name.lower()))
+
+        for key in keys:
+            self._in_flight_dict[key] = self._in_flight_dict.get(key, 0) + 1
+
+        self._tid_key_dict[task.tid] = keys
+
+    def release(self, tid: str) -> None:
+
+        keys = self._tid_key_dict.pop(tid, None)
+
+        if not keys:
+            return
+
+        for key in keys:
+
+            count = self._in_flight_dict[key] - 1
+
+            if count:
+                self._in_flight_dict[key] = count
+            else:
+                del self._in_flight_dict[key]
+
+    def in_flight(self, group_name: str, task_class: str = None) -> int:
+
+        if task_class:
+            task_class = task_class.lower()
+
+        return self._in_flight_dict.get((group_name, task_class), 0)
@@ -0,0 +1,219 @@
+#!/usr/bin/env python3
+#
+# -*- coding: utf-8 -*-
+#
+# © Copyright 2023 GSI Helmholtzzentrum für Schwerionenforschung
+#
+# This software is distributed under
+# the terms of the GNU General Public Licence version 3 (GPL Version 3),
+# copied verbatim in the file "LICENCE".
+
+"""Module for additional control components"""
+
+import logging
+import statistics
+import time
+
+from collections import deque
+
+from task.base_task import BaseTask
+
+class ControllerState:
+
+    HEALTHY     = 'healthy'
+    QUARANTINED = 'quarantined'
+    PROBATION   = 'probation'
+
+class ControllerHealth:
+    """Detects slow or failing controllers by rolling statistics per controller and task class.
+
+    The duration of a task is measured from dispatch until finish by the master.
+    Per controller and task class the last window of durations and failures is kept.
+    A controller is an outlier for a task class, if its median duration exceeds the median of its peers
+    by the slow factor or its failure rate exceeds the failure rate of its peers by the failure margin.
+    Controllers and their peers need a minimum number of samples to be compared.
+
+    An outlier is quarantined, so it does not get any tasks until the quarantine has passed.
+    Afterwards it is re-admitted on probation with fresh statistics,
+    and becomes healthy again, if it is not found to be an outlier until the probation has passed.
+    At most the max fraction of the known controllers is quarantined at the same time.
+    """
+
+    CHECK_INTERVAL = 10
+
+    # Median duration in seconds below which a controller is not considered slow.
+    MIN_SLOW_DURATION = 1.0
+
+    def __init__(self,
+                 window: int = 50,
+                 min_samples: int = 10,
+                 slow_factor: float = 3.0,
+                 failure_margin: float = 0.25,
+                 quarantine: float = 600,
+                 probation: float = 1800,
+                 max_fraction: float = 0.25) -> None:
+
+        if window < 1 or min_samples < 1 or min_samples > window:
+            raise RuntimeError(f"Invalid window or min samples for controller health: {window} - {min_samples}")
+
+        if slow_factor <= 1 or failure_margin <= 0:
+            raise RuntimeError(f"Invalid slow factor or failure margin for controller health: "
+                               f"{slow_factor} - {failure_margin}")
+
+        self._window = window
+        self._min_samples = min_samples
+        self._slow_factor = slow_factor
+        self._failure_margin = failure_margin
+        self._quarantine = quarantine
+        self._probation = probation
+        self._max_fraction = max_fraction
+
+        # Samples of durations and failures kept per controller and task class.
+        self._sample_dict = dict[tuple[str, str], deque]()
+        self._tid_dict = dict[str, tuple[str, str, float]]()
+
+        # State of a controller not healthy and the timestamp the state ends.
+        self._state_dict = dict[str, tuple[str, float]]()
+
+        self._next_check_timestamp = 0
+        self.quarantined_count = 0
+
+    def on_dispatch(self, controller: str, task: BaseTask) -> None:
+        self._tid_dict[task.tid] = (controller, task.__class__.__name__, time.time())
+
+    def on_finish(self, controller: str, tid: str, failed: bool) -> None:
+
+        item = self._tid_dict.pop(tid, None)
+
+        if not item or item[0] != controller:
+            return
+
+        _, task_class, dispatch_timestamp = item
+
+        key = (controller, task_class)
+
+        if key not in self._sample_dict:
+            self._sample_dict[key] = deque(maxlen=self._window)
+
+        self._sample_dict[key].append((time.time() - dispatch_timestamp, failed))
+
+    def discard(self, tid: str) -> None:
+        self._tid_dict.pop(tid, None)
+
+    def forget(self, controller: str) -> None:
+
+        for key in [key for key in self._sample_dict if key[0] == controller]:
+            del self._sample_dict[key]
+
+        for tid in [tid for tid, item in self._tid_dict.items() if item[0] == controller]:
+            del self._tid_dict[tid]
+
+        self._state_dict.pop(controller, None)
+
+    def is_quarantined(self, controller: str) -> bool:
+
+        state = self._state_dict.get(controller)
+
+        return bool(state) and state[0] == ControllerState.QUARANTINED
+
+    def state(self, controller: str) -> str:
+
+        state = self._state_dict.get(controller)
+
+        if not state:
+            return ControllerState.HEALTHY
+
+        return state[0]
+
+    def states(self) -> dict[str, str]:
+        """Returns the states of the controllers not healthy."""
+        return {controller: state[0] for controller, state in self._state_dict.items()}
+
+    def check(self, timestamp: float) -> None:
+        """Updates the states of the controllers, called periodically by the master loop."""
+
+        if timestamp < self._next_check_timestamp:
+            return
+
+        self._next_check_timestamp = timestamp + ControllerHealth.CHECK_INTERVAL
+
+        for controller, (state, end_timestamp) in list(self._state_dict.items()):
+
+            if timestamp < end_timestamp:
+                continue
+
+            if state == ControllerState.QUARANTINED:
+
+                logging.info("Re-admitting controller on probation: %s", controller)
+                self._state_dict[controller] = (ControllerState.PROBATION, timestamp + self._probation)
+
+            else:
+
+                logging.info("Controller passed probation: %s", controller)
+                del self._state_dict[controller]
+
+        for controller, reason in self.outliers():
+
+            if self.is_quarantined(controller):
+                continue
+
+            quarantined_set = {name for name in self._state_dict if self.is_quarantined(name)}
+            controller_count = len({key[0] for key in self._sample_dict} | quarantined_set)
+
+            if len(quarantined_set) + 1 > self._max_fraction * controller_count:
+
+                logging.warning("Not quarantining outlier controller by max fraction (%s): %s", reason, controller)
+                continue
+
+            logging.warning("Quarantining outlier controller (%s): %s", reason, controller)
+
+            self._state_dict[controller] = (ControllerState.QUARANTINED, timestamp + self._quarantine)
+            self.quarantined_count += 1
+
+            # Samples from before the quarantine do not count for the probation.
+            for key in [key for key in self._sample_dict if key[0] == controller]:
+                del self._sample_dict[key]
+
+    def outliers(self) -> list[tuple[str, str]]:
+        """Returns the controllers being outliers compared with their peers together with the reason."""
+
+        # Median duration of the finished tasks and failure rate per task class and controller.
+        class_stats_dict = dict[str, dict[str, tuple[float, float]]]()
+
+        for (controller, task_class), samples in self._sample_dict.items():
+
+            if len(samples) < self._min_samples:
+                continue
+
+            failed_count = sum(1 for _, failed in samples if failed)
+            durations = [duration for duration, failed in samples if not failed]
+            median_duration = statistics.median(durations) if durations else None
+
+            class_stats_dict.setdefault(task_class, {})[controller] = (median_duration, failed_count / len(samples))
+
+        outlier_list = []
+
+        for task_class, stats_dict in class_stats_dict.items():
+
+            # At least two peers are required, so a single slow peer does not make a controller an outlier.
+            if len(stats_dict) < 3:
+                continue
+
+            for controller, (median_duration, failure_rate) in stats_dict.items():
+
+                peer_durations = [stats[0] for peer, stats in stats_dict.items()
+                                  if peer != controller and stats[0] is not None]
+                peer_failure_rate = statistics.median(stats[1] for peer, stats in stats_dict.items()
+                                                      if peer != controller)
+
+                if failure_rate > peer_failure_rate + self._failure_margin:
+
+                    outlier_list.append((controller, f"{task_class} failure rate {failure_rate:.2f}"))
+                    continue
+
+                if median_duration is not None and peer_durations \
+                        and median_duration > ControllerHealth.MIN_SLOW_DURATION \
+                        and median_duration > self._slow_factor * statistics.median(peer_durations):
+                    outlier_list.append((controller, f"{task_class} median duration {median_duration:.2f}s"))
+
+        return outlier_list
@@ -0,0 +1,228 @@
+#!/usr/bin/env python3
+#
+# -*- coding: utf-8 -*-
+#
+# © Copyright 2023 GSI Helmholtzzentrum für Schwerionenforschung
+#
+# This software is distributed under
+# the terms of the GNU General Public Licence version 3 (GPL Version 3),
+# copied verbatim in the file "LICENCE".
+
+"""Module for additional control components"""
+
+import logging
+import time
+
+from comm.generator_feed_handler import GeneratorFeedCommHandler
+from ctrl.local_queue import LocalQueue
+from ctrl.task_source import TaskSource
+from msg.base_message import BaseMessage
+from msg.message_factory import MessageFactory
+from msg.message_type import MessageType
+from msg.task_credit import TaskCredit
+from msg.task_finished import TaskFinished
+
+class RemoteResultQueue:
+    """Result queue of a remote task generator sending the TIDs of finished tasks back over the generator feed."""
+
+    def __init__(self, generator_feed, remote_generator) -> None:
+
+        self._generator_feed = generator_feed
+        self._remote_generator = remote_generator
+
+    def push(self, tid: str) -> None:
+
+        self._remote_generator.tid_set.discard(tid)
+        self._generator_feed.send(self._remote_generator.name, TaskFinished(self._generator_feed.fqdn, tid))
+
+class RemoteTaskGenerator:
+
+    def __init__(self, generator_feed, name: str) -> None:
+
+        self.name = name
+        self.timestamp = int(time.time())
+        self.timed_out = False
+
+        # Credit is granted after the sent count of the remote task generator is known from its heartbeat.
+        self.synchronized = False
+
+        # Number of tasks received from the remote task generator and total number of tasks it is allowed to send.
+        self.received_count = 0
+        self.credit_limit = 0
+
+        # TIDs of the tasks received, which are not finished yet.
+        self.tid_set = set[str]()
+
+        self.task_source = TaskSource(name, LocalQueue(), RemoteResultQueue(generator_feed, self))
+
+class GeneratorFeed:
+    """Feed for task generators running outside of the master process e.g. on a different host.
+
+    The protocol is credit based:
+
+    1. A remote task generator announces itself by Heartbeat messages with its name as sender
+       and the total number of tasks it has sent so far.
+    2. The master grants credit by a TaskCredit message with the total number of tasks
+       the remote task generator is allowed to send, so tasks still in transit are accounted.
+    3. The remote task generator sends tasks as TaskAssign messages until it reaches that number.
+    4. The master sends a TaskFinished message for each finished task back to the remote task generator.
+
+    If the sent count of a heartbeat differs from the number of tasks received,
+    e.g. after restart of the remote task generator or the master, the credit is resynchronized.
+    Otherwise the current credit is sent again, since it might have been lost.
+
+    A remote task generator that timed out does not get further credit,
+    but it is kept until its tasks received are finished, so their results are still sent back.
+
+    Tasks not requested yet stay within the remote task generator,
+    so it can still reorganize them e.g. by clearing its task queue.
+    """
+
+    def __init__(self, target: str, port: int, credit: int, timeout: float) -> None:
+
+        if credit < 1:
+            raise RuntimeError(f"Invalid credit for generator feed: {credit}")
+
+        # Messages are processed non-blocking by the master loop, so no poll timeout is used.
+        self._comm_handler = GeneratorFeedCommHandler(target, port, 0)
+        self._credit = credit
+        self._timeout = timeout
+
+        self._remote_generator_dict = dict[str, RemoteTaskGenerator]()
+
+        self.fqdn = self._comm_handler.fqdn
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.disconnect()
+
+    def connect(self) -> None:
+        self._comm_handler.connect()
+
+    def disconnect(self) -> None:
+        self._comm_handler.disconnect()
+
+    @property
+    def task_sources(self) -> list[TaskSource]:
+        return [remote_generator.task_source for remote_generator in self._remote_generator_dict.values()]
+
+    def send(self, name: str, message: BaseMessage) -> None:
+
+        if name in self._remote_generator_dict:
+            self._comm_handler.send_message(name, message.to_string())
+        else:
+            logging.warning("Remote task generator not connected to send message: %s", name)
+
+    def process_events(self) -> None:
+        """Processes all pending messages from remote task generators (non-blocking)."""
+
+        while True:
+
+            name, recv_data = self._comm_handler.recv_message()
+
+            if not recv_data:
+                break
+
+            # Invalid messages are dropped, so a faulty remote task generator does not stop the master.
+            try:
+
+                recv_msg = MessageFactory.create(recv_data)
+                recv_msg_type = recv_msg.type()
+
+                if recv_msg_type == MessageType.TASK_ASSIGN():
+                    task = recv_msg.to_task()
+                elif recv_msg_type != MessageType.HEARTBEAT():
+                    raise RuntimeError(f"Undefined type found in message from generator feed: {recv_msg_type}")
+
+            except Exception:
+                logging.exception("Dropping invalid message from remote task generator %s: %s", name, recv_data)
+                continue
+
+            remote_generator = self._remote_generator_dict.get(name)
+
+            if not remote_generator:
+
+                logging.info("Remote task generator connected: %s", name)
+
+                remote_generator = RemoteTaskGenerator(self, name)
+                self._remote_generator_dict[name] = remote_generator
+
+            remote_generator.timestamp = int(time.time())
+
+            if remote_generator.timed_out:
+
+                logging.info("Remote task generator reconnected: %s", name)
+                remote_generator.timed_out = False
+
+            if recv_msg_type == MessageType.TASK_ASSIGN():
+
+                logging.debug("Received task from remote task generator %s: %s", name, task.tid)
+
+                remote_generator.task_source.task_queue.push(task)
+                remote_generator.received_count += 1
+                remote_generator.tid_set.add(task.tid)
+
+            else:
+
+                sent_count = recv_msg.sent_count
+
+                if sent_count is None:
+                    sent_count = remote_generator.received_count
+
+                # Resynchronize credit e.g. after restart of the remote task generator or the master.
+                if not remote_generator.synchronized or sent_count != remote_generator.received_count:
+
+                    if remote_generator.synchronized:
+                        logging.info("Resynchronizing credit of remote task generator %s - Sent: %i - Received: %i",
+                                     name, sent_count, remote_generator.received_count)
+
+                    remote_generator.received_count = sent_count
+                    remote_generator.credit_limit = sent_count
+                    remote_generator.synchronized = True
+
+                # The credit is absolute, so it is sent again in case it was lost e.g. by restart of the remote task generator.
+                elif remote_generator.credit_limit > remote_generator.received_count:
+                    self.send(name, TaskCredit(remote_generator.credit_limit))
+
+        self._grant_credit()
+        self._check_timeout()
+
+    def _grant_credit(self) -> None:
+
+        for remote_generator in self._remote_generator_dict.values():
+
+            if remote_generator.timed_out or not remote_generator.synchronized:
+                continue
+
+            len_buffer = len(remote_generator.task_source.task_queue)
+            len_transit = max(remote_generator.credit_limit - remote_generator.received_count, 0)
+
+            # Refill credit if less than half of the window is buffered or in transit.
+            if (len_transit + len_buffer) * 2 <= self._credit:
+
+                remote_generator.credit_limit = remote_generator.received_count + self._credit - len_buffer
+                self.send(remote_generator.name, TaskCredit(remote_generator.credit_limit))
+
+    def _check_timeout(self) -> None:
+
+        last_exec_timestamp = int(time.time())
+
+        for name in list(self._remote_generator_dict.keys()):
+
+            remote_generator = self._remote_generator_dict[name]
+
+            if not remote_generator.timed_out and last_exec_timestamp >= remote_generator.timestamp + self._timeout:
+
+                logging.warning("Remote task generator timed out: %s - Keeping unfinished tasks: %i",
+                                name, len(remote_generator.tid_set))
+
+                remote_generator.timed_out = True
+
+            # Buffered tasks are still dispatched and their results sent back, until all are finished.
+            if remote_generator.timed_out and not remote_generator.tid_set:
+
+                logging.info("Removed remote task generator: %s", name)
+
+                del self._remote_generator_dict[name]
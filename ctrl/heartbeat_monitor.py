@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+#
+# -*- coding: utf-8 -*-
+#
+# © Copyright 2023 GSI Helmholtzzentrum für Schwerionenforschung
+#
+# This software is distributed under
+# the terms of the GNU General Public Licence version 3 (GPL Version 3),
+# copied verbatim in the file "LICENCE".
+
+"""Module for additional control components"""
+
+import logging
+import threading
+import time
+
+from comm.heartbeat_handler import HeartbeatCommHandler
+from msg.message_factory import MessageFactory
+from msg.message_type import MessageType
+
+class HeartbeatMonitor(threading.Thread):
+    """Receives the heartbeats of the controllers on a dedicated channel in a separate thread of the master.
+
+    Heartbeats are not acknowledged, so neither the master loop nor the controllers are blocked by them.
+    The master loop just reads the time a controller was seen last.
+    """
+
+    POLL_TIMEOUT = 500
+
+    def __init__(self, target: str, port: int, timeout: float) -> None:
+
+        super().__init__(name='HeartbeatMonitor', daemon=True)
+
+        if timeout <= 0:
+            raise RuntimeError(f"Invalid timeout for heartbeat monitor: {timeout}")
+
+        self._target = target
+        self._port = port
+        self._timeout = timeout
+
+        self._lock = threading.Lock()
+        self._last_seen_dict = dict[str, float]()
+
+        self._run_flag = threading.Event()
+        self._run_flag.set()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stop()
+
+    def stop(self) -> None:
+
+        self._run_flag.clear()
+
+        if self.is_alive():
+            self.join()
+
+    def run(self) -> None:
+
+        # ZMQ sockets are not thread-safe, so the socket is owned by this thread.
+        with HeartbeatCommHandler(self._target, self._port, HeartbeatMonitor.POLL_TIMEOUT) as comm_handler:
+
+            comm_handler.connect()
+
+            while self._run_flag.is_set():
+
+                try:
+
+                    recv_data = comm_handler.recv_string()
+
+                    if not recv_data:
+                        continue
+
+                    recv_msg = MessageFactory.create(recv_data)
+
+                    if recv_msg.type() != MessageType.HEARTBEAT():
+                        raise RuntimeError(f"Undefined type found in message on heartbeat channel: {recv_data}")
+
+                    with self._lock:
+                        self._last_seen_dict[recv_msg.sender] = time.time()
+
+                except Exception:
+                    logging.exception('Caught exception in heartbeat monitor')
+
+    def last_seen(self, controller: str) -> float:
+        """Returns the timestamp of the last heartbeat of the controller, otherwise 0."""
+
+        with self._lock:
+            return self._last_seen_dict.get(controller, 0)
+
+    def forget(self, controller: str) -> None:
+        """Forgets about a controller that has quit properly."""
+
+        with self._lock:
+            self._last_seen_dict.pop(controller, None)
+
+    def pop_lost_controllers(self) -> list[str]:
+        """Returns the controllers not sending a heartbeat within the timeout and forgets about them."""
+
+        threshold = time.time() - self._timeout
+        lost_controllers = []
+
+        with self._lock:
+
+            for controller, last_seen in list(self._last_seen_dict.items()):
+
+                if last_seen < threshold:
+
+                    lost_controllers.append(controller)
+                    del self._last_seen_dict[controller]
+
+        return lost_controllers
@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+#
+# -*- coding: utf-8 -*-
+#
+# © Copyright 2023 GSI Helmholtzzentrum für Schwerionenforschung
+#
+# This software is distributed under
+# the terms of the GNU General Public Licence version 3 (GPL Version 3),
+# copied verbatim in the file "LICENCE".
+
+"""Module for additional control components"""
+
+import collections
+import threading
+
+class LocalQueue:
+    """In-process counterpart of the SharedQueue.
+
+    Provides the same access methods as the SharedQueue, but items are kept in a
+    plain deque of the running process, so no pickling and no IPC is involved.
+
+    Used for task generators running as coroutines inside the master process.
+    The lock is provided to keep code written for the SharedQueue working unchanged.
+    """
+
+    def __init__(self):
+        self._queue = collections.deque()
+        self._lock = threading.Lock()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self._queue.clear()
+
+    def fill(self, in_list):
+        """Fills the queue with the passed input list."""
+
+        if len(in_list) == 0:
+            raise RuntimeError('Input list is empty!')
+
+        if self._queue:
+            raise RuntimeError('Local Queue is not empty!')
+
+        self._queue.extend(in_list)
+
+    def clear(self):
+        """Clears all items from the queue."""
+        self._queue.clear()
+
+    def push(self, item):
+        """Pushes an item into the queue."""
+
+        if not item:
+            raise RuntimeError("Passed item for local queue push was not set!")
+
+        self._queue.append(item)
+
+    def pop_nowait(self):
+        """Returns an item from the queue or None if the queue is empty."""
+
+        try:
+            return self._queue.popleft()
+        except IndexError:
+            return None
+
+    def pop(self):
+        """Returns an item from the queue.
+
+        Since there is no other process to fill the queue, blocking is not supported.
+        """
+
+        if not self._queue:
+            raise RuntimeError('Blocking pop on empty Local Queue would never return!')
+
+        return self._queue.popleft()
+
+    def is_empty(self):
+        """Checks if the queue is empty."""
+        return not self._queue
+
+    def __len__(self):
+        return len(self._queue)
+
+    @property
+    def lock(self):
+        """Returns the prehold internal lock used for critical sections."""
+        return self._lock
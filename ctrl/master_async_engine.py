@@ -0,0 +1,233 @@
+#!/usr/bin/env python3
+#
+# -*- coding: utf-8 -*-
+#
+# © Copyright 2023 GSI Helmholtzzentrum für Schwerionenforschung
+#
+# This software is distributed under
+# the terms of the GNU General Public Licence version 3 (GPL Version 3),
+# copied verbatim in the file "LICENCE".
+
+"""Module for additional control components"""
+
+import asyncio
+import contextlib
+import logging
+import signal
+
+from comm.master_async_handler import MasterAsyncCommHandler
+from conf.master_config_file_reader import MasterConfigFileReader
+from ctrl.broadcast_channel import BroadcastChannel
+from ctrl.local_queue import LocalQueue
+from ctrl.master_factory import MasterFactory
+from ctrl.master_frontend import MasterFrontend
+from ctrl.shared_queue import SharedQueue
+from ctrl.shared_queue_str import SharedQueueStr
+from ctrl.task_dispatcher import TaskDispatcher
+from msg.exit_command import ExitCommand
+from msg.message_factory import MessageFactory
+from task.generator.process_task_generator_adapter import ProcessTaskGeneratorAdapter
+from task.generator.task_generator_factory import TaskGeneratorFactory
+
+class MasterAsyncEngine:
+    """Master engine running the communication with the controllers on an asyncio event loop.
+
+    A task generator derived from the BaseAsyncTaskGenerator runs as coroutine in the same event loop
+    and exchanges tasks with the master by LocalQueue objects.
+    Other task generators are forked as before and attached by the ProcessTaskGeneratorAdapter.
+
+    Periodic checks e.g. for controller timeouts and the generator feed are scheduled as callbacks
+    on the event loop instead of being bound to poll timeouts.
+    """
+
+    MAX_ERROR_COUNT = 100
+
+    def __init__(self, config_file_reader: MasterConfigFileReader) -> None:
+
+        self._config_file_reader = config_file_reader
+
+        self._dispatcher : TaskDispatcher = None
+        self._task_generator = None
+        self._broadcast_channel : BroadcastChannel = None
+        self._housekeeping_handle : asyncio.TimerHandle = None
+
+        self.error_count = 0
+
+    def run(self) -> None:
+        asyncio.run(self._main())
+
+    async def _main(self) -> None:
+
+        config_file_reader = self._config_file_reader
+
+        generator_class = None
+
+        if config_file_reader.task_gen_module:
+
+            generator_class = \
+                TaskGeneratorFactory.load_class(config_file_reader.task_gen_module, config_file_reader.task_gen_class)
+
+        if generator_class and TaskGeneratorFactory.is_async(generator_class):
+            task_queue, result_queue = LocalQueue(), LocalQueue()
+        else:
+            task_queue, result_queue = SharedQueue(), SharedQueueStr()
+
+        core_target, core_port = MasterFactory.core_endpoint(config_file_reader)
+
+        with MasterAsyncCommHandler(core_target,
+                                    core_port,
+                                    config_file_reader.poll_timeout) as comm_handler, \
+                task_queue, \
+                result_queue, \
+                contextlib.ExitStack() as exit_stack:
+
+            comm_handler.connect()
+
+            MasterFactory.create_frontend_pool(config_file_reader, exit_stack)
+
+            if generator_class:
+                self._task_generator = \
+                    MasterFactory.create_task_generator(config_file_reader, generator_class, task_queue, result_queue)
+
+            self._broadcast_channel = MasterFactory.create_broadcast_channel(config_file_reader, exit_stack)
+
+            self._dispatcher = \
+                MasterFactory.create_dispatcher(config_file_reader,
+                                                exit_stack,
+                                                self._task_generator,
+                                                task_queue,
+                                                result_queue,
+                                                self._broadcast_channel)
+
+            loop = asyncio.get_running_loop()
+
+            for signum in (signal.SIGHUP, signal.SIGINT, signal.SIGTERM):
+                loop.add_signal_handler(signum, self._signal_handler, signum)
+
+            if self._task_generator:
+                self._task_generator.start()
+
+            self._schedule_housekeeping()
+
+            try:
+
+                if config_file_reader.frontend_enabled:
+                    await self._serve_frontends(comm_handler)
+                else:
+                    await self._serve(comm_handler)
+
+                self._dispatcher.log_stats()
+
+            finally:
+
+                if self._housekeeping_handle:
+                    self._housekeeping_handle.cancel()
+
+                try:
+
+                    if self._task_generator:
+
+                        self._task_generator.stop()
+                        await self._task_generator.join(ProcessTaskGeneratorAdapter.STOP_WAIT_SECONDS)
+
+                except Exception:
+
+                    self.error_count += 1
+                    logging.exception('Caught exception during shutdown of Task Generator')
+
+    async def _serve(self, comm_handler: MasterAsyncCommHandler) -> None:
+
+        while self._dispatcher.run_flag:
+
+            try:
+
+                recv_data = await comm_handler.recv_string()
+
+                if not recv_data:
+                    logging.debug('RECV-MSG TIMEOUT')
+                    continue
+
+                logging.debug("Received message: %s", recv_data)
+
+                send_msg = self._dispatcher.process(MessageFactory.create(recv_data))
+
+                if logging.root.isEnabledFor(logging.DEBUG):
+                    logging.debug("Sending message: %s", send_msg.to_string())
+
+                await comm_handler.send_string(send_msg.to_string())
+
+            except Exception:
+
+                self.error_count += 1
+                logging.exception('Caught exception in main loop')
+
+                self._dispatcher.stop_task_distribution()
+
+                if self.error_count == self.MAX_ERROR_COUNT:
+                    break
+
+    async def _serve_frontends(self, comm_handler: MasterAsyncCommHandler) -> None:
+
+        while self._dispatcher.run_flag:
+
+            try:
+
+                recv_obj = await comm_handler.recv_pyobj()
+
+                if recv_obj is None:
+                    logging.debug('RECV-MSG TIMEOUT')
+                    continue
+
+                # Responds in any case, otherwise the frontend process waits forever.
+                decision = ExitCommand()
+
+                try:
+                    decision = self._dispatcher.dispatch(MasterFrontend.decode_forwarded(recv_obj))
+                finally:
+                    await comm_handler.send_pyobj(decision)
+
+            except Exception:
+
+                self.error_count += 1
+                logging.exception('Caught exception in main loop')
+
+                self._dispatcher.stop_task_distribution()
+
+                if self.error_count == self.MAX_ERROR_COUNT:
+                    break
+
+    def _schedule_housekeeping(self) -> None:
+
+        interval = max(self._config_file_reader.poll_timeout / 1000.0, 0.1)
+
+        self._housekeeping_handle = \
+            asyncio.get_running_loop().call_later(interval, self._housekeeping)
+
+    def _housekeeping(self) -> None:
+
+        try:
+
+            self._dispatcher.check_controller_timeout()
+
+            if self._broadcast_channel:
+                self._broadcast_channel.check(self._dispatcher.task_distribution)
+
+        except Exception:
+            self.error_count += 1
+            logging.exception('Caught exception in housekeeping')
+
+        self._schedule_housekeeping()
+
+    def _signal_handler(self, signum: signal.Signals) -> None:
+
+        if signum == signal.SIGHUP:
+            logging.info('Master received hang-up signal')
+        elif signum == signal.SIGINT:
+            logging.info('Master received interrupt program signal')
+        elif signum == signal.SIGTERM:
+            logging.info('Master received signal to terminate')
+
+        self._dispatcher.stop_task_distribution()
+
+        if self._broadcast_channel:
+            self._broadcast_channel.check(self._dispatcher.task_distribution)
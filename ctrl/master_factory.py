@@ -0,0 +1,176 @@
+#!/usr/bin/env python3
+#
+# -*- coding: utf-8 -*-
+#
+# © Copyright 2023 GSI Helmholtzzentrum für Schwerionenforschung
+#
+# This software is distributed under
+# the terms of the GNU General Public Licence version 3 (GPL Version 3),
+# copied verbatim in the file "LICENCE".
+
+"""Module for additional control components"""
+
+import contextlib
+
+from conf.master_config_file_reader import MasterConfigFileReader
+from ctrl.broadcast_channel import BroadcastChannel
+from ctrl.controller_group import ControllerGroup
+from ctrl.controller_group import ControllerGroupQuota
+from ctrl.controller_health import ControllerHealth
+from ctrl.generator_feed import GeneratorFeed
+from ctrl.heartbeat_monitor import HeartbeatMonitor
+from ctrl.master_frontend import MasterFrontend
+from ctrl.master_frontend import MasterFrontendPool
+from ctrl.task_dispatcher import TaskDispatcher
+from ctrl.task_limiter import TaskLimiter
+from ctrl.task_source import TaskSource
+from ctrl.task_templates import TaskTemplates
+from scheduler.scheduler_factory import SchedulerFactory
+from task.generator.process_task_generator_adapter import ProcessTaskGeneratorAdapter
+from task.generator.task_generator_factory import TaskGeneratorFactory
+
+class MasterFactory:
+    """Creates the components of the master from its configuration, which are shared by the master engines.
+
+    Components with a connection are entered into the given exit stack, so they are closed by the master engine.
+    """
+
+    @staticmethod
+    def core_endpoint(config_file_reader: MasterConfigFileReader) -> tuple[str, int]:
+
+        # With frontend processes the master core just receives the decoded messages from them.
+        if config_file_reader.frontend_enabled:
+            return MasterFrontend.LOCALHOST, config_file_reader.frontend_core_port
+
+        return config_file_reader.comm_target, config_file_reader.comm_port
+
+    @staticmethod
+    def create_frontend_pool(config_file_reader: MasterConfigFileReader,
+                             exit_stack: contextlib.ExitStack) -> MasterFrontendPool:
+
+        if not config_file_reader.frontend_enabled:
+            return None
+
+        frontend_pool = \
+            exit_stack.enter_context(MasterFrontendPool(config_file_reader.comm_target,
+                                                        config_file_reader.comm_port,
+                                                        config_file_reader.frontend_backend_port,
+                                                        config_file_reader.frontend_core_port,
+                                                        config_file_reader.frontend_processes,
+                                                        config_file_reader.poll_timeout))
+        frontend_pool.start()
+
+        return frontend_pool
+
+    @staticmethod
+    def create_task_generator(config_file_reader: MasterConfigFileReader, generator_class, task_queue, result_queue):
+        """Creates the task generator, which is forked by the ProcessTaskGeneratorAdapter unless it is async."""
+
+        task_generator = \
+            TaskGeneratorFactory.create(generator_class,
+                                        task_queue,
+                                        result_queue,
+                                        config_file_reader.task_gen_config_file)
+
+        if not TaskGeneratorFactory.is_async(generator_class):
+            task_generator = ProcessTaskGeneratorAdapter(task_generator)
+
+        return task_generator
+
+    @staticmethod
+    def create_broadcast_channel(config_file_reader: MasterConfigFileReader,
+                                 exit_stack: contextlib.ExitStack) -> BroadcastChannel:
+
+        if not config_file_reader.broadcast_enabled:
+            return None
+
+        broadcast_channel = \
+            exit_stack.enter_context(BroadcastChannel(config_file_reader.broadcast_target,
+                                                      config_file_reader.broadcast_port,
+                                                      config_file_reader.broadcast_interval,
+                                                      config_file_reader.broadcast_command_file))
+        broadcast_channel.connect()
+
+        return broadcast_channel
+
+    @staticmethod
+    def create_dispatcher(config_file_reader: MasterConfigFileReader,
+                          exit_stack: contextlib.ExitStack,
+                          task_generator,
+                          task_queue,
+                          result_queue,
+                          broadcast_channel: BroadcastChannel) -> TaskDispatcher:
+        """Creates the task dispatcher with the task sources, the scheduler and the components enabled."""
+
+        task_sources = []
+
+        if task_generator:
+            task_sources.append(
+                TaskSource(config_file_reader.task_gen_class, task_queue, result_queue, task_generator))
+
+        generator_feed = None
+
+        if config_file_reader.generator_feed_enabled:
+
+            generator_feed = \
+                exit_stack.enter_context(GeneratorFeed(config_file_reader.generator_feed_target,
+                                                       config_file_reader.generator_feed_port,
+                                                       config_file_reader.generator_feed_credit,
+                                                       config_file_reader.generator_feed_timeout))
+            generator_feed.connect()
+
+        heartbeat_monitor = None
+
+        if config_file_reader.heartbeat_enabled:
+
+            heartbeat_monitor = \
+                exit_stack.enter_context(HeartbeatMonitor(config_file_reader.heartbeat_target,
+                                                          config_file_reader.heartbeat_port,
+                                                          config_file_reader.heartbeat_timeout))
+            heartbeat_monitor.start()
+
+        task_limiter = None
+
+        if config_file_reader.task_limits_file:
+            task_limiter = TaskLimiter(config_file_reader.task_limits_file)
+
+        controller_group_quota = None
+
+        if config_file_reader.controller_groups:
+            controller_group_quota = \
+                ControllerGroupQuota([ControllerGroup(*controller_group)
+                                      for controller_group in config_file_reader.controller_groups])
+
+        task_templates = None
+
+        if config_file_reader.task_templates:
+            task_templates = TaskTemplates()
+
+        controller_health = None
+
+        if config_file_reader.controller_health:
+            controller_health = \
+                ControllerHealth(config_file_reader.controller_health_window,
+                                 config_file_reader.controller_health_min_samples,
+                                 config_file_reader.controller_health_slow_factor,
+                                 config_file_reader.controller_health_failure_margin,
+                                 config_file_reader.controller_health_quarantine,
+                                 config_file_reader.controller_health_probation,
+                                 config_file_reader.controller_health_max_fraction)
+
+        return TaskDispatcher(task_sources,
+                              generator_feed,
+                              config_file_reader.controller_timeout,
+                              config_file_reader.controller_wait_duration,
+                              config_file_reader.task_resend_timeout,
+                              task_limiter,
+                              controller_group_quota,
+                              SchedulerFactory.create(config_file_reader.scheduler_policy,
+                                                      config_file_reader.scheduler_window,
+                                                      config_file_reader.scheduler_shares,
+                                                      config_file_reader.scheduler_half_life,
+                                                      config_file_reader.scheduler_sticky_wait),
+                              heartbeat_monitor,
+                              task_templates,
+                              controller_health,
+                              broadcast_channel)
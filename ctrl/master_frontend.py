@@ -0,0 +1,164 @@
+#!/usr/bin/env python3
+#
+# -*- coding: utf-8 -*-
+#
+# © Copyright 2023 GSI Helmholtzzentrum für Schwerionenforschung
+#
+# This software is distributed under
+# the terms of the GNU General Public Licence version 3 (GPL Version 3),
+# copied verbatim in the file "LICENCE".
+
+"""Module for additional control components"""
+
+import logging
+import multiprocessing
+import os
+import signal
+
+import zmq
+import zmq.devices
+
+from comm.master_frontend_handler import MasterFrontendCommHandler
+from msg.base_message import BaseMessage
+from msg.message_factory import MessageFactory
+from msg.task_assign import TaskAssign
+from task.base_task import BaseTask
+
+class MasterFrontend(multiprocessing.Process):
+    """Process decoding the messages of the controllers and encoding the responses of the master core.
+
+    The core just receives the decoded messages and responds with its decisions as pickled objects,
+    so the costly parts of the message processing e.g. the TaskAssign serialization run in parallel.
+    """
+
+    LOCALHOST = '127.0.0.1'
+
+    def __init__(self, name: str, backend_port: int, core_port: int, poll_timeout: int) -> None:
+
+        super().__init__(name=name, daemon=True)
+
+        self._backend_port = backend_port
+        self._core_port = core_port
+        self._poll_timeout = poll_timeout
+
+        self._run_flag = multiprocessing.Event()
+        self._run_flag.set()
+
+    def stop(self) -> None:
+        self._run_flag.clear()
+
+    def run(self) -> None:
+
+        # Shutdown is controlled by the master, signal handlers of the master are not inherited.
+        signal.signal(signal.SIGINT, signal.SIG_IGN)
+        signal.signal(signal.SIGHUP, signal.SIG_IGN)
+        signal.signal(signal.SIGTERM, signal.SIG_DFL)
+
+        try:
+
+            with MasterFrontendCommHandler(MasterFrontend.LOCALHOST,
+                                           self._backend_port,
+                                           self._core_port,
+                                           self._poll_timeout) as comm_handler:
+
+                comm_handler.connect()
+
+                while self._run_flag.is_set():
+
+                    recv_data = comm_handler.recv_string()
+
+                    if not recv_data:
+                        continue
+
+                    try:
+                        recv_obj = MessageFactory.create(recv_data)
+                    except Exception:
+                        # Forward the invalid message, so the core handles the error as without frontend.
+                        recv_obj = recv_data
+
+                    decision = comm_handler.exchange_pyobj(recv_obj)
+
+                    comm_handler.send_string(MasterFrontend.encode(decision))
+
+        except Exception:
+            logging.exception("Caught exception in master frontend: %s", self.name)
+            os._exit(1)
+
+        os._exit(0)
+
+    @staticmethod
+    def decode_forwarded(recv_obj) -> BaseMessage:
+        """Decodes an object forwarded to the core, that is either a decoded message or an invalid raw message."""
+
+        if isinstance(recv_obj, str):
+            return MessageFactory.create(recv_obj)
+
+        return recv_obj
+
+    @staticmethod
+    def encode(decision) -> str:
+
+        if isinstance(decision, BaseTask):
+            return TaskAssign(decision).to_string()
+
+        if isinstance(decision, BaseMessage):
+            return decision.to_string()
+
+        raise RuntimeError(f"Not supported decision received from master core: {type(decision)}")
+
+class MasterFrontendPool:
+    """Pool of master frontend processes behind a proxy bound to the communication port of the master.
+
+    The proxy runs in a thread of the master without holding the GIL
+    and distributes the messages of the controllers to the frontend processes.
+    """
+
+    def __init__(self,
+                 target: str,
+                 port: int,
+                 backend_port: int,
+                 core_port: int,
+                 process_count: int,
+                 poll_timeout: int) -> None:
+
+        if process_count < 1:
+            raise RuntimeError(f"Invalid number of master frontend processes: {process_count}")
+
+        self._proxy = zmq.devices.ThreadProxy(zmq.ROUTER, zmq.DEALER)
+        self._proxy.bind_in(f"tcp://{target}:{port}")
+        self._proxy.bind_out(f"tcp://{MasterFrontend.LOCALHOST}:{backend_port}")
+
+        self._frontends = [MasterFrontend(f"MasterFrontend-{i}", backend_port, core_port, poll_timeout)
+                           for i in range(process_count)]
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stop()
+
+    def start(self) -> None:
+
+        # Frontend processes are forked before the proxy thread is started.
+        for frontend in self._frontends:
+            frontend.start()
+
+        self._proxy.start()
+
+        logging.info("Started master frontend processes: %i", len(self._frontends))
+
+    def stop(self) -> None:
+
+        for frontend in self._frontends:
+            frontend.stop()
+
+        for frontend in self._frontends:
+
+            if frontend.is_alive():
+
+                frontend.join(1)
+
+                # A frontend might wait for a response of the core that is not running anymore.
+                if frontend.is_alive():
+                    frontend.terminate()
+                    frontend.join()
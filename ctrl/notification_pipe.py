@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+#
+# -*- coding: utf-8 -*-
+#
+# © Copyright 2023 GSI Helmholtzzentrum für Schwerionenforschung
+#
+# This software is distributed under
+# the terms of the GNU General Public Licence version 3 (GPL Version 3),
+# copied verbatim in the file "LICENCE".
+
+"""Module for additional control components"""
+
+import os
+
+class NotificationPipe:
+    """Pipe notifying the controller about results pushed by its worker processes.
+
+    Each worker writes a byte per pushed result, so the controller polls the read end
+    together with its sockets and knows the number of results to pop without waiting on a condition.
+    A write of a single byte is atomic, so the workers share the write end without locking.
+    """
+
+    def __init__(self) -> None:
+
+        self._read_fd, self._write_fd = os.pipe()
+
+        os.set_blocking(self._read_fd, False)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def fileno(self) -> int:
+        """Returns the read end, so the pipe can be registered on a zmq.Poller."""
+        return self._read_fd
+
+    def notify(self) -> None:
+        os.write(self._write_fd, b'\0')
+
+    def clear(self) -> int:
+        """Reads all pending notifications and returns their number."""
+
+        count = 0
+
+        while True:
+
+            try:
+                data = os.read(self._read_fd, 4096)
+            except BlockingIOError:
+                break
+
+            if not data:
+                break
+
+            count += len(data)
+
+        return count
+
+    def close(self) -> None:
+
+        for fd in (self._read_fd, self._write_fd):
+
+            try:
+                os.close(fd)
+            except OSError:
+                pass
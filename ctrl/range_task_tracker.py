@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+#
+# -*- coding: utf-8 -*-
+#
+# © Copyright 2023 GSI Helmholtzzentrum für Schwerionenforschung
+#
+# This software is distributed under
+# the terms of the GNU General Public Licence version 3 (GPL Version 3),
+# copied verbatim in the file "LICENCE".
+
+"""Module for additional control components"""
+
+from collections import deque
+
+from ClusterShell.RangeSet import RangeSet
+
+from msg.task_finished import TaskFinished
+from msg.task_return import TaskReturn
+from task.base_task import BaseTask
+
+class RangeTaskTracker:
+    """Tracks the tasks expanded from range tasks on the controller, so a range task is reported finished once.
+
+    Tasks of ranges still in progress might share a TID e.g. the same OST index of consecutive monitoring waves,
+    so the ranges of a TID are kept in the order the tasks have been expanded.
+
+    A range task is reported cancelled, if any of its tasks was cancelled,
+    otherwise timed out or failed, if any of its tasks timed out or failed.
+    A range task is returned to the master, if any of its tasks is returned without execution.
+    If some of its tasks are finished already, just the range of the tasks not finished is returned,
+    and the range task is reported finished with the status of the tasks executed after returning it.
+    """
+
+    # Status of a range task by the most severe status of its tasks.
+    STATUS_SEVERITY = {TaskFinished.STATUS_OK: 0,
+                       TaskFinished.STATUS_FAILED: 1,
+                       TaskFinished.STATUS_TIMEOUT: 2,
+                       TaskFinished.STATUS_CANCELLED: 3}
+
+    def __init__(self) -> None:
+
+        self._pending_count_dict = dict[str, int]()
+        self._task_count_dict = dict[str, int]()
+        self._range_tid_dict = dict[str, deque]()
+        self._status_dict = dict[str, str]()
+        self._returned_tid_set = set[str]()
+
+    def add(self, range_tid: str, task_list: list[BaseTask]) -> None:
+
+        if not task_list:
+            raise RuntimeError(f"No tasks expanded from range task: {range_tid}")
+
+        # A range task resent by the master to the same controller is reported finished after both are done.
+        self._pending_count_dict[range_tid] = self._pending_count_dict.get(range_tid, 0) + len(task_list)
+        self._task_count_dict[range_tid] = self._task_count_dict.get(range_tid, 0) + len(task_list)
+
+        # Same for a range task returned to the master and dispatched again to this controller.
+        self._returned_tid_set.discard(range_tid)
+
+        for task in task_list:
+            self._range_tid_dict.setdefault(task.tid, deque()).append(range_tid)
+
+    def finish(self, tid: str, status: str = TaskFinished.STATUS_OK) -> str:
+        """Returns the TID to report as finished to the master or None, if the range task is still in progress."""
+
+        range_tid_deque = self._range_tid_dict.get(tid)
+
+        if not range_tid_deque:
+
+            self._set_status(tid, status)
+            return tid
+
+        range_tid = range_tid_deque.popleft()
+
+        self._set_status(range_tid, status)
+
+        if not range_tid_deque:
+            del self._range_tid_dict[tid]
+
+        pending_count = self._pending_count_dict[range_tid] - 1
+
+        if pending_count:
+
+            self._pending_count_dict[range_tid] = pending_count
+            return None
+
+        del self._pending_count_dict[range_tid]
+        del self._task_count_dict[range_tid]
+
+        # A range task returned to the master is not reported finished anymore.
+        if range_tid in self._returned_tid_set:
+
+            self._returned_tid_set.remove(range_tid)
+            self._status_dict.pop(range_tid, None)
+            return None
+
+        return range_tid
+
+    def return_task(self, tid: str) -> str:
+        """Returns the item to return to the master for a task not executed or None, if its range task is returned already.
+
+        The range task is returned on its first task not executed with the range of its tasks not finished,
+        which includes the tasks still executing, since they are not reported anymore.
+        """
+
+        range_tid_deque = self._range_tid_dict.get(tid)
+
+        if not range_tid_deque:
+            return tid
+
+        range_tid = range_tid_deque[0]
+
+        if range_tid in self._returned_tid_set:
+
+            self.finish(tid)
+            return None
+
+        task_tid_list = self.task_tids(range_tid)
+
+        if len(task_tid_list) < self._task_count_dict[range_tid]:
+            return_item = TaskReturn.range_item(range_tid, str(RangeSet.fromlist(task_tid_list)))
+        else:
+            return_item = range_tid
+
+        self._returned_tid_set.add(range_tid)
+        self.finish(tid)
+
+        return return_item
+
+    def pop_status(self, tid: str) -> str:
+        """Returns the status of the task reported as finished and forgets about it."""
+        return self._status_dict.pop(tid, TaskFinished.STATUS_OK)
+
+    def task_tids(self, range_tid: str) -> list[str]:
+        """Returns the TIDs of the tasks in progress expanded from the range task, otherwise just the passed TID."""
+
+        task_tid_list = [tid for tid, range_tid_deque in self._range_tid_dict.items() if range_tid in range_tid_deque]
+
+        if task_tid_list:
+            return task_tid_list
+
+        return [range_tid]
+
+    def _set_status(self, tid: str, status: str) -> None:
+
+        if status == TaskFinished.STATUS_OK:
+            return
+
+        current_status = self._status_dict.get(tid, TaskFinished.STATUS_OK)
+
+        if RangeTaskTracker.STATUS_SEVERITY[status] > RangeTaskTracker.STATUS_SEVERITY[current_status]:
+            self._status_dict[tid] = status
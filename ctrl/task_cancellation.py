@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+#
+# -*- coding: utf-8 -*-
+#
+# © Copyright 2023 GSI Helmholtzzentrum für Schwerionenforschung
+#
+# This software is distributed under
+# the terms of the GNU General Public Licence version 3 (GPL Version 3),
+# copied verbatim in the file "LICENCE".
+
+"""Module for additional control components"""
+
+class TaskCancellation:
+    """Tracks the tasks in progress on the controller and the requests of the master to cancel them.
+
+    A request for a task not in progress is ignored e.g. if the task has just finished,
+    so a later task with the same TID is not cancelled.
+    A task still queued is cancelled once a worker executes it, so the worker skips its execution.
+    """
+
+    def __init__(self) -> None:
+
+        self._in_progress_dict = dict[str, int]()
+        self._in_progress_count = 0
+        self._cancel_tid_set = set[str]()
+
+    @property
+    def in_progress_count(self) -> int:
+        """Number of tasks pushed to the workers and not finished yet."""
+        return self._in_progress_count
+
+    @property
+    def pending(self) -> bool:
+        """True, if there are requests for tasks not cancelled yet."""
+        return bool(self._cancel_tid_set)
+
+    def add(self, tid: str) -> None:
+
+        self._in_progress_dict[tid] = self._in_progress_dict.get(tid, 0) + 1
+        self._in_progress_count += 1
+
+    def finish(self, tid: str) -> None:
+
+        if tid not in self._in_progress_dict:
+            return
+
+        self._in_progress_count -= 1
+
+        count = self._in_progress_dict[tid] - 1
+
+        if count > 0:
+            self._in_progress_dict[tid] = count
+            return
+
+        self._in_progress_dict.pop(tid, None)
+        self._cancel_tid_set.discard(tid)
+
+    def request(self, tid: str) -> bool:
+        """Returns True, if the task is in progress and requested to be cancelled."""
+
+        if tid not in self._in_progress_dict:
+            return False
+
+        self._cancel_tid_set.add(tid)
+
+        return True
+
+    def pop_request(self, tid: str) -> bool:
+        """Returns True and forgets about the request, if the task is requested to be cancelled."""
+
+        if tid in self._cancel_tid_set:
+
+            self._cancel_tid_set.remove(tid)
+            return True
+
+        return False
@@ -0,0 +1,672 @@
+#!/usr/bin/env python3
+#
+# -*- coding: utf-8 -*-
+#
+# © Copyright 2023 GSI Helmholtzzentrum für Schwerionenforschung
+#
+# This software is distributed under
+# the terms of the GNU General Public Licence version 3 (GPL Version 3),
+# copied verbatim in the file "LICENCE".
+
+"""Module for additional control components"""
+
+import logging
+import time
+
+from collections import deque
+
+from ctrl.broadcast_channel import BroadcastChannel
+from ctrl.controller_group import ControllerGroupQuota
+from ctrl.controller_health import ControllerHealth
+from ctrl.generator_feed import GeneratorFeed
+from ctrl.heartbeat_monitor import HeartbeatMonitor
+from ctrl.task_limiter import TaskLimiter
+from ctrl.task_source import TaskSource
+from ctrl.task_templates import TaskTemplates
+from ctrl.task_status_item import TaskState
+from ctrl.task_status_item import TaskStatusItem
+from msg.acknowledge import Acknowledge
+from msg.base_message import BaseMessage
+from msg.control_command import ControlCommand
+from msg.exit_command import ExitCommand
+from msg.message_type import MessageType
+from msg.task_assign import TaskAssign
+from msg.task_finished import TaskFinished
+from msg.task_return import TaskReturn
+from msg.wait_command import WaitCommand
+from scheduler.base_scheduler import BaseScheduler
+from scheduler.fifo_scheduler import FifoScheduler
+from task.base_task import BaseTask
+from task.cancel_task import CancelTask
+from task.range_task import RangeTask
+
+class TaskDispatcher:
+    """Processes the messages received by the master and decides how to respond to the controllers.
+
+    The dispatcher is independent of the communication model,
+    so it is shared by the different master engines.
+
+    The task to dispatch next is picked by the scheduler of the configured scheduling policy.
+    Tasks with an expired deadline are dropped instead of being dispatched.
+
+    If a task limiter or a controller group quota is set, tasks not passing the limits are deferred
+    in the master until they can be dispatched, so other tasks can still be dispatched meanwhile.
+
+    If a controller health is set, controllers quarantined as slow or failing outliers get no tasks.
+
+    Tasks returned by a controller e.g. prefetched tasks on its shutdown are dispatched again before other tasks.
+
+    Tasks are cancelled by a CancelTask of a task generator or by the command file of the broadcast channel.
+    Tasks not dispatched yet are dropped, while tasks running on a controller are cancelled there
+    by a cancel command on the broadcast channel.
+    """
+
+    # Max number of tasks deferred by the task limits, before no further tasks are popped from the task sources.
+    MAX_DEFERRED_TASK_COUNT = 10000
+
+    # Max number of tasks deferred on a single task request, so a request does not drain the task sources
+    # while a limit is saturated.
+    MAX_REQUEST_DEFERRED_TASK_COUNT = 10
+
+    def __init__(self,
+                 task_sources: list[TaskSource],
+                 generator_feed: GeneratorFeed,
+                 controller_timeout: float,
+                 controller_wait_duration: int,
+                 task_resend_timeout: int,
+                 task_limiter: TaskLimiter = None,
+                 controller_group_quota: ControllerGroupQuota = None,
+                 scheduler: BaseScheduler = None,
+                 heartbeat_monitor: HeartbeatMonitor = None,
+                 task_templates: TaskTemplates = None,
+                 controller_health: ControllerHealth = None,
+                 broadcast_channel: BroadcastChannel = None) -> None:
+
+        if not task_sources and not generator_feed:
+            raise RuntimeError('Neither a task source nor a generator feed is set!')
+
+        self._task_sources = task_sources
+        self._generator_feed = generator_feed
+        self._next_task_source_index = 0
+
+        self._controller_timeout = controller_timeout
+        self._controller_wait_duration = controller_wait_duration
+        self._task_resend_timeout = task_resend_timeout
+
+        self._task_limiter = task_limiter
+        self._controller_group_quota = controller_group_quota
+        self._deferred_task_dict = dict[str, deque]()
+        self._deferred_task_count = 0
+
+        self._scheduler = scheduler if scheduler else FifoScheduler()
+
+        self._heartbeat_monitor = heartbeat_monitor
+        self._task_templates = task_templates
+        self._controller_health = controller_health
+        self._broadcast_channel = broadcast_channel
+
+        # TIDs of tasks to cancel, that have not been dispatched yet.
+        self._cancel_tid_set = set[str]()
+
+        self._returned_task_deque = deque()
+
+        self.dispatched_task_count = 0
+        self.finished_task_count = 0
+        self.failed_task_count = 0
+        self.timed_out_task_count = 0
+        self.cancelled_task_count = 0
+        self.returned_task_count = 0
+        self.expired_task_count = 0
+
+        self.controller_heartbeat_dict = dict[str, int]()
+        self.task_status_dict = dict[str, TaskStatusItem]()
+
+        self._task_distribution = True
+        self._run_flag = True
+
+    @property
+    def task_distribution(self) -> bool:
+        return self._task_distribution
+
+    @property
+    def run_flag(self) -> bool:
+        """Turns False, if the shutdown of all controllers is complete."""
+        return self._run_flag
+
+    def stop_task_distribution(self) -> None:
+
+        if self._task_distribution:
+            self._task_distribution = False
+
+    def process(self, recv_msg: BaseMessage) -> BaseMessage:
+        """Returns the message to be sent to the controller as response to the received message."""
+
+        decision = self.dispatch(recv_msg)
+
+        if isinstance(decision, BaseTask):
+            return TaskAssign(decision)
+
+        return decision
+
+    def dispatch(self, recv_msg: BaseMessage):
+        """Returns either the task to be assigned or the message to be sent to the controller.
+
+        The serialization of a task to assign is left to the caller e.g. a master frontend process.
+        """
+
+        last_exec_timestamp = int(time.time())
+
+        # TODO: Caution, sender is not set everywhere!
+        self.controller_heartbeat_dict[recv_msg.sender] = last_exec_timestamp
+
+        if not self._task_distribution:   # Do graceful shutdown, since task distribution is off!
+
+            self._forget_controller(recv_msg.sender)
+
+            if self._check_all_controller_down():
+                self._run_flag = False
+
+            return ExitCommand()
+
+        recv_msg_type = recv_msg.type()
+
+        if recv_msg_type == MessageType.TASK_REQUEST():
+            return self._process_task_request(recv_msg, last_exec_timestamp)
+
+        if recv_msg_type == MessageType.TASK_FINISHED():
+            return self._process_task_finished(recv_msg)
+
+        if recv_msg_type == MessageType.TASK_FINISHED_BATCH():
+            return self._process_task_finished_batch(recv_msg)
+
+        if recv_msg_type == MessageType.TASK_RETURN():
+            return self._process_task_return(recv_msg)
+
+        if recv_msg_type == MessageType.HEARTBEAT():
+
+            self._scheduler.on_heartbeat(recv_msg.sender)
+
+            return Acknowledge()
+
+        if recv_msg_type == MessageType.EXIT_NOTIFICATION():
+
+            logging.info("Controller exited: %s", recv_msg.sender)
+            self._forget_controller(recv_msg.sender)
+
+            return Acknowledge()
+
+        raise RuntimeError(f"Undefined type found in message: {recv_msg.to_string()}")
+
+    def log_stats(self) -> None:
+
+        logging.info("Task stats - dispatched: %i - finished: %i - failed: %i - timed out: %i - cancelled: %i"
+                     " - returned: %i - expired: %i",
+                     self.dispatched_task_count,
+                     self.finished_task_count,
+                     self.failed_task_count,
+                     self.timed_out_task_count,
+                     self.cancelled_task_count,
+                     self.returned_task_count,
+                     self.expired_task_count)
+
+        if self._controller_health:
+
+            logging.info("Controller health stats - quarantined: %i - not healthy: %s",
+                         self._controller_health.quarantined_count,
+                         self._controller_health.states())
+
+    def cancel(self, tid: str) -> None:
+        """Cancels the task either by dropping it, if it is not dispatched yet, or on the controller running it."""
+
+        task_status_item = self.task_status_dict.get(tid)
+
+        if not task_status_item:
+
+            logging.info("Cancelling task not dispatched yet: %s", tid)
+            self._cancel_tid_set.add(tid)
+
+        elif task_status_item.state != TaskState.assigned():
+            logging.debug("Ignoring cancel for task already finished: %s", tid)
+
+        elif self._broadcast_channel:
+
+            logging.info("Cancelling task on controller %s: %s", task_status_item.controller, tid)
+            self._broadcast_channel.send(ControlCommand.CANCEL, task_status_item.controller, tid)
+
+        else:
+            logging.warning("Cannot cancel running task without broadcast channel: %s", tid)
+
+    def check_controller_timeout(self) -> None:
+        """Gives controllers the last chance to quit themselves until a timeout is reached."""
+
+        if self._generator_feed:
+            self._generator_feed.process_events()
+
+        if self._task_limiter:
+            self._task_limiter.check_reload()
+
+        self._scheduler.on_timer(time.time())
+
+        if self._broadcast_channel:
+
+            for tid in self._broadcast_channel.pop_cancel_tids():
+                self.cancel(tid)
+
+        if self._controller_health:
+            self._controller_health.check(time.time())
+
+        if self._heartbeat_monitor:
+
+            for controller_name in self._heartbeat_monitor.pop_lost_controllers():
+
+                logging.warning("Lost heartbeat of controller: %s", controller_name)
+                self.controller_heartbeat_dict.pop(controller_name, None)
+                self._scheduler.forget(controller_name)
+
+                if self._controller_health:
+                    self._controller_health.forget(controller_name)
+
+        if not self._task_distribution:
+
+            last_exec_timestamp = int(time.time())
+
+            for controller_name in list(self.controller_heartbeat_dict.keys()):
+
+                last_seen_timestamp = self.controller_heartbeat_dict[controller_name]
+
+                # Busy controllers send their heartbeats on the heartbeat channel only.
+                if self._heartbeat_monitor:
+                    last_seen_timestamp = max(last_seen_timestamp, int(self._heartbeat_monitor.last_seen(controller_name)))
+
+                controller_threshold = last_seen_timestamp + self._controller_timeout
+
+                if last_exec_timestamp >= controller_threshold:
+                    self.controller_heartbeat_dict.pop(controller_name, None)
+
+            if self._check_all_controller_down():
+                self._run_flag = False
+
+    def _task_source_list(self) -> list[TaskSource]:
+
+        if self._generator_feed:
+            return self._task_sources + self._generator_feed.task_sources
+
+        return self._task_sources
+
+    def _task_source(self, name: str) -> TaskSource:
+
+        for task_source in self._task_source_list():
+
+            if task_source.name == name:
+                return task_source
+
+        return None
+
+    def _pop_task(self, controller: str) -> tuple:
+        """Pops the next task not expired picked by the scheduler for the controller.
+
+        Returns
+        -------
+        tuple
+            the task and its task source, otherwise (None, None) if no task is available.
+        """
+
+        if self._generator_feed:
+            self._generator_feed.process_events()
+
+        while self._returned_task_deque:
+
+            task, task_source = self._returned_task_deque.popleft()
+
+            if not self._drop_cancelled_task(task, task_source) and not self._drop_expired_task(task):
+                return task, task_source
+
+        while True:
+
+            task, task_source = self._scheduler.next_task(controller, self._task_source_list())
+
+            if not task:
+                break
+
+            if isinstance(task, CancelTask):
+
+                self.cancel(task.cancel_tid)
+                continue
+
+            if not self._drop_cancelled_task(task, task_source) and not self._drop_expired_task(task):
+                return task, task_source
+
+        if not self._scheduler.task_sources_alive \
+                and not self._generator_feed \
+                and not self._returned_task_deque \
+                and not self._deferred_task_count \
+                and not self._scheduler.pending_count():
+
+            self._task_distribution = False
+            self._controller_wait_duration = 0
+
+            # Allow a TaskGenerator to quit itself without notifying the master.
+            logging.info('Task Generator is not alive')
+
+        return None, None
+
+    def _drop_cancelled_task(self, task, task_source: TaskSource) -> bool:
+
+        if task.tid not in self._cancel_tid_set:
+            return False
+
+        self._cancel_tid_set.remove(task.tid)
+        self.cancelled_task_count += 1
+        logging.debug("Dropped cancelled task: %s", task.tid)
+
+        # The task generator is notified as if the task had been cancelled on a controller.
+        task_source.result_queue.push(task.tid)
+
+        return True
+
+    def _drop_expired_task(self, task) -> bool:
+
+        if not task.is_expired(time.time()):
+            return False
+
+        self.expired_task_count += 1
+        logging.debug("Dropped expired task: %s", task.tid)
+
+        return True
+
+    def _limited_key(self, controller: str, task) -> str:
+
+        if self._task_limiter:
+
+            key = self._task_limiter.limited_key(task)
+
+            if key:
+                return key
+
+        if self._controller_group_quota:
+            return self._controller_group_quota.limited_key(controller, task)
+
+        return None
+
+    def _acquire(self, controller: str, task) -> None:
+
+        if self._task_limiter:
+            self._task_limiter.acquire(task)
+
+        if self._controller_group_quota:
+            self._controller_group_quota.acquire(controller, task)
+
+    def _next_task(self, controller: str) -> tuple:
+        """Returns the next task passing the limits for the controller and its task source, otherwise (None, None)."""
+
+        if not self._task_limiter and not self._controller_group_quota:
+            return self._pop_task(controller)
+
+        # No task passes the cap of the whole group, so none is popped and deferred for the controller.
+        if self._controller_group_quota and self._controller_group_quota.is_capped(controller):
+            return None, None
+
+        for key in list(self._deferred_task_dict.keys()):
+
+            deferred_task_queue = self._deferred_task_dict[key]
+
+            while deferred_task_queue \
+                    and (self._drop_cancelled_task(*deferred_task_queue[0])
+                         or self._drop_expired_task(deferred_task_queue[0][0])):
+
+                deferred_task_queue.popleft()
+                self._deferred_task_count -= 1
+
+            if not deferred_task_queue:
+
+                del self._deferred_task_dict[key]
+                continue
+
+            task, task_source = deferred_task_queue[0]
+
+            if not self._limited_key(controller, task):
+
+                deferred_task_queue.popleft()
+                self._deferred_task_count -= 1
+
+                if not deferred_task_queue:
+                    del self._deferred_task_dict[key]
+
+                return task, task_source
+
+        request_deferred_task_count = 0
+
+        while request_deferred_task_count < TaskDispatcher.MAX_REQUEST_DEFERRED_TASK_COUNT \
+                and self._deferred_task_count < TaskDispatcher.MAX_DEFERRED_TASK_COUNT:
+
+            task, task_source = self._pop_task(controller)
+
+            if not task:
+                break
+
+            key = self._limited_key(controller, task)
+
+            if not key:
+                return task, task_source
+
+            logging.debug("Deferring task by limit %s: %s", key, task.tid)
+
+            if key not in self._deferred_task_dict:
+                self._deferred_task_dict[key] = deque()
+
+            self._deferred_task_dict[key].append((task, task_source))
+            self._deferred_task_count += 1
+
+            request_deferred_task_count += 1
+
+        return None, None
+
+    def _process_task_request(self, recv_msg: BaseMessage, last_exec_timestamp: int):
+
+        if self._controller_health and self._controller_health.is_quarantined(recv_msg.sender):
+            return WaitCommand(self._controller_wait_duration)
+
+        task, task_source = self._next_task(recv_msg.sender)
+
+        if not task:
+            return WaitCommand(self._controller_wait_duration)
+
+        if task.tid in self.task_status_dict:
+
+            task_status_item = self.task_status_dict[task.tid]
+            task_resend_threshold = task_status_item.timestamp + self._task_resend_timeout
+
+            if task_status_item.state == TaskState.assigned() and last_exec_timestamp < task_resend_threshold:
+
+                logging.debug("Ignoring task to assign..."
+                              " - Waiting for task with TID to finish: %s", task.tid)
+
+                return WaitCommand(self._controller_wait_duration)
+
+            if task_status_item.state != TaskState.finished() and last_exec_timestamp < task_resend_threshold:
+                raise RuntimeError(f"Undefined state processing task: {task.tid}")
+
+        # The limits are just acquired for a task actually assigned.
+        self._acquire(recv_msg.sender, task)
+
+        self.task_status_dict[task.tid] = \
+            TaskStatusItem(task.tid, TaskState.assigned(), recv_msg.sender, int(time.time()), task_source.name, task)
+
+        self.dispatched_task_count += 1
+
+        self._scheduler.on_dispatch(recv_msg.sender, task, task_source)
+
+        if self._controller_health:
+            self._controller_health.on_dispatch(recv_msg.sender, task)
+
+        if self._task_templates:
+            return self._task_templates.encode(recv_msg.sender, recv_msg.session, task)
+
+        return task
+
+    def _process_task_finished(self, recv_msg: BaseMessage) -> BaseMessage:
+
+        if recv_msg.tid not in self.task_status_dict:
+            raise RuntimeError('Inconsistency detected on task finished')
+
+        self._finish_task(recv_msg.sender, recv_msg.tid, recv_msg.status)
+
+        return Acknowledge()
+
+    def _process_task_finished_batch(self, recv_msg: BaseMessage) -> BaseMessage:
+
+        items = recv_msg.items
+        unknown_tid_list = []
+
+        logging.debug("Received finished batch message for TIDs: %i", len(items))
+
+        # The whole batch is processed, before an inconsistency is raised as for a single finished task.
+        for tid, status in items:
+
+            if tid in self.task_status_dict:
+                self._finish_task(recv_msg.sender, tid, status)
+            else:
+                unknown_tid_list.append(tid)
+
+        if unknown_tid_list:
+            raise RuntimeError(f"Inconsistency detected on task finished batch: {unknown_tid_list}")
+
+        return Acknowledge()
+
+    def _finish_task(self, sender: str, tid: str, status: str) -> None:
+
+        task_status_item = self.task_status_dict[tid]
+
+        if sender != task_status_item.controller:
+
+            logging.warning('Received task finished from different controller')
+            return
+
+        # Reported again by the controller, if the response got lost.
+        if task_status_item.state == TaskState.finished():
+
+            logging.debug("Ignoring task already finished: %s", tid)
+            return
+
+        logging.debug("Received finished message for TID: %s", tid)
+        task_status_item.state = TaskState.finished()
+        task_status_item.timestamp = int(time.time())
+        task_status_item.task = None
+
+        cancelled = status == TaskFinished.STATUS_CANCELLED
+        timed_out = status == TaskFinished.STATUS_TIMEOUT
+        # A task timed out is counted as failed, too.
+        failed = status == TaskFinished.STATUS_FAILED or timed_out
+
+        if cancelled:
+            self.cancelled_task_count += 1
+        else:
+            self.finished_task_count += 1
+
+        if failed:
+            self.failed_task_count += 1
+
+        if timed_out:
+            self.timed_out_task_count += 1
+
+        if self._controller_health:
+
+            # Cancelled tasks tell nothing about the health of the controller.
+            if cancelled:
+                self._controller_health.discard(tid)
+            else:
+                self._controller_health.on_finish(sender, tid, failed)
+
+        if self._task_limiter:
+            self._task_limiter.release(tid)
+
+        if self._controller_group_quota:
+            self._controller_group_quota.release(tid)
+
+        self._scheduler.on_finish(sender, tid, task_status_item.source)
+
+        task_source = self._task_source(task_status_item.source)
+
+        if task_source:
+
+            logging.debug("Pushing TID to result queue: %s", tid)
+            task_source.result_queue.push(tid)
+
+        else:
+            logging.warning("Task source not available for finished TID: %s", tid)
+
+    def _process_task_return(self, recv_msg: BaseMessage) -> BaseMessage:
+
+        for tid in recv_msg.tids:
+
+            index_range = None
+
+            if tid not in self.task_status_dict and TaskReturn.index_range_separator in tid:
+                tid, _, index_range = tid.rpartition(TaskReturn.index_range_separator)
+
+            task_status_item = self.task_status_dict.get(tid)
+
+            if not task_status_item \
+                    or task_status_item.state != TaskState.assigned() \
+                    or task_status_item.controller != recv_msg.sender:
+
+                logging.warning("Ignoring returned task not assigned to controller %s: %s", recv_msg.sender, tid)
+                continue
+
+            logging.debug("Received returned task: %s", tid)
+
+            # A range task executed partially is dispatched again just with its tasks not finished by its TID.
+            if index_range and isinstance(task_status_item.task, RangeTask):
+                task_status_item.task.index_range = index_range
+
+            # Not kept as assigned, so the task is not held back as in progress when dispatched again.
+            del self.task_status_dict[tid]
+
+            self.returned_task_count += 1
+
+            if self._task_limiter:
+                self._task_limiter.release(tid)
+
+            if self._controller_group_quota:
+                self._controller_group_quota.release(tid)
+
+            if self._controller_health:
+                self._controller_health.discard(tid)
+
+            self._scheduler.on_finish(recv_msg.sender, tid, task_status_item.source)
+
+            task_source = self._task_source(task_status_item.source)
+
+            if task_source:
+                self._returned_task_deque.append((task_status_item.task, task_source))
+            else:
+                logging.warning("Task source not available for returned TID: %s", tid)
+
+        return Acknowledge()
+
+    def _forget_controller(self, controller_name: str) -> None:
+
+        self.controller_heartbeat_dict.pop(controller_name, None)
+
+        if self._heartbeat_monitor:
+            self._heartbeat_monitor.forget(controller_name)
+
+        if self._task_templates:
+            self._task_templates.forget(controller_name)
+
+        self._scheduler.forget(controller_name)
+
+        if self._controller_health:
+            self._controller_health.forget(controller_name)
+
+    def _check_all_controller_down(self) -> bool:
+
+        count_active_controller = len(self.controller_heartbeat_dict)
+
+        if not count_active_controller:
+
+            logging.info('Shutdown of controllers complete')
+            return True
+
+        logging.debug("Waiting for number of controllers to quit: %i", count_active_controller)
+        return False
@@ -0,0 +1,216 @@
+#!/usr/bin/env python3
+#
+# -*- coding: utf-8 -*-
+#
+# © Copyright 2023 GSI Helmholtzzentrum für Schwerionenforschung
+#
+# This software is distributed under
+# the terms of the GNU General Public Licence version 3 (GPL Version 3),
+# copied verbatim in the file "LICENCE".
+
+"""Module for additional control components"""
+
+import configparser
+import logging
+import os
+import time
+
+from conf.config_value_error import ConfigValueError
+from task.base_task import BaseTask
+
+class TaskLimit:
+    """Limit for dispatching tasks by a max number of tasks in flight and a token bucket for the dispatch rate.
+
+    A value of 0 for max_in_flight or rate disables the proper limit.
+    """
+
+    def __init__(self, key: str, max_in_flight: int, rate: float, burst: float) -> None:
+
+        if max_in_flight < 0:
+            raise ConfigValueError(f"Invalid max_in_flight for task limit {key}: {max_in_flight}")
+
+        if rate < 0:
+            raise ConfigValueError(f"Invalid rate for task limit {key}: {rate}")
+
+        if rate and burst < 1:
+            raise ConfigValueError(f"Invalid burst for task limit {key}: {burst}")
+
+        self.key = key
+        self.max_in_flight = max_in_flight
+        self.rate = rate
+        self.burst = burst
+
+        self._tokens = burst
+        self._timestamp = time.monotonic()
+
+    def has_token(self) -> bool:
+
+        if not self.rate:
+            return True
+
+        now = time.monotonic()
+
+        self._tokens = min(self.burst, self._tokens + (now - self._timestamp) * self.rate)
+        self._timestamp = now
+
+        return self._tokens >= 1
+
+    def take_token(self) -> None:
+
+        if self.rate:
+            self._tokens -= 1
+
+class TaskLimiter:
+    """Enforces the task limits defined in a limits file on the tasks dispatched by the master.
+
+    Each section of the limits file defines a limit for a key, that is either the class name of a task
+    or the resource key declared by a task (see BaseTask.resource_key):
+
+        [LustreOstMigrateTask]
+        max_in_flight = 64
+        rate          = 10
+        burst         = 20
+
+    A task is dispatched only if all limits matching the task are passed.
+    Tasks are counted in flight from dispatch until the master receives the finished message for the TID.
+
+    The limits file is reloaded by the master, if its modification time has changed.
+    """
+
+    RELOAD_CHECK_INTERVAL = 1
+
+    def __init__(self, limits_file: str) -> None:
+
+        self._limits_file = limits_file
+        self._limits_file_mtime = None
+        self._next_reload_check = 0
+
+        self._limit_dict = dict[str, TaskLimit]()
+        self._in_flight_dict = dict[str, int]()
+        self._tid_key_dict = dict[str, tuple]()
+
+        self.reload()
+
+    @staticmethod
+    def task_keys(task: BaseTask) -> tuple:
+
+        if task.resource_key:
+            return (task.class_name, task.resource_key)
+
+        return (task.class_name,)
+
+    def limited_key(self, task: BaseTask) -> str:
+        """Returns the key of the first limit not passed by the task, otherwise None."""
+
+        if task.tid in self._tid_key_dict:  # Resending a task already in flight is not limited again.
+            return None
+
+        for key in TaskLimiter.task_keys(task):
+
+            limit = self._limit_dict.get(key)
+
+            if not limit:
+                continue
+
+            if limit.max_in_flight and self._in_flight_dict.get(key, 0) >= limit.max_in_flight:
+                return key
+
+            if not limit.has_token():
+                return key
+
+        return None
+
+    def acquire(self, task: BaseTask) -> bool:
+        """Accounts the task as dispatched, if it passes all matching limits."""
+
+        if self.limited_key(task):
+            return False
+
+        if task.tid in self._tid_key_dict:
+            return True
+
+        keys = TaskLimiter.task_keys(task)
+
+        for key in keys:
+
+            limit = self._limit_dict.get(key)
+
+            if limit:
+                limit.take_token()
+
+            self._in_flight_dict[key] = self._in_flight_dict.get(key, 0) + 1
+
+        self._tid_key_dict[task.tid] = keys
+
+        return True
+
+    def release(self, tid: str) -> None:
+
+        keys = self._tid_key_dict.pop(tid, None)
+
+        if not keys:
+            return
+
+        for key in keys:
+
+            count = self._in_flight_dict[key] - 1
+
+            if count:
+                self._in_flight_dict[key] = count
+            else:
+                del self._in_flight_dict[key]
+
+    def in_flight(self, key: str) -> int:
+        return self._in_flight_dict.get(key, 0)
+
+    def check_reload(self) -> None:
+
+        now = time.monotonic()
+
+        if now < self._next_reload_check:
+            return
+
+        self._next_reload_check = now + TaskLimiter.RELOAD_CHECK_INTERVAL
+
+        try:
+
+            if os.path.getmtime(self._limits_file) != self._limits_file_mtime:
+                self.reload()
+
+        except Exception:
+            logging.exception("Failed to reload task limits file: %s", self._limits_file)
+
+    def reload(self) -> None:
+
+        if not os.path.isfile(self._limits_file):
+            raise IOError(f"The task limits file does not exist or is not a file: {self._limits_file}")
+
+        mtime = os.path.getmtime(self._limits_file)
+
+        config = configparser.ConfigParser()
+        config.read(self._limits_file)
+
+        limit_dict = dict[str, TaskLimit]()
+
+        for key in config.sections():
+
+            rate = config.getfloat(key, 'rate', fallback=0)
+
+            limit_dict[key] = TaskLimit(key,
+                                        config.getint(key, 'max_in_flight', fallback=0),
+                                        rate,
+                                        config.getfloat(key, 'burst', fallback=max(rate, 1)))
+
+        # Keep the token state of unchanged limits, so a reload does not grant a new burst.
+        for key, limit in limit_dict.items():
+
+            old_limit = self._limit_dict.get(key)
+
+            if old_limit and old_limit.rate == limit.rate and old_limit.burst == limit.burst:
+                limit_dict[key] = old_limit
+                old_limit.max_in_flight = limit.max_in_flight
+
+        self._limit_dict = limit_dict
+        self._limits_file_mtime = mtime
+
+        logging.info("Loaded task limits: %s", ', '.join(self._limit_dict.keys()) or 'none')
@@ -0,0 +1,38 @@
+#!/usr/bin/env python3
+#
+# -*- coding: utf-8 -*-
+#
+# © Copyright 2023 GSI Helmholtzzentrum für Schwerionenforschung
+#
+# This software is distributed under
+# the terms of the GNU General Public Licence version 3 (GPL Version 3),
+# copied verbatim in the file "LICENCE".
+
+"""Module for additional control components"""
+
+class TaskSource:
+    """Source of tasks attached to the master.
+
+    Tasks are popped from the task queue of the source and
+    the TIDs of finished tasks are pushed back into the result queue of the source.
+
+    If a task generator is set, the source is alive as long as the task generator is alive.
+    Otherwise the source is considered to be persistent, e.g. for task generators connected from remote.
+    """
+
+    def __init__(self, name: str, task_queue, result_queue, task_generator=None) -> None:
+
+        if not name:
+            raise RuntimeError('No name set for task source!')
+
+        self.name = name
+        self.task_queue = task_queue
+        self.result_queue = result_queue
+        self.task_generator = task_generator
+
+    def is_alive(self) -> bool:
+
+        if self.task_generator:
+            return self.task_generator.is_alive()
+
+        return True
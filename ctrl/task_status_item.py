@@ -20,9 +20,13 @@ class TaskState(object):
 
 class TaskStatusItem:
 
-    def __init__(self, tid, state, controller, timestamp):
+    def __init__(self, tid, state, controller, timestamp, source=None, task=None):
 
         self.tid = tid
         self.state = state
         self.controller = controller
         self.timestamp = timestamp
+        self.source = source
+
+        # The task is kept while assigned, so it can be dispatched again if returned by the controller.
+        self.task = task
@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+#
+# -*- coding: utf-8 -*-
+#
+# © Copyright 2023 GSI Helmholtzzentrum für Schwerionenforschung
+#
+# This software is distributed under
+# the terms of the GNU General Public Licence version 3 (GPL Version 3),
+# copied verbatim in the file "LICENCE".
+
+"""Module for additional control components"""
+
+from msg.base_message import BaseMessage
+from msg.task_assign import TaskAssign
+from msg.task_delta_assign import TaskDeltaAssign
+from msg.task_template_assign import TaskTemplateAssign
+from task.base_task import BaseTask
+
+class TaskTemplates:
+    """Encodes the tasks to assign by templates cached on the controllers.
+
+    The first task of a task class assigned to a controller session is sent completely as TaskTemplateAssign.
+    Following tasks of the same class are sent as TaskDeltaAssign with just the arguments differing from it,
+    e.g. the OST index of tasks created from the same XML skeleton.
+    A task with another timeout than its template is sent as new template.
+
+    A new session of a controller resets its templates, so templates are sent again after a reconnect.
+    Controllers without session get the complete TaskAssign.
+    """
+
+    def __init__(self) -> None:
+
+        self._template_id_dict = dict[type, str]()
+        self._session_dict = dict[str, tuple[str, dict[str, tuple[list[str], float]]]]()
+
+    def encode(self, controller: str, session: str, task: BaseTask) -> BaseMessage:
+
+        if not session:
+            return TaskAssign(task)
+
+        task_class = task.__class__
+
+        template_id = self._template_id_dict.get(task_class)
+
+        if not template_id:
+
+            template_id = str(len(self._template_id_dict) + 1)
+            self._template_id_dict[task_class] = template_id
+
+        controller_session = self._session_dict.get(controller)
+
+        if not controller_session or controller_session[0] != session:
+
+            controller_session = (session, dict[str, tuple[list[str], float]]())
+            self._session_dict[controller] = controller_session
+
+        task_args = TaskAssign.task_args(task, task_class)
+        template = controller_session[1].get(template_id)
+
+        if template is None or template[1] != task.timeout:
+
+            controller_session[1][template_id] = (task_args, task.timeout)
+
+            return TaskTemplateAssign(template_id, task)
+
+        template_args = template[0]
+
+        delta = {index: arg for index, arg in enumerate(task_args) if arg != template_args[index]}
+
+        return TaskDeltaAssign(template_id, task.tid, delta)
+
+    def forget(self, controller: str) -> None:
+        self._session_dict.pop(controller, None)
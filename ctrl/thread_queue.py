@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+#
+# -*- coding: utf-8 -*-
+#
+# © Copyright 2023 GSI Helmholtzzentrum für Schwerionenforschung
+#
+# This software is distributed under
+# the terms of the GNU General Public Licence version 3 (GPL Version 3),
+# copied verbatim in the file "LICENCE".
+
+"""Module for additional control components"""
+
+import queue
+import threading
+
+class ThreadQueue:
+    """Thread-safe counterpart of the SharedQueue for threads of the same process.
+
+    Provides the same access methods as the SharedQueue, but items are passed
+    by reference between the threads, so no pickling and no IPC is involved.
+
+    Used by the executors of the controller running tasks in threads.
+    """
+
+    def __init__(self):
+        self._queue = queue.SimpleQueue()
+        self._lock = threading.Lock()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.clear()
+
+    def clear(self):
+        """Clears all items from the queue."""
+
+        while self.pop_nowait() is not None:
+            pass
+
+    def push(self, item):
+        """Pushes an item into the queue."""
+
+        if not item:
+            raise RuntimeError("Passed item for thread queue push was not set!")
+
+        self._queue.put(item)
+
+    def pop_nowait(self):
+        """Returns an item from the queue or None if the queue is empty."""
+
+        try:
+            return self._queue.get_nowait()
+        except queue.Empty:
+            return None
+
+    def pop(self):
+        """Returns an item from the queue (blocking)."""
+        return self._queue.get()
+
+    def is_empty(self):
+        """Checks if the queue is empty."""
+        return self._queue.empty()
+
+    def __len__(self):
+        return self._queue.qsize()
+
+    @property
+    def lock(self):
+        """Returns the prehold internal lock used for critical sections."""
+        return self._lock
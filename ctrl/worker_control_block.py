@@ -0,0 +1,216 @@
+#!/usr/bin/env python3
+#
+# -*- coding: utf-8 -*-
+#
+# © Copyright 2023 GSI Helmholtzzentrum für Schwerionenforschung
+#
+# This software is distributed under
+# the terms of the GNU General Public Licence version 3 (GPL Version 3),
+# copied verbatim in the file "LICENCE".
+
+"""Module for additional control components"""
+
+import ctypes
+import multiprocessing
+import time
+
+TID_SIZE = 64
+STATUS_SIZE = 16
+RING_SIZE = 8
+
+# Counters wrap around at 32 bit, so the ring size must be a power of two.
+COUNTER_MASK = 0xFFFFFFFF
+
+# Max number of reads of a state slot, while its worker is writing it.
+MAX_READ_RETRY_COUNT = 100000
+
+class _CompletionEntry(ctypes.Structure):
+
+    _fields_ = [('tid', ctypes.c_char * TID_SIZE),
+                ('status', ctypes.c_char * STATUS_SIZE)]
+
+class _WorkerSlot(ctypes.Structure):
+
+    _fields_ = [('seq', ctypes.c_uint),
+                ('timestamp', ctypes.c_uint),
+                ('tid', ctypes.c_char * TID_SIZE),
+                ('head', ctypes.c_uint),
+                ('tail', ctypes.c_uint),
+                ('ring', _CompletionEntry * RING_SIZE)]
+
+class WorkerControlBlock:
+    """Single shared memory block with a state slot and a completion ring per worker, accessed without locks.
+
+    The block is shared by forked worker processes as well as by worker threads of the controller.
+
+    Each worker is the only writer of its state slot. A write is enclosed by incrementing the sequence
+    counter of the slot, so a reader retries on an odd or changed sequence counter instead of locking.
+    The states of all workers are kept in a byte array in front of the slots,
+    so the idle workers are counted by a single pass in C.
+
+    Each worker pushes the TID and status of its finished tasks to its own completion ring,
+    which is just popped by the controller. The worker advances the tail after writing an entry
+    and the controller the head after reading one, so each counter has a single writer.
+    """
+
+    def __init__(self, worker_count: int) -> None:
+
+        if worker_count < 1:
+            raise RuntimeError(f"Invalid worker count for worker control block: {worker_count}")
+
+        self._worker_count = worker_count
+        self._block = multiprocessing.RawArray(ctypes.c_byte, self._block_size(worker_count))
+
+        self._create_views()
+
+    def __getstate__(self):
+        return self._worker_count, self._block
+
+    def __setstate__(self, state):
+
+        self._worker_count, self._block = state
+        self._create_views()
+
+    @property
+    def worker_count(self) -> int:
+        return self._worker_count
+
+    @staticmethod
+    def is_valid_tid(tid: str) -> bool:
+        """Checks if the TID fits into a state slot and a completion ring entry."""
+        return len(tid.encode()) <= TID_SIZE
+
+    def set_state(self, index: int, state: int, tid: str = '') -> None:
+        """Sets the state of a worker, must just be called by the worker itself."""
+
+        encoded_tid = WorkerControlBlock._encode_tid(tid)
+
+        slot = self._slots[index]
+
+        slot.seq = slot.seq + 1
+
+        try:
+
+            self._states[index] = state
+            slot.tid = encoded_tid
+            slot.timestamp = int(time.time())
+
+        finally:
+            slot.seq = slot.seq + 1
+
+    def state(self, index: int) -> tuple[int, str, int]:
+        """Returns a consistent snapshot of the state, TID and timestamp of a worker."""
+
+        slot = self._slots[index]
+
+        for _ in range(MAX_READ_RETRY_COUNT):
+
+            seq = slot.seq
+
+            if seq & 1:
+                # The worker is writing its slot right now.
+                time.sleep(0)
+                continue
+
+            snapshot = (self._states[index], slot.tid.decode(), slot.timestamp)
+
+            if slot.seq == seq:
+                return snapshot
+
+        raise RuntimeError(f"No consistent state of worker readable from worker control block: {index}")
+
+    def recover(self, index: int) -> None:
+        """Makes the state slot of a worker consistent again, that died while writing it, must just be called after it died."""
+
+        slot = self._slots[index]
+
+        if slot.seq & 1:
+            slot.seq = slot.seq + 1
+
+    def count(self, state: int) -> int:
+        """Returns the number of workers in the state."""
+        return bytes(self._states).count(state)
+
+    def push_result(self, index: int, tid: str, status: str) -> None:
+        """Pushes the result of a finished task to the completion ring of a worker, must just be called by the worker.
+
+        The controller pushes the result of a task of a dead worker instead of it.
+        """
+
+        encoded_tid = WorkerControlBlock._encode_tid(tid)
+
+        slot = self._slots[index]
+        tail = slot.tail
+
+        # Rarely the controller has not popped the previous results yet.
+        while ((tail - slot.head) & COUNTER_MASK) >= RING_SIZE:
+            time.sleep(0.001)
+
+        entry = slot.ring[tail % RING_SIZE]
+        entry.tid = encoded_tid
+        entry.status = status.encode()
+
+        slot.tail = (tail + 1) & COUNTER_MASK
+
+    def has_result(self, index: int, tid: str) -> bool:
+        """Checks if the result of the task is in the completion ring of a worker, not popped by the controller yet."""
+
+        slot = self._slots[index]
+        head = slot.head
+        tail = slot.tail
+        encoded_tid = tid.encode()
+
+        return any(slot.ring[(head + i) % RING_SIZE].tid == encoded_tid for i in range((tail - head) & COUNTER_MASK))
+
+    def pop_result(self) -> tuple[str, str]:
+        """Pops the result of a finished task from the completion rings or returns None, must just be called by the controller.
+
+        The rings are scanned starting after the ring popped last, so no worker is preferred.
+        """
+
+        for _ in range(self._worker_count):
+
+            index = self._cursor
+            self._cursor = (index + 1) % self._worker_count
+
+            slot = self._slots[index]
+            head = slot.head
+
+            if head != slot.tail:
+
+                entry = slot.ring[head % RING_SIZE]
+                result = (entry.tid.decode(), entry.status.decode())
+
+                slot.head = (head + 1) & COUNTER_MASK
+
+                return result
+
+        return None
+
+    @staticmethod
+    def _encode_tid(tid: str) -> bytes:
+
+        encoded_tid = tid.encode()
+
+        if len(encoded_tid) > TID_SIZE:
+            raise RuntimeError(f"TID exceeds max size of {TID_SIZE} bytes for worker control block: {tid}")
+
+        return encoded_tid
+
+    @staticmethod
+    def _block_size(worker_count: int) -> int:
+        return WorkerControlBlock._slots_offset(worker_count) + worker_count * ctypes.sizeof(_WorkerSlot)
+
+    @staticmethod
+    def _slots_offset(worker_count: int) -> int:
+
+        alignment = ctypes.alignment(_WorkerSlot)
+
+        return (worker_count + alignment - 1) // alignment * alignment
+
+    def _create_views(self) -> None:
+
+        self._states = (ctypes.c_byte * self._worker_count).from_buffer(self._block)
+        self._slots = (_WorkerSlot * self._worker_count).from_buffer(self._block,
+                                                                     self._slots_offset(self._worker_count))
+        self._cursor = 0
@@ -9,32 +9,57 @@
 # copied verbatim in the file "LICENCE".
 
 import argparse
+import contextlib
 import logging
-import multiprocessing
-import os
 import signal
 import sys
 import time
+import uuid
 
-from worker import Worker
-from worker import WorkerState
-from worker import WorkerStateTableItem
+from collections import deque
+
+import zmq
+
+from comm.broadcast_subscriber_handler import BroadcastSubscriberCommHandler
 from comm.controller_handler import ControllerCommHandler
+from comm.heartbeat_sender_handler import HeartbeatSenderCommHandler
 from conf.controller_config_file_reader import ControllerConfigFileReader
 from ctrl.pid_control import PIDControl
-from ctrl.critical_section import CriticalSection
-from ctrl.shared_queue import SharedQueue
+from ctrl.notification_pipe import NotificationPipe
+from ctrl.range_task_tracker import RangeTaskTracker
+from ctrl.task_cancellation import TaskCancellation
+from executor.executor_factory import ExecutorFactory
+from executor.worker_autoscaler import WorkerAutoscaler
+from executor.worker_supervisor import WorkerSupervisor
+from msg.control_command import ControlCommand
+from msg.exit_notification import ExitNotification
 from msg.message_factory import MessageFactory
 from msg.message_type import MessageType
 from msg.task_finished import TaskFinished
+from msg.task_finished_batch import TaskFinishedBatch
 from msg.task_request import TaskRequest
+from msg.task_return import TaskReturn
 from msg.heartbeat import Heartbeat
-from task.poison_pill import PoisonPill
+from task.range_task import RangeTask
 from version import cyclone
 from version.minimal_python import MinimalPython
 
 RUN_CONDITION = True
 
+# Conditions set by control commands broadcasted by the master.
+PAUSE_CONDITION = False
+DRAIN_CONDITION = False
+EXIT_CONDITION = False
+CONFIG_EPOCH = None
+
+# Max seconds the controller loop waits for events, so worker states are checked at least with this interval.
+MAX_POLL_WAIT = 1.0
+
+# Interval in seconds of heartbeats on the communication channel, while no task is requested.
+MAIN_HEARTBEAT_INTERVAL = 1.0
+
+TASK_ASSIGN_TYPES = (MessageType.TASK_ASSIGN(), MessageType.TASK_TEMPLATE_ASSIGN(), MessageType.TASK_DELTA_ASSIGN())
+
 def init_arg_parser():
 
     parser = argparse.ArgumentParser(description='Cyclone Controller')
@@ -73,95 +98,307 @@ def init_logging(log_filename, enable_debug):
     else:
         logging.basicConfig(level=log_level, format="%(asctime)s - %(levelname)s: %(message)s")
 
-def create_worker_ids(worker_count):
+def stop_run_condition():
 
-    worker_ids = []
+    global RUN_CONDITION
 
-    for i in range(0, worker_count):
-        worker_ids.append(f"WORKER_{i}")
+    if RUN_CONDITION:
+        RUN_CONDITION = False
 
-    return worker_ids
+def process_broadcast(broadcast_handler, task_cancellation, range_task_tracker):
+    """Processes all pending control commands and returns True, if the configuration epoch has changed."""
 
-def create_worker_state_table(worker_ids):
+    global PAUSE_CONDITION
+    global DRAIN_CONDITION
+    global EXIT_CONDITION
+    global CONFIG_EPOCH
 
-    worker_state_table = {}
-    len_worker_ids = len(worker_ids)
+    epoch_changed = False
 
-    for i in range(0, len_worker_ids):
-        worker_state_table[worker_ids[i]] = WorkerStateTableItem()
+    while True:
 
-    len_worker_state_table = len(worker_state_table)
+        in_raw_data = broadcast_handler.recv_string()
 
-    if len_worker_state_table != len_worker_ids:
-        raise RuntimeError(f"Inconsistent worker state table size found: {len_worker_state_table}"
-                           f" - expected: {len_worker_ids}")
+        if not in_raw_data:
+            break
 
-    return worker_state_table
+        logging.debug("Received broadcast message: %s", in_raw_data)
 
-def create_worker(worker_state_table,
-                  lock_worker_state_table,
-                  task_queue,
-                  result_queue,
-                  cond_result_queue):
+        in_msg = MessageFactory.create(in_raw_data)
 
-    worker_handle_dict = {}
+        if MessageType.CONTROL_COMMAND() != in_msg.type():
+            raise RuntimeError(f"Undefined type found in broadcast message: {in_raw_data}")
 
-    for worker_id in worker_state_table.keys():
+        command = in_msg.command
 
-        worker_state_table_item = worker_state_table[worker_id]
+        if command == ControlCommand.EXIT:
 
-        worker_handle = \
-            Worker(worker_id,
-                   worker_state_table_item,
-                   lock_worker_state_table,
-                   task_queue,
-                   result_queue,
-                   cond_result_queue)
+            logging.info('Received exit command from master...')
+            EXIT_CONDITION = True
 
-        worker_handle_dict[worker_id] = worker_handle
+        elif command == ControlCommand.DRAIN:
 
-    return worker_handle_dict
+            if not DRAIN_CONDITION:
+                logging.info('Received drain command from master...')
 
-def start_worker(worker_handle_dict, worker_state_table):
+            DRAIN_CONDITION = True
 
-    if not worker_handle_dict:
-        raise RuntimeError("Empty worker handle dict!")
+        elif command == ControlCommand.PAUSE:
 
-    if not worker_state_table:
-        raise RuntimeError("Empty worker state table!")
+            if not PAUSE_CONDITION:
+                logging.info('Received pause command from master...')
 
-    if len(worker_handle_dict) != len(worker_state_table):
-        raise RuntimeError("Different sizes in worker handle dict and worker state table detected!")
+            PAUSE_CONDITION = True
 
-    for worker_id in worker_handle_dict.keys():
-        worker_handle_dict[worker_id].start()
+        elif command == ControlCommand.RESUME:
 
-    max_retry_count = 3
-    for retry_count in range(1, max_retry_count + 1):
+            if PAUSE_CONDITION:
+                logging.info('Received resume command from master...')
 
-        worker_ready = True
+            PAUSE_CONDITION = False
 
-        for worker_id in worker_handle_dict.keys():
+        elif command == ControlCommand.EPOCH:
 
-            if not (worker_handle_dict[worker_id].is_alive()
-                    and worker_state_table[worker_id].get_state == WorkerState.READY):
-                worker_ready = False
+            epoch = int(in_msg.value)
 
-        if worker_ready:
-            return True
+            if CONFIG_EPOCH is not None and CONFIG_EPOCH != epoch:
+                epoch_changed = True
 
-        wait_time = retry_count * retry_count
-        logging.debug("Waiting for worker to be READY - Waiting seconds: %i", wait_time)
-        time.sleep(wait_time)
+            CONFIG_EPOCH = epoch
 
-    return False
+        elif command == ControlCommand.CANCEL:
 
-def stop_run_condition():
+            # A range task is cancelled by its tasks in progress.
+            for tid in range_task_tracker.task_tids(in_msg.value):
+
+                if task_cancellation.request(tid):
+                    logging.info("Received cancel command from master for task: %s", tid)
+                else:
+                    logging.debug("Ignoring cancel command for task not in progress: %s", tid)
+
+    return epoch_changed
+
+def is_drained(executor, task_cancellation):
+
+    if executor.has_queued():
+        return False
+
+    # Results might not be reported yet, though the workers are not executing anymore.
+    if task_cancellation.in_progress_count:
+        return False
+
+    return not executor.is_executing()
+
+def send_exit_notification(comm_handler):
+
+    logging.info('Notifying master about exit...')
+
+    comm_handler.send_string(ExitNotification(comm_handler.fqdn).to_string())
+
+    if not comm_handler.recv_string():
+        logging.warning('No response received from master on exit notification')
+
+def create_autoscaler(config_file_reader):
+
+    if not config_file_reader.autoscale:
+        return None
+
+    return WorkerAutoscaler(config_file_reader.worker_count_min,
+                            config_file_reader.autoscale_max_load,
+                            config_file_reader.autoscale_min_mem_available,
+                            config_file_reader.autoscale_idle_timeout,
+                            config_file_reader.autoscale_interval)
+
+def create_supervisor(config_file_reader):
+
+    return WorkerSupervisor(config_file_reader.worker_respawn,
+                            config_file_reader.worker_respawn_backoff,
+                            config_file_reader.worker_respawn_backoff_max,
+                            config_file_reader.worker_max_tasks,
+                            config_file_reader.worker_max_rss * 1024 * 1024)
+
+def has_task_capacity(executor, task_cancellation, prefetch_depth):
+    """Checks if the tasks in progress leave room for another task to be executed or prefetched.
+
+    Prefetched tasks wait in the task queue, so workers go straight from one task to the next.
+    """
+
+    return task_cancellation.in_progress_count < executor.alive_count() + prefetch_depth
+
+def create_task_return(fqdn, executor, range_task_tracker, task_cancellation):
+    """Pops the tasks not taken by the workers yet and returns the message to return them to the master or None."""
+
+    tid_list = []
+
+    for task in executor.pop_queued():
+
+        task_cancellation.finish(task.tid)
+
+        tid = range_task_tracker.return_task(task.tid)
+
+        if tid:
+            tid_list.append(tid)
+
+    if not tid_list:
+        return None
+
+    logging.info("Returning tasks not executed to master: %i", len(tid_list))
+
+    return TaskReturn(fqdn, tid_list)
+
+def report_finished_tasks(comm_handler, finished_item_list, finish_batch_size):
+
+    while finished_item_list:
+
+        comm_handler.send_string(create_task_finished(comm_handler.fqdn,
+                                                      finished_item_list,
+                                                      finish_batch_size).to_string())
+
+        if not comm_handler.recv_string():
+            logging.warning('No response received from master on finished tasks')
+            break
+
+def return_queued_tasks(comm_handler, executor, range_task_tracker, task_cancellation):
+
+    task_return = create_task_return(comm_handler.fqdn, executor, range_task_tracker, task_cancellation)
+
+    if not task_return:
+        return
+
+    comm_handler.send_string(task_return.to_string())
+
+    if not comm_handler.recv_string():
+        logging.warning('No response received from master on returned tasks')
+
+def pop_results(notification_pipe, executor, range_task_tracker, task_cancellation, fqdn):
+    """Pops the results notified by the workers.
+
+    Returns the items of TID and status of the finished tasks and the message to return expired tasks or None.
+    """
+
+    finished_item_list = []
+    returned_tid_list = []
+
+    # Each notification is written after its result was pushed, so a result is available for each notification.
+    for _ in range(notification_pipe.clear()):
+
+        tid, status = executor.pop_result()
+
+        task_cancellation.finish(tid)
+
+        # Expired prefetched tasks are returned to the master instead of being reported as finished.
+        if status == TaskReturn.STATUS_RETURNED:
+
+            task_id = range_task_tracker.return_task(tid)
+
+            if task_id:
+                returned_tid_list.append(task_id)
+
+            continue
+
+        # Tasks of a range task are reported once the range task is finished.
+        task_id = range_task_tracker.finish(tid, status)
+
+        if task_id:
+
+            status = range_task_tracker.pop_status(task_id)
+
+            logging.debug("Finished task with status %s: %s", status, task_id)
+            finished_item_list.append((task_id, status))
+
+    if returned_tid_list:
+
+        logging.info("Returning expired tasks to master: %i", len(returned_tid_list))
+        return finished_item_list, TaskReturn(fqdn, returned_tid_list)
+
+    return finished_item_list, None
+
+def create_task_finished(fqdn, finished_item_list, finish_batch_size):
+    """Pops up to the batch size of finished tasks from the list and returns the message to report them."""
+
+    item_list = finished_item_list[:finish_batch_size]
+    del finished_item_list[:finish_batch_size]
+
+    if len(item_list) == 1:
+        return TaskFinished(fqdn, *item_list[0])
+
+    return TaskFinishedBatch(fqdn, item_list)
+
+def process_response(in_msg, task_template_dict, executor, range_task_tracker, task_cancellation, prefetch_timeout):
+    """Processes the response of the master and returns the duration in seconds to wait before requesting a task."""
 
     global RUN_CONDITION
 
-    if RUN_CONDITION:
+    in_msg_type = in_msg.type()
+
+    if in_msg_type in TASK_ASSIGN_TYPES:
+
+        task = create_task(in_msg, task_template_dict)
+        logging.debug("Received task assign for: %s", task.tid)
+        push_task(task, executor, range_task_tracker, task_cancellation, prefetch_timeout)
+        logging.debug("Pushed task to executor: %s", task.tid)
+
+    elif MessageType.WAIT_COMMAND() == in_msg_type:
+
+        logging.debug("Received wait command with duration: %fs", in_msg.duration)
+        return in_msg.duration
+
+    elif MessageType.EXIT_COMMAND() == in_msg_type:
+
         RUN_CONDITION = False
+        logging.info('Received exit message from master...')
+
+    return 0
+
+def create_session():
+    """Returns a new session id, so the master sends the task templates again."""
+    return uuid.uuid4().hex[:8]
+
+def create_task(in_msg, task_template_dict):
+    """Creates the task of an assign message, task templates are cached in the dict by their template id."""
+
+    in_msg_type = in_msg.type()
+
+    if MessageType.TASK_TEMPLATE_ASSIGN() == in_msg_type:
+
+        task_template_dict[in_msg.template_id] = in_msg
+        return in_msg.to_task()
+
+    if MessageType.TASK_DELTA_ASSIGN() == in_msg_type:
+
+        if in_msg.template_id not in task_template_dict:
+            raise RuntimeError(f"No task template cached for task: {in_msg.tid}")
+
+        return in_msg.to_task(task_template_dict[in_msg.template_id])
+
+    return in_msg.to_task()
+
+def push_task(task, executor, range_task_tracker, task_cancellation, prefetch_timeout):
+    """Pushes the task to the executor, range tasks are expanded into their tasks.
+
+    A task not taken by a worker within the prefetch timeout expires and is returned to the master.
+    Tasks expanded from a range task wait for each other in the task queue, so they do not expire.
+    """
+
+    if not isinstance(task, RangeTask):
+
+        if prefetch_timeout:
+            task.set_ttl(prefetch_timeout)
+
+        task_cancellation.add(task.tid)
+        executor.push(task)
+        return
+
+    task_list = task.expand()
+
+    range_task_tracker.add(task.tid, task_list)
+
+    logging.debug("Expanded range task %s into tasks: %i", task.tid, len(task_list))
+
+    for expanded_task in task_list:
+
+        task_cancellation.add(expanded_task.tid)
+        executor.push(expanded_task)
 
 def signal_handler(signum : signal.Signals, frame) -> None:
     # pylint: disable=unused-argument
@@ -198,8 +435,13 @@ def main():
                 ControllerCommHandler(config_file_reader.comm_target,
                                       config_file_reader.comm_port,
                                       config_file_reader.poll_timeout) as comm_handler, \
-                SharedQueue() as result_queue, \
-                SharedQueue() as task_queue:
+                NotificationPipe() as notification_pipe, \
+                ExecutorFactory.create(config_file_reader.executor,
+                                       config_file_reader.worker_count,
+                                       notification_pipe,
+                                       create_autoscaler(config_file_reader),
+                                       create_supervisor(config_file_reader)) as executor, \
+                contextlib.ExitStack() as exit_stack:
 
             if pid_control.lock():
 
@@ -217,235 +459,317 @@ def main():
 
                 comm_handler.connect()
 
-                request_retry_count = 0
-                request_retry_wait_duration = config_file_reader.request_retry_wait_duration
-                max_num_request_retries = config_file_reader.max_num_request_retries
+                broadcast_handler = None
+
+                if config_file_reader.broadcast_port:
 
-                lock_worker_state_table = multiprocessing.Lock()
-                lock_result_queue = multiprocessing.Lock()
+                    broadcast_handler = \
+                        exit_stack.enter_context(BroadcastSubscriberCommHandler(config_file_reader.comm_target,
+                                                                                config_file_reader.broadcast_port,
+                                                                                0))
+                    broadcast_handler.connect()
 
-                cond_result_queue = multiprocessing.Condition(lock_result_queue)
+                heartbeat_handler = None
+                next_heartbeat_timestamp = 0
 
-                worker_count = config_file_reader.worker_count
-                worker_ids = create_worker_ids(worker_count)
-                worker_state_table = create_worker_state_table(worker_ids)
+                if config_file_reader.heartbeat_port:
 
-                worker_handle_dict = \
-                    create_worker(worker_state_table,
-                                  lock_worker_state_table,
-                                  task_queue,
-                                  result_queue,
-                                  cond_result_queue)
+                    heartbeat_handler = \
+                        exit_stack.enter_context(HeartbeatSenderCommHandler(config_file_reader.comm_target,
+                                                                            config_file_reader.heartbeat_port,
+                                                                            0))
+                    heartbeat_handler.connect()
+
+                session = create_session()
+                task_template_dict = {}
+                range_task_tracker = RangeTaskTracker()
+                task_cancellation = TaskCancellation()
+
+                request_retry_count = 0
+                request_retry_wait_duration = config_file_reader.request_retry_wait_duration
+                max_num_request_retries = config_file_reader.max_num_request_retries
 
                 global RUN_CONDITION
 
-                if not start_worker(worker_handle_dict, worker_state_table):
+                logging.info("Starting %s executor with worker: %i", config_file_reader.executor, executor.worker_count)
+
+                if not executor.start():
 
                     logging.error("Not all worker are ready!")
                     RUN_CONDITION = False
 
+                # A single poller waits for the response of the master, the results of the workers
+                # and control commands, so finished tasks are reported while waiting to request a task.
+                poller = zmq.Poller()
+                poller.register(comm_handler.socket, zmq.POLLIN)
+                poller.register(notification_pipe, zmq.POLLIN)
+
+                if broadcast_handler:
+                    poller.register(broadcast_handler.socket, zmq.POLLIN)
+
+                # Finished tasks are reported in batches, flushed by the batch size or after the batch window.
+                finished_item_list = []
+                finish_flush_timestamp = 0
+
+                return_msg_deque = deque()
+
+                # Just one message is sent to the master at a time, until its response is received.
+                pending_msg = None
+                response_deadline = 0
+                response_retried = False
+
+                next_send_timestamp = 0
+                next_request_timestamp = 0
+                next_main_heartbeat_timestamp = 0
+
                 while RUN_CONDITION:
 
                     try:
 
-                        send_msg = None
+                        if broadcast_handler and process_broadcast(broadcast_handler,
+                                                                   task_cancellation,
+                                                                   range_task_tracker):
 
-                        if not send_msg:
+                            logging.info("Configuration epoch changed to %i - Reloading config file", CONFIG_EPOCH)
 
-                            with CriticalSection(cond_result_queue):
+                            config_file_reader = ControllerConfigFileReader(args.config_file)
+                            request_retry_wait_duration = config_file_reader.request_retry_wait_duration
+                            max_num_request_retries = config_file_reader.max_num_request_retries
 
-                                if not result_queue.is_empty():
+                        if heartbeat_handler and time.time() >= next_heartbeat_timestamp:
 
-                                    task_id = result_queue.pop_nowait()
+                            if not heartbeat_handler.send_string(Heartbeat(comm_handler.fqdn).to_string()):
+                                logging.debug('Dropped heartbeat')
 
-                                    if task_id:
+                            next_heartbeat_timestamp = time.time() + config_file_reader.heartbeat_interval
 
-                                        logging.debug("Finished task: %s", task_id)
-                                        send_msg = TaskFinished(comm_handler.fqdn, task_id)
+                        executor.process(task_cancellation)
 
-                        if not send_msg:
+                        popped_item_list, task_return = pop_results(notification_pipe,
+                                                                    executor,
+                                                                    range_task_tracker,
+                                                                    task_cancellation,
+                                                                    comm_handler.fqdn)
 
-                            found_ready_worker = False
+                        if popped_item_list:
 
-                            with CriticalSection(lock_worker_state_table):
+                            if not finished_item_list:
+                                finish_flush_timestamp = time.time() + config_file_reader.finish_batch_window
 
-                                for worker_id in worker_state_table.keys():
+                            finished_item_list.extend(popped_item_list)
 
-                                    if worker_handle_dict[worker_id].is_alive() \
-                                            and worker_state_table[worker_id].get_state == WorkerState.READY:
+                        if task_return:
+                            return_msg_deque.append(task_return)
 
-                                        found_ready_worker = True
-                                        break
+                        if task_cancellation.pending:
+                            executor.cancel(task_cancellation)
 
-                            if found_ready_worker:
+                        if not pending_msg:
 
-                                logging.debug('Requesting a task...')
+                            if EXIT_CONDITION:
 
-                                send_msg = TaskRequest(comm_handler.fqdn)
+                                # Prefetched tasks are returned first, so the master dispatches them again.
+                                task_return = create_task_return(comm_handler.fqdn,
+                                                                 executor,
+                                                                 range_task_tracker,
+                                                                 task_cancellation)
 
-                            else:
+                                if task_return:
+                                    return_msg_deque.appendleft(task_return)
+
+                                else:
 
-                                worker_count = len(worker_state_table)
-                                worker_count_not_active = 0
+                                    send_exit_notification(comm_handler)
+                                    RUN_CONDITION = False
+                                    continue
 
-                                for worker_id in worker_state_table.keys():
+                            send_msg = None
+                            now = time.time()
 
-                                    if not worker_handle_dict[worker_id].is_alive():
-                                        worker_count_not_active += 1
+                            if now < next_send_timestamp:
+                                pass
 
-                                if worker_count == worker_count_not_active:
+                            elif return_msg_deque:
+                                send_msg = return_msg_deque.popleft()
 
-                                    logging.error('No worker are alive!')
-                                    RUN_CONDITION = False
+                            elif finished_item_list and (len(finished_item_list) >= config_file_reader.finish_batch_size
+                                                         or now >= finish_flush_timestamp):
 
-                                else:   # Available worker are busy
+                                send_msg = create_task_finished(comm_handler.fqdn,
+                                                                finished_item_list,
+                                                                config_file_reader.finish_batch_size)
 
-                                    with CriticalSection(cond_result_queue):
+                                finish_flush_timestamp = now + config_file_reader.finish_batch_window
 
-                                        wait_timeout_result_queue = 1
+                            elif DRAIN_CONDITION and executor.has_queued():
 
-                                        cond_result_queue.wait(wait_timeout_result_queue)
+                                # Prefetched tasks are not executed anymore on drain.
+                                send_msg = create_task_return(comm_handler.fqdn,
+                                                              executor,
+                                                              range_task_tracker,
+                                                              task_cancellation)
 
-                                        if result_queue.is_empty():
-                                            send_msg = Heartbeat(comm_handler.fqdn)
+                            elif DRAIN_CONDITION and not finished_item_list \
+                                    and is_drained(executor, task_cancellation):
 
-                        if send_msg:
+                                logging.info('Drained all tasks')
 
-                            if logging.root.isEnabledFor(logging.DEBUG):
-                                # TODO: remove redundant call of send_msg.to_string()
-                                logging.debug("Sending message to master: %s", send_msg.to_string())
+                                send_exit_notification(comm_handler)
+                                RUN_CONDITION = False
+                                continue
 
-                            comm_handler.send_string(send_msg.to_string())
+                            elif not executor.alive_count():
 
-# Check for response and process it.
-# Used redundant - TODO: make a class method.
-################################################################################
-                            in_raw_data = comm_handler.recv_string()
+                                logging.error('No worker are alive!')
+                                RUN_CONDITION = False
+                                continue
 
-                            if in_raw_data:
+                            elif not PAUSE_CONDITION and not DRAIN_CONDITION \
+                                    and has_task_capacity(executor,
+                                                          task_cancellation,
+                                                          config_file_reader.prefetch_depth):
 
-                                logging.debug("Received message: %s", in_raw_data)
+                                if now >= next_request_timestamp:
 
-                                in_msg = MessageFactory.create(in_raw_data)
-                                in_msg_type = in_msg.type()
+                                    logging.debug('Requesting a task...')
 
-                                if MessageType.TASK_ASSIGN() == in_msg_type:
+                                    send_msg = TaskRequest(comm_handler.fqdn, session)
 
-                                    task = in_msg.to_task()
-                                    logging.debug("Received task assign for: %s", task.tid)
-                                    task_queue.push(task)
-                                    logging.debug("Pushed task to task queue: %s", task.tid)
+                            # Liveness is signaled on the heartbeat channel if available.
+                            elif not heartbeat_handler and now >= next_main_heartbeat_timestamp:
 
-                                elif MessageType.ACKNOWLEDGE() == in_msg_type:
-                                    pass
+                                send_msg = Heartbeat(comm_handler.fqdn)
+                                next_main_heartbeat_timestamp = now + MAIN_HEARTBEAT_INTERVAL
 
-                                elif MessageType.WAIT_COMMAND() == in_msg_type:
+                            if send_msg:
 
-                                    #TODO: Implement it on the master side!
-                                    wait_duration = in_msg.duration
-                                    logging.debug("Received wait command with duration: %fs", wait_duration)
-                                    time.sleep(wait_duration)
+                                if logging.root.isEnabledFor(logging.DEBUG):
+                                    # TODO: remove redundant call of send_msg.to_string()
+                                    logging.debug("Sending message to master: %s", send_msg.to_string())
 
-                                elif MessageType.EXIT_COMMAND() == in_msg_type:
+                                comm_handler.send_string(send_msg.to_string())
 
-                                    RUN_CONDITION = False
-                                    logging.info('Received exit message from master...')
+                                pending_msg = send_msg
+                                response_deadline = time.time() + config_file_reader.poll_timeout / 1000.0
 
-                                if request_retry_count:
-                                    request_retry_count = 0
-################################################################################
+                        now = time.time()
 
-                            else:
+                        if pending_msg:
+                            timer_list = [response_deadline]
+                        else:
+                            timer_list = [next_send_timestamp, next_request_timestamp, next_main_heartbeat_timestamp]
 
-                                if request_retry_count == max_num_request_retries:
+                            if finished_item_list:
+                                timer_list.append(finish_flush_timestamp)
 
-                                    logging.info('Exiting, since maximum retry count is reached!')
-                                    comm_handler.disconnect()
-                                    RUN_CONDITION = False
+                        if heartbeat_handler:
+                            timer_list.append(next_heartbeat_timestamp)
+
+                        poll_wait = min([timer - now for timer in timer_list if timer > now] + [MAX_POLL_WAIT])
+
+                        events = dict(poller.poll(poll_wait * 1000))
+
+                        if pending_msg and events.get(comm_handler.socket) == zmq.POLLIN:
+
+                            in_raw_data = comm_handler.recv_string()
+
+                            if in_raw_data:
 
-                                time.sleep(request_retry_wait_duration)
+                                logging.debug("Received message: %s", in_raw_data)
+
+                                pending_msg = None
+                                response_retried = False
+                                request_retry_count = 0
 
-# Check for response and process it.
-# Used redundant - TODO: make a class method.
-################################################################################
-                                in_raw_data = comm_handler.recv_string()
+                                wait_duration = process_response(MessageFactory.create(in_raw_data),
+                                                                 task_template_dict,
+                                                                 executor,
+                                                                 range_task_tracker,
+                                                                 task_cancellation,
+                                                                 config_file_reader.prefetch_timeout)
 
-                                if in_raw_data:
+                                if wait_duration:
+                                    next_request_timestamp = time.time() + wait_duration
 
-                                    logging.debug("Received message: %s", in_raw_data)
+                        elif pending_msg and time.time() >= response_deadline:
 
-                                    in_msg = MessageFactory.create(in_raw_data)
-                                    in_msg_type = in_msg.type()
+                            if not response_retried:
 
-                                    if MessageType.TASK_ASSIGN() == in_msg_type:
+                                if request_retry_count == max_num_request_retries:
 
-                                        task = in_msg.to_task()
-                                        logging.debug("Received task assign for: %s", task.tid)
-                                        task_queue.push(task)
-                                        logging.debug("Pushed task to task queue: %s", task.tid)
+                                    logging.info('Exiting, since maximum retry count is reached!')
+                                    comm_handler.disconnect()
+                                    RUN_CONDITION = False
+                                    continue
 
-                                    elif MessageType.ACKNOWLEDGE() == in_msg_type:
-                                        pass
+                                # Gives the master another chance to respond before reconnecting.
+                                response_retried = True
+                                response_deadline = \
+                                    time.time() + request_retry_wait_duration + config_file_reader.poll_timeout / 1000.0
 
-                                    elif MessageType.WAIT_COMMAND() == in_msg_type:
+                            else:
 
-                                        #TODO: Implement it on the master side!
-                                        wait_duration = in_msg.duration
-                                        logging.debug("Received wait command with duration: %fs", wait_duration)
-                                        time.sleep(wait_duration)
+                                logging.debug('No response received - Reconnecting...')
 
-                                    elif MessageType.EXIT_COMMAND() == in_msg_type:
+                                poller.unregister(comm_handler.socket)
+                                comm_handler.reconnect()
+                                poller.register(comm_handler.socket, zmq.POLLIN)
 
-                                        RUN_CONDITION = False
-                                        logging.info('Received exit message from master...')
+                                # A lost response might have contained a task template.
+                                session = create_session()
+                                task_template_dict.clear()
+                                request_retry_count += 1
 
-                                    if request_retry_count:
-                                        request_retry_count = 0
-################################################################################
+                                # Finished and returned tasks are reported again, since the message might be lost.
+                                if pending_msg.type() in (MessageType.TASK_FINISHED(),
+                                                          MessageType.TASK_FINISHED_BATCH(),
+                                                          MessageType.TASK_RETURN()):
+                                    return_msg_deque.appendleft(pending_msg)
 
-                                else:
+                                pending_msg = None
+                                response_retried = False
 
-                                    logging.debug('No response received - Reconnecting...')
-                                    comm_handler.reconnect()
-                                    request_retry_count += 1
+                                # Backs off from sending further messages the more retries failed.
+                                next_send_timestamp = time.time() + request_retry_wait_duration * request_retry_count
 
                     except Exception:
 
                         RUN_CONDITION = False
                         logging.exception('Caught exception in main loop')
 
-                if not RUN_CONDITION:
+                # Finished tasks not reported yet are reported and prefetched tasks are returned on shutdown
+                # e.g. by signal, while the master is still reachable.
+                if comm_handler.is_connected and (pending_msg or finished_item_list or executor.has_queued()):
 
                     try:
 
-                        logging.info('Shutting down worker...')
+                        # The response of the master might still assign a task.
+                        if pending_msg:
 
-                        all_worker_down = False
-
-                        while not all_worker_down:
-
-                            found_active_worker = False
+                            in_raw_data = comm_handler.recv_string()
 
-                            for worker_id in worker_state_table.keys():
+                            if in_raw_data:
+                                process_response(MessageFactory.create(in_raw_data),
+                                                 task_template_dict,
+                                                 executor,
+                                                 range_task_tracker,
+                                                 task_cancellation,
+                                                 config_file_reader.prefetch_timeout)
 
-                                if worker_handle_dict[worker_id].is_alive():
+                        report_finished_tasks(comm_handler, finished_item_list, config_file_reader.finish_batch_size)
 
-                                    os.kill(worker_handle_dict[worker_id].pid, signal.SIGUSR1)
+                        return_queued_tasks(comm_handler, executor, range_task_tracker, task_cancellation)
 
-                                    task_queue.push(PoisonPill())
+                    except Exception:
+                        logging.exception('Caught exception returning tasks to master')
 
-                                    logging.debug("Waiting for worker to complete: %s",
-                                                  worker_handle_dict[worker_id].name)
+                if not RUN_CONDITION:
 
-                                    found_active_worker = True
+                    try:
 
-                            if not found_active_worker:
-                                all_worker_down = True
-                                logging.debug('All worker are down.')
+                        logging.info('Shutting down worker...')
 
-                            else:
-                                logging.debug('Waiting for worker to shutdown...')
-                                time.sleep(1)
+                        executor.stop()
 
                     except Exception:
                         logging.exception('Caught exception terminating worker')
@@ -9,27 +9,23 @@
 # copied verbatim in the file "LICENCE".
 
 import argparse
-import importlib
+import contextlib
 import logging
-import os
 import signal
 import sys
-import time
 
 from comm.master_handler import MasterCommHandler
+from conf.config_value_error import ConfigValueError
 from conf.master_config_file_reader import MasterConfigFileReader
-from ctrl.task_status_item import TaskState
-from ctrl.task_status_item import TaskStatusItem
+from ctrl.master_async_engine import MasterAsyncEngine
+from ctrl.master_factory import MasterFactory
+from ctrl.master_frontend import MasterFrontend
 from ctrl.pid_control import PIDControl
 from ctrl.shared_queue import SharedQueue
 from ctrl.shared_queue_str import SharedQueueStr
-from ctrl.critical_section import CriticalSection
 from msg.exit_command import ExitCommand
 from msg.message_factory import MessageFactory
-from msg.message_type import MessageType
-from msg.acknowledge import Acknowledge
-from msg.task_assign import TaskAssign
-from msg.wait_command import WaitCommand
+from task.generator.task_generator_factory import TaskGeneratorFactory
 from version import cyclone
 from version.minimal_python import MinimalPython
 
@@ -101,251 +97,164 @@ def signal_handler(signum : signal.Signals, frame) -> None:
     else:
         logging.debug("Received unhandled signal: %i", signum)
 
-def check_all_controller_down(count_active_controller):
-
-    if not count_active_controller:
-
-        logging.info('Shutdown of controllers complete')
-        return True
-
-    logging.debug("Waiting for number of controllers to quit: %i", count_active_controller)
-    return False
-
-def create_task_generator(task_queue, result_queue, config_file_reader):
-
-    module_name = config_file_reader.task_gen_module
-    class_name = config_file_reader.task_gen_class
-    config_file = config_file_reader.task_gen_config_file
-
-    dynamic_module = importlib.import_module(module_name)
-    dynamic_class = getattr(dynamic_module, class_name)
-
-    return dynamic_class(task_queue, result_queue, config_file)
-
-def main():
-
-    MinimalPython.check()
+def run_sync_engine(config_file_reader):
 
     error_count = 0
     max_error_count = 100
 
     task_generator = None
+    generator_class = None
 
-    try:
+    if config_file_reader.task_gen_module:
 
-        args = init_arg_parser()
+        generator_class = \
+            TaskGeneratorFactory.load_class(config_file_reader.task_gen_module, config_file_reader.task_gen_class)
 
-        config_file_reader = MasterConfigFileReader(args.config_file)
+        if TaskGeneratorFactory.is_async(generator_class):
+            raise ConfigValueError(f"Task generator requires the asyncio engine: {config_file_reader.task_gen_class}")
 
-        init_logging(config_file_reader.log_filename, args.enable_debug)
+    core_target, core_port = MasterFactory.core_endpoint(config_file_reader)
 
-        with PIDControl(config_file_reader.pid_file) as pid_control, \
-                MasterCommHandler(config_file_reader.comm_target,
-                                  config_file_reader.comm_port,
-                                  config_file_reader.poll_timeout) as comm_handler, \
-                SharedQueue() as task_queue, \
-                SharedQueueStr() as result_queue:
+    with MasterCommHandler(core_target,
+                           core_port,
+                           config_file_reader.poll_timeout) as comm_handler, \
+            SharedQueue() as task_queue, \
+            SharedQueueStr() as result_queue, \
+            contextlib.ExitStack() as exit_stack:
 
-            if pid_control.lock():
+        signal.signal(signal.SIGHUP, signal_handler)
+        signal.signal(signal.SIGINT, signal_handler)
+        signal.signal(signal.SIGTERM, signal_handler)
 
-                logging.info('Started')
-                logging.info(f"Master PID: {pid_control.pid()}")
-                logging.info(f"Version: {cyclone.VERSION}")
+        signal.siginterrupt(signal.SIGHUP, True)
+        signal.siginterrupt(signal.SIGINT, True)
+        signal.siginterrupt(signal.SIGTERM, True)
 
-                signal.signal(signal.SIGHUP, signal_handler)
-                signal.signal(signal.SIGINT, signal_handler)
-                signal.signal(signal.SIGTERM, signal_handler)
+        comm_handler.connect()
 
-                signal.siginterrupt(signal.SIGHUP, True)
-                signal.siginterrupt(signal.SIGINT, True)
-                signal.siginterrupt(signal.SIGTERM, True)
+        try:
 
-                comm_handler.connect()
+            frontend_pool = MasterFactory.create_frontend_pool(config_file_reader, exit_stack)
 
-                controller_heartbeat_dict = {}
-                task_status_dict = {}
+            if generator_class:
+                task_generator = \
+                    MasterFactory.create_task_generator(config_file_reader, generator_class, task_queue, result_queue)
 
-                controller_timeout = config_file_reader.controller_timeout
-                controller_wait_duration = config_file_reader.controller_wait_duration
-                task_resend_timeout = config_file_reader.task_resend_timeout
+            broadcast_channel = MasterFactory.create_broadcast_channel(config_file_reader, exit_stack)
 
-                task_generator = create_task_generator(task_queue, result_queue, config_file_reader)
-                task_generator.start()
-
-                # TODO: Make a class for the master.
-                global TASK_DISTRIBUTION
+            dispatcher = \
+                MasterFactory.create_dispatcher(config_file_reader,
+                                                exit_stack,
+                                                task_generator,
+                                                task_queue,
+                                                result_queue,
+                                                broadcast_channel)
 
-                run_flag = True
+            if task_generator:
+                task_generator.start()
 
-                while run_flag:
+            while dispatcher.run_flag:
 
-                    try:
+                try:
 
-                        last_exec_timestamp = int(time.time())
+                    if not TASK_DISTRIBUTION:
+                        dispatcher.stop_task_distribution()
 
+                    if frontend_pool:
+                        recv_data = comm_handler.recv_pyobj()
+                    else:
                         recv_data = comm_handler.recv_string()
 
-                        send_msg = None
-
-                        if recv_data:
-
-                            logging.debug("Received message: %s", recv_data)
-
-                            recv_msg = MessageFactory.create(recv_data)
-                            recv_msg_type = recv_msg.type()
-
-                            # TODO: Caution, sender is not set everywhere!
-                            controller_heartbeat_dict[recv_msg.sender] = int(time.time())
-
-                            if TASK_DISTRIBUTION:
-
-                                if recv_msg_type == MessageType.TASK_REQUEST():
-
-                                    task = None
-
-                                    with CriticalSection(task_queue.lock, timeout=1) as critical_section:
-
-                                        if critical_section.is_locked():
-
-                                            if not task_queue.is_empty():
-                                                task = task_queue.pop_nowait()
-
-                                            else:
-
-                                                if not task_generator.is_alive():
-
-                                                    TASK_DISTRIBUTION = False
-                                                    controller_wait_duration = 0
-
-                                                    # Allow a TaskGenerator to quit itself without notifying the master.
-                                                    logging.info('Task Generator is not alive')
-
-                                    if task:
+                    if recv_data and frontend_pool:
 
-                                        do_task_assign = False
+                        # Responds in any case, otherwise the frontend process waits forever.
+                        decision = ExitCommand()
 
-                                        if task.tid in task_status_dict:
+                        try:
+                            decision = dispatcher.dispatch(MasterFrontend.decode_forwarded(recv_data))
+                        finally:
+                            comm_handler.send_pyobj(decision)
 
-                                            task_resend_threshold = \
-                                                (task_status_dict[task.tid].timestamp + task_resend_timeout)
+                    elif recv_data:
 
-                                            if task_status_dict[task.tid].state == TaskState.finished() \
-                                                    or last_exec_timestamp >= task_resend_threshold:
+                        logging.debug("Received message: %s", recv_data)
 
-                                                do_task_assign = True
+                        send_msg = dispatcher.process(MessageFactory.create(recv_data))
 
-                                            elif task_status_dict[task.tid].state == TaskState.assigned() \
-                                                    and last_exec_timestamp < task_resend_threshold:
+                        if logging.root.isEnabledFor(logging.DEBUG):
+                            logging.debug("Sending message: %s", send_msg.to_string())
 
-                                                logging.debug("Ignoring task to assign..."
-                                                              " - Waiting for task with TID to finish: %s", task.tid)
+                        comm_handler.send_string(send_msg.to_string())  # Does not block.
 
-                                                send_msg = WaitCommand(controller_wait_duration)
+                    else:   # POLL-TIMEOUT
 
-                                            else:
-                                                raise RuntimeError(f"Undefined state processing task: {task.tid}")
+                        logging.debug('RECV-MSG TIMEOUT')
+                        dispatcher.check_controller_timeout()
 
-                                        else:
-                                            do_task_assign = True
+                    if broadcast_channel:
+                        broadcast_channel.check(dispatcher.task_distribution)
 
-                                        # TODO: Could be a method to be called instead of `do_task_assign = True`
-                                        if do_task_assign:
+                except Exception:
 
-                                            task_status_dict[task.tid] = \
-                                                TaskStatusItem(task.tid,
-                                                               TaskState.assigned(),
-                                                               recv_msg.sender,
-                                                               int(time.time()))
+                    error_count += 1
+                    logging.exception('Caught exception in main loop')
 
-                                            send_msg = TaskAssign(task)
+                    stop_task_distribution()
 
-                                    else:
-                                        send_msg = WaitCommand(controller_wait_duration)
+                    if error_count == max_error_count:
+                        break
 
-                                    logging.debug("Sending message: %s", send_msg.to_string())
-                                    comm_handler.send_string(send_msg.to_string())
+            dispatcher.log_stats()
 
-                                elif recv_msg_type == MessageType.TASK_FINISHED():
+        finally:
 
-                                    tid = recv_msg.tid
+            try:
 
-                                    if tid in task_status_dict:
+                if task_generator:
+                    task_generator.shutdown()
 
-                                        if recv_msg.sender == task_status_dict[tid].controller:
+            except Exception:
 
-                                            logging.debug("Received finished message for TID: %s", tid)
-                                            task_status_dict[tid].state = TaskState.finished()
-                                            task_status_dict[tid].timestamp = int(time.time())
+                error_count += 1
+                logging.exception('Caught exception during shutdown of Task Generator')
 
-                                            logging.debug("Pushing TID to result queue: %s", tid)
-                                            result_queue.push(tid)
+    return error_count
 
-                                        else:
-                                            logging.warning('Received task finished from different controller')
+def run_async_engine(config_file_reader):
 
-                                    else:
-                                        raise RuntimeError('Inconsistency detected on task finished')
+    engine = MasterAsyncEngine(config_file_reader)
+    engine.run()
 
-                                    send_msg = Acknowledge()
+    return engine.error_count
 
-                                    if logging.root.isEnabledFor(logging.DEBUG):
-                                        logging.debug("Sending message: %s", send_msg.to_string())
-
-                                    comm_handler.send_string(send_msg.to_string())
-
-                                elif recv_msg_type == MessageType.HEARTBEAT():
-
-                                    send_msg = Acknowledge()
-
-                                    if logging.root.isEnabledFor(logging.DEBUG):
-                                        logging.debug("Sending message: %s", send_msg.to_string())
-
-                                    comm_handler.send_string(send_msg.to_string())
-
-                                else:
-                                    raise RuntimeError(f"Undefined type found in message: {recv_msg.to_string()}")
-
-                            else:   # Do graceful shutdown, since task distribution is off!
-
-                                send_msg = ExitCommand()
-
-                                if logging.root.isEnabledFor(logging.DEBUG):
-                                    logging.debug("Sending message: %s", send_msg.to_string())
-
-                                comm_handler.send_string(send_msg.to_string())  # Does not block.
-
-                                controller_heartbeat_dict.pop(recv_msg.sender, None)
-
-                                if check_all_controller_down(len(controller_heartbeat_dict)):
-                                    run_flag = False
-
-                        else:   # POLL-TIMEOUT
+def main():
 
-                            logging.debug('RECV-MSG TIMEOUT')
+    MinimalPython.check()
 
-                            # This gives controllers the last chance to quit themselves until a timeout is reached.
-                            if not TASK_DISTRIBUTION:
+    error_count = 0
 
-                                for controller_name in controller_heartbeat_dict.keys():
+    try:
 
-                                    controller_threshold = \
-                                        controller_heartbeat_dict[controller_name] + controller_timeout
+        args = init_arg_parser()
 
-                                    if last_exec_timestamp >= controller_threshold:
-                                        controller_heartbeat_dict.pop(controller_name, None)
+        config_file_reader = MasterConfigFileReader(args.config_file)
 
-                                if check_all_controller_down(len(controller_heartbeat_dict)):
-                                    run_flag = False
+        init_logging(config_file_reader.log_filename, args.enable_debug)
 
-                    except Exception:
+        with PIDControl(config_file_reader.pid_file) as pid_control:
 
-                        error_count += 1
-                        logging.exception('Caught exception in main loop')
+            if pid_control.lock():
 
-                        stop_task_distribution()
+                logging.info('Started')
+                logging.info(f"Master PID: {pid_control.pid()}")
+                logging.info(f"Version: {cyclone.VERSION}")
+                logging.info(f"Engine: {config_file_reader.engine}")
+                logging.info(f"Scheduling policy: {config_file_reader.scheduler_policy}")
 
-                        if error_count == max_error_count:
-                            run_flag = False
+                if config_file_reader.engine == MasterConfigFileReader.ENGINE_ASYNCIO:
+                    error_count += run_async_engine(config_file_reader)
+                else:
+                    error_count += run_sync_engine(config_file_reader)
 
             else:
 
@@ -357,29 +266,6 @@ def main():
         error_count += 1
         logging.exception('Caught exception in main block')
 
-    try:
-
-        if task_generator and task_generator.is_alive():
-
-            os.kill(task_generator.pid, signal.SIGUSR1)
-
-            for _ in range(0, 10, 1):
-
-                if task_generator.is_alive():
-                    logging.debug('Waiting for Task Generator to finish...')
-                    time.sleep(1)
-                else:
-                    break
-
-            if task_generator.is_alive():
-                task_generator.terminate()
-                task_generator.join()
-
-    except Exception:
-
-        error_count += 1
-        logging.exception('Caught exception during shutdown of Task Generator')
-
     logging.info('Finished')
 
     if error_count:
@@ -0,0 +1,263 @@
+#!/usr/bin/env python3
+#
+# -*- coding: utf-8 -*-
+#
+# © Copyright 2023 GSI Helmholtzzentrum für Schwerionenforschung
+#
+# This software is distributed under
+# the terms of the GNU General Public Licence version 3 (GPL Version 3),
+# copied verbatim in the file "LICENCE".
+
+import argparse
+import logging
+import signal
+import socket
+import sys
+import time
+
+from comm.task_generator_handler import TaskGeneratorCommHandler
+from conf.config_value_error import ConfigValueError
+from conf.task_generator_config_file_reader import TaskGeneratorConfigFileReader
+from ctrl.critical_section import CriticalSection
+from ctrl.pid_control import PIDControl
+from ctrl.shared_queue import SharedQueue
+from ctrl.shared_queue_str import SharedQueueStr
+from msg.heartbeat import Heartbeat
+from msg.message_factory import MessageFactory
+from msg.message_type import MessageType
+from msg.task_assign import TaskAssign
+from task.generator.process_task_generator_adapter import ProcessTaskGeneratorAdapter
+from task.generator.task_generator_factory import TaskGeneratorFactory
+from version import cyclone
+from version.minimal_python import MinimalPython
+
+RUN_FLAG = True
+
+def init_arg_parser():
+
+    parser = argparse.ArgumentParser(description='Cyclone Task Generator')
+
+    parser.add_argument('-f',
+                        '--config-file',
+                        dest='config_file',
+                        type=str,
+                        required=False,
+                        help="Path to the config file (default: %(default)s)",
+                        default='/etc/cyclone/task-generator.conf')
+
+    parser.add_argument('-D',
+                        '--debug',
+                        dest='enable_debug',
+                        required=False,
+                        action='store_true',
+                        help='Enables debug log messages.')
+
+    parser.add_argument('-v',
+                        '--version',
+                        action='version',
+                        version=cyclone.VERSION)
+
+    return parser.parse_args()
+
+def init_logging(log_filename, enable_debug):
+
+    if enable_debug:
+        log_level = logging.DEBUG
+    else:
+        log_level = logging.INFO
+
+    if log_filename:
+        logging.basicConfig(filename=log_filename, level=log_level, format="%(asctime)s - %(levelname)s: %(message)s")
+    else:
+        logging.basicConfig(level=log_level, format="%(asctime)s - %(levelname)s: %(message)s")
+
+def stop_run_flag():
+
+    global RUN_FLAG
+
+    if RUN_FLAG:
+        RUN_FLAG = False
+
+def signal_handler(signum : signal.Signals, frame) -> None:
+    # pylint: disable=unused-argument
+
+    if signum == signal.SIGHUP:
+
+        logging.info('Received hang-up signal')
+        stop_run_flag()
+
+    elif signum == signal.SIGINT:
+
+        logging.info('Received interrupt program signal')
+        stop_run_flag()
+
+    elif signum == signal.SIGTERM:
+
+        logging.info('Received signal to terminate')
+        stop_run_flag()
+
+    else:
+        logging.debug("Received unhandled signal: %i", signum)
+
+def pop_task(task_queue):
+
+    with CriticalSection(task_queue.lock, timeout=1) as critical_section:
+
+        if critical_section.is_locked() and not task_queue.is_empty():
+            return task_queue.pop_nowait()
+
+    return None
+
+def main():
+
+    MinimalPython.check()
+
+    error_count = 0
+
+    task_generator = None
+
+    try:
+
+        args = init_arg_parser()
+
+        config_file_reader = TaskGeneratorConfigFileReader(args.config_file)
+
+        init_logging(config_file_reader.log_filename, args.enable_debug)
+
+        generator_class = \
+            TaskGeneratorFactory.load_class(config_file_reader.task_gen_module, config_file_reader.task_gen_class)
+
+        if TaskGeneratorFactory.is_async(generator_class):
+            raise ConfigValueError(f"Task generator is not supported for the generator feed: {config_file_reader.task_gen_class}")
+
+        name = config_file_reader.comm_name
+
+        if not name:
+            name = f"{socket.getfqdn()}:{config_file_reader.task_gen_class}"
+
+        with PIDControl(config_file_reader.pid_file) as pid_control, \
+                TaskGeneratorCommHandler(config_file_reader.comm_target,
+                                         config_file_reader.comm_port,
+                                         config_file_reader.poll_timeout,
+                                         name) as comm_handler, \
+                SharedQueue() as task_queue, \
+                SharedQueueStr() as result_queue:
+
+            if pid_control.lock():
+
+                logging.info('Started')
+                logging.info(f"Task Generator PID: {pid_control.pid()}")
+                logging.info(f"Task Generator Name: {comm_handler.name}")
+                logging.info(f"Version: {cyclone.VERSION}")
+
+                signal.signal(signal.SIGHUP, signal_handler)
+                signal.signal(signal.SIGINT, signal_handler)
+                signal.signal(signal.SIGTERM, signal_handler)
+
+                signal.siginterrupt(signal.SIGHUP, True)
+                signal.siginterrupt(signal.SIGINT, True)
+                signal.siginterrupt(signal.SIGTERM, True)
+
+                comm_handler.connect()
+
+                task_generator = \
+                    ProcessTaskGeneratorAdapter(
+                        TaskGeneratorFactory.create(generator_class,
+                                                    task_queue,
+                                                    result_queue,
+                                                    config_file_reader.task_gen_config_file))
+                task_generator.start()
+
+                # Total number of tasks sent and allowed to send by the master, see GeneratorFeed for the protocol.
+                sent_count = 0
+                credit_limit = 0
+                next_heartbeat_timestamp = 0
+
+                while RUN_FLAG:
+
+                    try:
+
+                        last_exec_timestamp = int(time.time())
+
+                        if last_exec_timestamp >= next_heartbeat_timestamp:
+
+                            comm_handler.send_string(Heartbeat(comm_handler.name, sent_count).to_string())
+                            next_heartbeat_timestamp = last_exec_timestamp + config_file_reader.heartbeat_interval
+
+                        while sent_count < credit_limit:
+
+                            task = pop_task(task_queue)
+
+                            if not task:
+                                break
+
+                            # The deadline is not part of the TaskAssign message, so expired tasks are dropped here.
+                            if task.is_expired(time.time()):
+
+                                logging.debug("Dropped expired task: %s", task.tid)
+                                continue
+
+                            logging.debug("Sending task to master: %s", task.tid)
+                            comm_handler.send_string(TaskAssign(task).to_string())
+                            sent_count += 1
+
+                        in_raw_data = comm_handler.recv_string()
+
+                        if in_raw_data:
+
+                            logging.debug("Received message: %s", in_raw_data)
+
+                            in_msg = MessageFactory.create(in_raw_data)
+                            in_msg_type = in_msg.type()
+
+                            if MessageType.TASK_CREDIT() == in_msg_type:
+                                credit_limit = in_msg.count
+
+                            elif MessageType.TASK_FINISHED() == in_msg_type:
+
+                                logging.debug("Pushing TID to result queue: %s", in_msg.tid)
+                                result_queue.push(in_msg.tid)
+
+                            else:
+                                raise RuntimeError(f"Undefined type found in message: {in_raw_data}")
+
+                        elif not task_generator.is_alive() and task_queue.is_empty():
+
+                            logging.info('Task Generator is not alive')
+                            stop_run_flag()
+
+                    except Exception:
+
+                        error_count += 1
+                        logging.exception('Caught exception in main loop')
+                        stop_run_flag()
+
+            else:
+
+                logging.error(f"Another instance might be already running (PID file: {config_file_reader.pid_file})!")
+                sys.exit(1)
+
+    except Exception:
+
+        error_count += 1
+        logging.exception('Caught exception in main block')
+
+    try:
+
+        if task_generator:
+            task_generator.shutdown()
+
+    except Exception:
+
+        error_count += 1
+        logging.exception('Caught exception during shutdown of Task Generator')
+
+    logging.info('Finished')
+
+    if error_count:
+        sys.exit(1)
+
+    sys.exit(0)
+
+if __name__ == '__main__':
+    main()
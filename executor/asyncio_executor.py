@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+#
+# -*- coding: utf-8 -*-
+#
+# © Copyright 2023 GSI Helmholtzzentrum für Schwerionenforschung
+#
+# This software is distributed under
+# the terms of the GNU General Public Licence version 3 (GPL Version 3),
+# copied verbatim in the file "LICENCE".
+
+"""Module for task executors"""
+
+import asyncio
+import concurrent.futures
+import logging
+import threading
+
+from collections import deque
+
+from ctrl.notification_pipe import NotificationPipe
+from ctrl.thread_queue import ThreadQueue
+from executor.base_executor import BaseExecutor
+from task.base_task import BaseTask
+from worker import BaseWorker
+from worker import SlotWorker
+
+class AsyncioExecutor(BaseExecutor):
+    """Executes the tasks by an asyncio event loop running in a thread of the controller process.
+
+    The worker count is the number of slots for tasks executed concurrently.
+    Each task pushed by the controller is started on a free slot by the event loop.
+    Tasks implementing the asynchronous execution are awaited on the event loop,
+    other tasks are executed in a thread pool of the event loop with a thread per slot.
+    Timeouts are just enforced for tasks awaited on the event loop.
+    """
+
+    START_TIMEOUT = 10
+
+    def __init__(self, worker_count: int, notification_pipe: NotificationPipe) -> None:
+
+        super().__init__(worker_count, notification_pipe)
+
+        self.task_queue = self._exit_stack.enter_context(ThreadQueue())
+
+        for i in range(worker_count):
+            self._worker_list.append(SlotWorker(f"SLOT_{i}", i, self._control_block, self.task_queue, self._notification_pipe))
+
+        self._thread = threading.Thread(target=self._run, name='AsyncioExecutor', daemon=True)
+        self._started = threading.Event()
+        self._run_flag = False
+
+        self._loop : asyncio.AbstractEventLoop = None
+        self._wakeup : asyncio.Event = None
+
+    def start(self) -> bool:
+
+        self._run_flag = True
+        self._thread.start()
+
+        return self._started.wait(AsyncioExecutor.START_TIMEOUT)
+
+    def stop(self) -> None:
+
+        if not self._thread.is_alive():
+            return
+
+        self._run_flag = False
+        self._notify_loop()
+
+        logging.debug('Waiting for asyncio executor to complete its tasks...')
+        self._thread.join()
+
+    def _push(self, task: BaseTask) -> None:
+
+        self.task_queue.push(task)
+        self._notify_loop()
+
+    def _enforces_timeout(self, task: BaseTask) -> bool:
+        return task.is_async
+
+    def _is_alive(self, worker: BaseWorker) -> bool:
+        return self._thread.is_alive()
+
+    def _notify_loop(self) -> None:
+
+        if self._loop:
+            self._loop.call_soon_threadsafe(self._wakeup.set)
+
+    def _run(self) -> None:
+
+        try:
+            asyncio.run(self._main())
+        except Exception:
+            logging.exception('Caught exception in asyncio executor')
+
+    async def _main(self) -> None:
+
+        self._loop = asyncio.get_running_loop()
+        self._wakeup = asyncio.Event()
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=self._worker_count,
+                                                   thread_name_prefix='AsyncioExecutor') as thread_pool:
+
+            self._loop.set_default_executor(thread_pool)
+
+            free_worker_deque = deque(self._worker_list)
+            running_set = set()
+
+            for worker in self._worker_list:
+                worker.set_ready()
+
+            self._started.set()
+
+            while self._run_flag:
+
+                while free_worker_deque:
+
+                    task = self.task_queue.pop_nowait()
+
+                    if not task:
+                        break
+
+                    running = asyncio.ensure_future(self._process(free_worker_deque.popleft(), task, free_worker_deque))
+                    running_set.add(running)
+                    running.add_done_callback(running_set.discard)
+
+                await self._wakeup.wait()
+                self._wakeup.clear()
+
+            if running_set:
+                await asyncio.wait(running_set)
+
+    async def _process(self, worker: SlotWorker, task: BaseTask, free_worker_deque: deque) -> None:
+
+        try:
+
+            if task.is_async:
+
+                worker.async_task = asyncio.current_task()
+
+                try:
+                    await worker.process_task_async(task)
+                finally:
+                    worker.async_task = None
+
+            else:
+                await self._loop.run_in_executor(None, worker.process_task, task)
+
+        except Exception:
+            logging.exception(f"Caught exception in asyncio executor processing task: {task.tid}")
+
+        finally:
+            free_worker_deque.append(worker)
+            self._wakeup.set()
@@ -0,0 +1,181 @@
+#!/usr/bin/env python3
+#
+# -*- coding: utf-8 -*-
+#
+# © Copyright 2023 GSI Helmholtzzentrum für Schwerionenforschung
+#
+# This software is distributed under
+# the terms of the GNU General Public Licence version 3 (GPL Version 3),
+# copied verbatim in the file "LICENCE".
+
+"""Module for task executors"""
+
+import abc
+import contextlib
+import logging
+
+from collections import deque
+
+from ctrl.notification_pipe import NotificationPipe
+from ctrl.task_cancellation import TaskCancellation
+from ctrl.worker_control_block import WorkerControlBlock
+from msg.task_finished import TaskFinished
+from task.base_task import BaseTask
+from worker import BaseWorker
+from worker import WorkerState
+
+class BaseExecutor(metaclass=abc.ABCMeta):
+    """Executes the tasks of the controller by its workers.
+
+    The controller pushes the tasks to the task queue of the executor and pops the TID and status
+    of the finished tasks from the completion rings of the workers, each result is notified on the notification pipe.
+    A task not executable by the workers, e.g. with a TID exceeding the worker control block,
+    is rejected on push and its failed result is notified the same way.
+
+    Each worker keeps its state in its slot of the worker control block, which is read without locking.
+    Queues and other resources of an executor are released by its exit stack.
+    """
+
+    def __init__(self, worker_count: int, notification_pipe: NotificationPipe) -> None:
+
+        if worker_count < 1:
+            raise RuntimeError(f"Invalid worker count for executor: {worker_count}")
+
+        self._worker_count = worker_count
+        self._notification_pipe = notification_pipe
+
+        self._control_block = WorkerControlBlock(worker_count)
+        self._worker_list = list[BaseWorker]()
+
+        # Results of rejected tasks, which are not passed through the completion rings.
+        self._rejected_result_deque = deque[tuple[str, str]]()
+
+        self._timeout_warned = False
+
+        self._exit_stack = contextlib.ExitStack()
+
+        self.task_queue = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+
+        try:
+            self.stop()
+        finally:
+            self._exit_stack.close()
+
+    @property
+    def worker_count(self) -> int:
+        return self._worker_count
+
+    @abc.abstractmethod
+    def start(self) -> bool:
+        """Starts the workers and returns True, if all of them are ready."""
+
+    @abc.abstractmethod
+    def stop(self) -> None:
+        """Stops the workers after their tasks in execution."""
+
+    def process(self, task_cancellation: TaskCancellation) -> None:
+        """Called on each iteration of the controller loop, e.g. for executing tasks within the loop."""
+
+    def push(self, task: BaseTask) -> None:
+
+        if not WorkerControlBlock.is_valid_tid(task.tid):
+
+            self._reject(task, 'TID exceeds worker control block')
+            return
+
+        if task.timeout and not self._enforces_timeout(task) and not self._timeout_warned:
+
+            logging.warning("Task timeouts are not enforced by executor: %s - Task: %s",
+                            self.__class__.__name__, task.__class__.__name__)
+
+            self._timeout_warned = True
+
+        self._push(task)
+
+    def pop_queued(self) -> list[BaseTask]:
+        """Pops the tasks not taken by a worker yet."""
+
+        task_list = []
+
+        while True:
+
+            task = self.task_queue.pop_nowait()
+
+            if not task:
+                break
+
+            task_list.append(task)
+
+        return task_list
+
+    def has_queued(self) -> bool:
+        return not self.task_queue.is_empty()
+
+    def pop_result(self) -> tuple[str, str]:
+        """Returns the TID and status of a finished task, that has been notified on the notification pipe.
+
+        Each notification is written after its result was pushed, so a result is available for each notification.
+        """
+
+        if self._rejected_result_deque:
+            return self._rejected_result_deque.popleft()
+
+        result = self._control_block.pop_result()
+
+        if not result:
+            raise RuntimeError('No result of a finished task available in completion rings!')
+
+        return result
+
+    def alive_count(self) -> int:
+        return sum(1 for worker in self._worker_list if self._is_alive(worker))
+
+    def idle_count(self) -> int:
+        return self._control_block.count(WorkerState.READY)
+
+    def is_executing(self) -> bool:
+
+        if not self._control_block.count(WorkerState.EXECUTING):
+            return False
+
+        # A worker that died during an execution is not executing anymore.
+        return any(self._control_block.state(worker.index)[0] == WorkerState.EXECUTING and self._is_alive(worker)
+                   for worker in self._worker_list)
+
+    def cancel(self, task_cancellation: TaskCancellation) -> None:
+        """Cancels the tasks in execution requested to be cancelled."""
+
+        for worker in self._worker_list:
+
+            state, tid, _ = self._control_block.state(worker.index)
+
+            if state == WorkerState.EXECUTING \
+                    and task_cancellation.pop_request(tid) \
+                    and self._is_alive(worker):
+
+                logging.debug("Signaling worker %s to cancel task: %s", worker.name, tid)
+                worker.cancel()
+
+    def _push(self, task: BaseTask) -> None:
+        self.task_queue.push(task)
+
+    def _enforces_timeout(self, task: BaseTask) -> bool:
+        """Checks if the execution of the task is stopped on its timeout."""
+        # pylint: disable=unused-argument
+        return False
+
+    def _reject(self, task: BaseTask, reason: str) -> None:
+
+        logging.error("Rejected task: %s - %s", task.tid, reason)
+
+        self._rejected_result_deque.append((task.tid, TaskFinished.STATUS_FAILED))
+        self._notification_pipe.notify()
+
+    def _is_alive(self, worker: BaseWorker) -> bool:
+        # pylint: disable=unused-argument
+        return True
@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+#
+# -*- coding: utf-8 -*-
+#
+# © Copyright 2023 GSI Helmholtzzentrum für Schwerionenforschung
+#
+# This software is distributed under
+# the terms of the GNU General Public Licence version 3 (GPL Version 3),
+# copied verbatim in the file "LICENCE".
+
+"""Module for task executors"""
+
+from ctrl.notification_pipe import NotificationPipe
+from executor.asyncio_executor import AsyncioExecutor
+from executor.base_executor import BaseExecutor
+from executor.inline_executor import InlineExecutor
+from executor.process_executor import ProcessExecutor
+from executor.thread_executor import ThreadExecutor
+from executor.worker_autoscaler import WorkerAutoscaler
+from executor.worker_supervisor import WorkerSupervisor
+
+class ExecutorFactory:
+
+    EXECUTOR_PROCESS = 'process'
+    EXECUTOR_THREAD = 'thread'
+    EXECUTOR_INLINE = 'inline'
+    EXECUTOR_ASYNCIO = 'asyncio'
+
+    EXECUTORS = (EXECUTOR_PROCESS, EXECUTOR_THREAD, EXECUTOR_INLINE, EXECUTOR_ASYNCIO)
+
+    def __init__(self):
+        pass
+
+    # Executors running a pool of workers, which can be scaled by an autoscaler.
+    SCALABLE_EXECUTORS = (EXECUTOR_PROCESS, EXECUTOR_THREAD)
+
+    @staticmethod
+    def create(executor: str,
+               worker_count: int,
+               notification_pipe: NotificationPipe,
+               autoscaler: WorkerAutoscaler = None,
+               supervisor: WorkerSupervisor = None) -> BaseExecutor:
+        """Creates the executor, the supervisor is just used by executors running a pool of workers."""
+
+        if autoscaler and executor not in ExecutorFactory.SCALABLE_EXECUTORS:
+            raise RuntimeError(f"Autoscaling not supported by executor: {executor}")
+
+        if executor == ExecutorFactory.EXECUTOR_PROCESS:
+            return ProcessExecutor(worker_count, notification_pipe, autoscaler, supervisor)
+
+        if executor == ExecutorFactory.EXECUTOR_THREAD:
+            return ThreadExecutor(worker_count, notification_pipe, autoscaler, supervisor)
+
+        if executor == ExecutorFactory.EXECUTOR_INLINE:
+            return InlineExecutor(worker_count, notification_pipe)
+
+        if executor == ExecutorFactory.EXECUTOR_ASYNCIO:
+            return AsyncioExecutor(worker_count, notification_pipe)
+
+        raise RuntimeError(f"Not supported executor: {executor}")
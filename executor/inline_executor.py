@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+#
+# -*- coding: utf-8 -*-
+#
+# © Copyright 2023 GSI Helmholtzzentrum für Schwerionenforschung
+#
+# This software is distributed under
+# the terms of the GNU General Public Licence version 3 (GPL Version 3),
+# copied verbatim in the file "LICENCE".
+
+"""Module for task executors"""
+
+import logging
+
+from ctrl.local_queue import LocalQueue
+from ctrl.notification_pipe import NotificationPipe
+from ctrl.task_cancellation import TaskCancellation
+from executor.base_executor import BaseExecutor
+from worker import SlotWorker
+
+class InlineExecutor(BaseExecutor):
+    """Executes the tasks one after another within the controller loop, e.g. for micro-tasks.
+
+    Tasks are neither passed to another process nor thread, but the controller does not communicate
+    with the master while executing a task, so just tasks taking milliseconds should be executed inline.
+    """
+
+    def __init__(self, worker_count: int, notification_pipe: NotificationPipe) -> None:
+
+        super().__init__(1, notification_pipe)
+
+        if worker_count > 1:
+            logging.info("Inline executor ignores worker count: %i", worker_count)
+
+        self.task_queue = self._exit_stack.enter_context(LocalQueue())
+
+        self._worker_list.append(SlotWorker('INLINE', 0, self._control_block, self.task_queue, self._notification_pipe))
+
+    def start(self) -> bool:
+
+        self._worker_list[0].set_ready()
+
+        return True
+
+    def stop(self) -> None:
+        pass
+
+    def process(self, task_cancellation: TaskCancellation) -> None:
+
+        worker = self._worker_list[0]
+
+        while True:
+
+            task = self.task_queue.pop_nowait()
+
+            if not task:
+                break
+
+            # A task cancelled while queued is not executed.
+            worker.process_task(task, task_cancellation.pop_request(task.tid))
@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+#
+# -*- coding: utf-8 -*-
+#
+# © Copyright 2023 GSI Helmholtzzentrum für Schwerionenforschung
+#
+# This software is distributed under
+# the terms of the GNU General Public Licence version 3 (GPL Version 3),
+# copied verbatim in the file "LICENCE".
+
+"""Module for task executors"""
+
+import logging
+import os
+import signal
+
+from ctrl.notification_pipe import NotificationPipe
+from ctrl.shared_queue import SharedQueue
+from executor.worker_autoscaler import WorkerAutoscaler
+from executor.worker_pool_executor import WorkerPoolExecutor
+from executor.worker_supervisor import WorkerSupervisor
+from task.base_task import BaseTask
+from worker import BaseWorker
+from worker import Worker
+
+class ProcessExecutor(WorkerPoolExecutor):
+    """Executes the tasks by forked worker processes, tasks are passed by a shared queue per worker.
+
+    Worker processes are isolated from each other, e.g. a task crashing the Python interpreter,
+    and a task in execution is cancelled by a signal to its worker.
+    Workers are recycled by their resident set size read from the proc filesystem
+    and killed by the watchdog on task timeouts together with the subprocesses of the task.
+    """
+
+    KILL_WAIT_SECONDS = 1
+
+    def __init__(self,
+                 worker_count: int,
+                 notification_pipe: NotificationPipe,
+                 autoscaler: WorkerAutoscaler = None,
+                 supervisor: WorkerSupervisor = None) -> None:
+        super().__init__(worker_count, notification_pipe, SharedQueue, autoscaler, supervisor)
+
+    def _create_worker(self, worker_id: str, index: int, task_queue) -> BaseWorker:
+        return Worker(*self._create_worker_args(worker_id, index, task_queue))
+
+    def _enforces_timeout(self, task: BaseTask) -> bool:
+        return True
+
+    def _kill(self, worker: BaseWorker) -> bool:
+
+        # Each worker leads its own process group, which includes the subprocesses started by its task.
+        try:
+            os.killpg(worker.pid, signal.SIGKILL)
+        except ProcessLookupError:
+            logging.debug("No process group of worker found: %s", worker.name)
+
+        # Reaps the worker, unless it is hung in an uninterruptible system call.
+        worker.join(ProcessExecutor.KILL_WAIT_SECONDS)
+
+        return True
+
+    def _rss(self, worker: BaseWorker) -> int:
+
+        try:
+
+            with open(f"/proc/{worker.pid}/status", 'r', encoding='UTF-8') as status_file:
+
+                for line in status_file:
+
+                    if line.startswith('VmRSS:'):
+                        return int(line.split()[1]) * 1024
+
+        except (OSError, ValueError, IndexError):
+            logging.debug("No RSS of worker available: %s", worker.name)
+
+        return 0
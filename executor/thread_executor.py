@@ -0,0 +1,37 @@
+#!/usr/bin/env python3
+#
+# -*- coding: utf-8 -*-
+#
+# © Copyright 2023 GSI Helmholtzzentrum für Schwerionenforschung
+#
+# This software is distributed under
+# the terms of the GNU General Public Licence version 3 (GPL Version 3),
+# copied verbatim in the file "LICENCE".
+
+"""Module for task executors"""
+
+from ctrl.notification_pipe import NotificationPipe
+from ctrl.thread_queue import ThreadQueue
+from executor.worker_autoscaler import WorkerAutoscaler
+from executor.worker_pool_executor import WorkerPoolExecutor
+from executor.worker_supervisor import WorkerSupervisor
+from worker import BaseWorker
+from worker import ThreadWorker
+
+class ThreadExecutor(WorkerPoolExecutor):
+    """Executes the tasks by worker threads of the controller process, tasks are passed without pickling.
+
+    Suited for tasks bound by I/O or subprocesses, which release the GIL while waiting,
+    so many tasks run concurrently without a Python process each.
+    A task in execution is cancelled once it runs Python code again, e.g. not within a blocking call.
+    """
+
+    def __init__(self,
+                 worker_count: int,
+                 notification_pipe: NotificationPipe,
+                 autoscaler: WorkerAutoscaler = None,
+                 supervisor: WorkerSupervisor = None) -> None:
+        super().__init__(worker_count, notification_pipe, ThreadQueue, autoscaler, supervisor)
+
+    def _create_worker(self, worker_id: str, index: int, task_queue) -> BaseWorker:
+        return ThreadWorker(*self._create_worker_args(worker_id, index, task_queue))
@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+#
+# -*- coding: utf-8 -*-
+#
+# © Copyright 2023 GSI Helmholtzzentrum für Schwerionenforschung
+#
+# This software is distributed under
+# the terms of the GNU General Public Licence version 3 (GPL Version 3),
+# copied verbatim in the file "LICENCE".
+
+"""Module for task executors"""
+
+import logging
+import os
+
+class WorkerAutoscaler:
+    """Decides on growing and shrinking the worker pool of an executor between a min and its max worker count.
+
+    The pool grows by a worker per interval while all of its workers are busy,
+    as long as the load average per CPU of the node stays below the max load
+    and the fraction of available memory stays above the min fraction,
+    so e.g. shared client nodes give their spare capacity.
+    Workers idle for longer than the idle timeout are retired down to the min worker count.
+    """
+
+    MEMINFO_FILE = '/proc/meminfo'
+
+    def __init__(self,
+                 min_worker_count: int,
+                 max_load: float = 1.0,
+                 min_mem_available: float = 0.1,
+                 idle_timeout: float = 60,
+                 interval: float = 5) -> None:
+
+        if min_worker_count < 1:
+            raise RuntimeError(f"Invalid min worker count for autoscaler: {min_worker_count}")
+
+        if max_load <= 0 or min_mem_available < 0 or min_mem_available >= 1:
+            raise RuntimeError(f"Invalid max load or min available memory for autoscaler: "
+                               f"{max_load} - {min_mem_available}")
+
+        self.min_worker_count = min_worker_count
+        self.idle_timeout = idle_timeout
+
+        self._max_load = max_load
+        self._min_mem_available = min_mem_available
+        self._interval = interval
+
+        self._next_check_timestamp = 0
+
+    def is_due(self, timestamp: float) -> bool:
+        """Returns True, if the interval for the next check has passed."""
+
+        if timestamp < self._next_check_timestamp:
+            return False
+
+        self._next_check_timestamp = timestamp + self._interval
+
+        return True
+
+    def node_has_capacity(self) -> bool:
+
+        load = WorkerAutoscaler.load_per_cpu()
+
+        if load >= self._max_load:
+            logging.debug("Not growing worker pool by load per CPU: %.2f", load)
+            return False
+
+        mem_available = WorkerAutoscaler.mem_available()
+
+        if mem_available <= self._min_mem_available:
+            logging.debug("Not growing worker pool by available memory: %.2f", mem_available)
+            return False
+
+        return True
+
+    @staticmethod
+    def load_per_cpu() -> float:
+        return os.getloadavg()[0] / (os.cpu_count() or 1)
+
+    @staticmethod
+    def mem_available() -> float:
+        """Returns the fraction of the available memory of the node, 1.0 if not known."""
+
+        meminfo_dict = {}
+
+        try:
+
+            with open(WorkerAutoscaler.MEMINFO_FILE, 'r', encoding='UTF-8') as meminfo_file:
+
+                for line in meminfo_file:
+
+                    name, _, value = line.partition(':')
+                    meminfo_dict[name] = int(value.split()[0])
+
+        except (OSError, ValueError, IndexError):
+            return 1.0
+
+        if not meminfo_dict.get('MemTotal') or 'MemAvailable' not in meminfo_dict:
+            return 1.0
+
+        return meminfo_dict['MemAvailable'] / meminfo_dict['MemTotal']
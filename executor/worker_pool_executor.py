@@ -0,0 +1,480 @@
+#!/usr/bin/env python3
+#
+# -*- coding: utf-8 -*-
+#
+# © Copyright 2023 GSI Helmholtzzentrum für Schwerionenforschung
+#
+# This software is distributed under
+# the terms of the GNU General Public Licence version 3 (GPL Version 3),
+# copied verbatim in the file "LICENCE".
+
+"""Module for task executors"""
+
+import abc
+import logging
+import time
+
+from collections import deque
+
+from ctrl.notification_pipe import NotificationPipe
+from ctrl.task_cancellation import TaskCancellation
+from executor.base_executor import BaseExecutor
+from executor.worker_autoscaler import WorkerAutoscaler
+from executor.worker_supervisor import WorkerSupervisor
+from msg.task_finished import TaskFinished
+from task.base_task import BaseTask
+from task.poison_pill import PoisonPill
+from worker import BaseWorker
+from worker import WorkerState
+
+class WorkerPoolExecutor(BaseExecutor):
+    """Executes the tasks by a pool of workers, each popping its next task from its own task queue.
+
+    The controller dispatches a task directly to an idle worker, so the workers do not contend for a shared queue.
+    Tasks pushed while no worker is idle, e.g. prefetched tasks, wait in the controller
+    and are dispatched once a worker has finished its task.
+
+    A task with an affinity key is dispatched to the worker that executed the last task with the same key,
+    if it is idle, so e.g. repeated probes of an OST are executed by the same worker.
+
+    With an autoscaler the pool starts with its min worker count and is scaled up to the worker count.
+    A worker is retired by a PoisonPill, which lets it quit after popping it from its task queue.
+
+    The workers are supervised, so a dead worker is respawned and workers are recycled by the worker supervisor.
+    The task in execution of a dead worker is reported as failed.
+    A worker executing a task longer than its timeout is killed and replaced by a watchdog,
+    if the executor enforces timeouts by killing its workers, and the task is reported as timed out.
+    """
+
+    MAX_START_RETRY_COUNT = 3
+
+    SUPERVISE_INTERVAL = 1
+
+    def __init__(self,
+                 worker_count: int,
+                 notification_pipe: NotificationPipe,
+                 task_queue_class: type,
+                 autoscaler: WorkerAutoscaler = None,
+                 supervisor: WorkerSupervisor = None) -> None:
+
+        super().__init__(worker_count, notification_pipe)
+
+        if autoscaler and autoscaler.min_worker_count > worker_count:
+            raise RuntimeError(f"Min worker count of autoscaler exceeds worker count: {autoscaler.min_worker_count}")
+
+        self._task_queue_class = task_queue_class
+        self._autoscaler = autoscaler
+        self._supervisor = supervisor if supervisor else WorkerSupervisor()
+
+        self._pending_task_deque = deque[BaseTask]()
+
+        # TID and timeout of the task dispatched to a worker by its index.
+        self._dispatched_tid_list = [None] * worker_count
+        self._timeout_list = [None] * worker_count
+        self._dispatched_index_dict = dict[str, int]()
+
+        # Used as ordered set, so the worker idle for the longest time is dispatched to first.
+        self._idle_index_dict = dict[int, None]()
+        self._affinity_dict = dict[str, int]()
+
+        # Current worker by its index, a worker replaced later keeps the index and the task queue.
+        self._worker_dict = dict[int, BaseWorker]()
+        self._retiring_index_set = set[int]()
+
+        # Indexes of retired workers that have quit, which are not respawned but free for growing the pool again.
+        self._retired_index_set = set[int]()
+
+        # Timestamp a dead or recycled worker is respawned at by its index.
+        self._respawn_dict = dict[int, float]()
+        self._dead_index_set = set[int]()
+
+        self._task_count_list = [0] * worker_count
+        self._death_count_list = [0] * worker_count
+        self._next_supervise_timestamp = 0
+
+        for i in range(autoscaler.min_worker_count if autoscaler else worker_count):
+            self._add_worker(i)
+
+    @abc.abstractmethod
+    def _create_worker(self, worker_id: str, index: int, task_queue) -> BaseWorker:
+        pass
+
+    def start(self) -> bool:
+
+        for worker in self._worker_list:
+            worker.start()
+
+        for retry_count in range(1, WorkerPoolExecutor.MAX_START_RETRY_COUNT + 1):
+
+            if all(worker.is_alive() and self._control_block.state(worker.index)[0] == WorkerState.READY
+                   for worker in self._worker_list):
+                return True
+
+            wait_time = retry_count * retry_count
+            logging.debug("Waiting for worker to be READY - Waiting seconds: %i", wait_time)
+            time.sleep(wait_time)
+
+        return False
+
+    def stop(self) -> None:
+
+        all_worker_down = False
+
+        while not all_worker_down:
+
+            found_active_worker = False
+
+            for worker in self._worker_list:
+
+                if worker.is_alive():
+
+                    worker.shutdown()
+
+                    worker.task_queue.push(PoisonPill())
+
+                    logging.debug("Waiting for worker to complete: %s", worker.name)
+
+                    found_active_worker = True
+
+            if not found_active_worker:
+                all_worker_down = True
+                logging.debug('All worker are down.')
+
+            else:
+                logging.debug('Waiting for worker to shutdown...')
+                time.sleep(1)
+
+    def _push(self, task: BaseTask) -> None:
+
+        # The worker executing a task is tracked by its TID, so a task resent meanwhile is not executed twice.
+        if task.tid in self._dispatched_index_dict \
+                or any(pending_task.tid == task.tid for pending_task in self._pending_task_deque):
+
+            self._reject(task, 'TID already in execution')
+            return
+
+        self._pending_task_deque.append(task)
+        self._dispatch()
+
+    def pop_queued(self) -> list[BaseTask]:
+
+        task_list = list(self._pending_task_deque)
+        self._pending_task_deque.clear()
+
+        return task_list
+
+    def has_queued(self) -> bool:
+        return bool(self._pending_task_deque)
+
+    def pop_result(self) -> tuple[str, str]:
+
+        # A rejected task shares its TID with the task in execution, which keeps the worker.
+        if self._rejected_result_deque:
+            return super().pop_result()
+
+        tid, status = super().pop_result()
+
+        index = self._dispatched_index_dict.pop(tid, None)
+
+        if index is not None:
+
+            self._dispatched_tid_list[index] = None
+
+            # The failed task of a dead worker is reported, before it is respawned.
+            if index not in self._respawn_dict and index not in self._dead_index_set:
+
+                self._task_count_list[index] += 1
+                self._death_count_list[index] = 0
+
+                worker = self._worker_dict[index]
+
+                if self._supervisor.is_recycled(self._task_count_list[index], self._rss(worker)):
+
+                    logging.info("Recycling worker after tasks: %s - %i", worker.name, self._task_count_list[index])
+
+                    self._respawn_dict[index] = 0
+                    worker.task_queue.push(PoisonPill())
+
+                else:
+                    self._idle_index_dict[index] = None
+
+            self._dispatch()
+
+        return tid, status
+
+    def alive_count(self) -> int:
+
+        # Workers to be respawned still count, so the controller does not quit meanwhile.
+        return super().alive_count() \
+            + sum(1 for index in self._respawn_dict if not self._is_alive(self._worker_dict[index]))
+
+    def is_executing(self) -> bool:
+
+        # A task dispatched to a worker is executing, even if the worker has not popped it yet.
+        return any(self._is_alive(self._worker_dict[index]) for index in self._dispatched_index_dict.values())
+
+    def process(self, task_cancellation: TaskCancellation) -> None:
+
+        timestamp = time.time()
+
+        if timestamp >= self._next_supervise_timestamp:
+
+            self._next_supervise_timestamp = timestamp + WorkerPoolExecutor.SUPERVISE_INTERVAL
+            self._supervise(timestamp)
+
+        if self._autoscaler and self._autoscaler.is_due(timestamp):
+            self._scale()
+
+    def _supervise(self, timestamp: float) -> None:
+
+        self._watch(timestamp)
+
+        for index, worker in list(self._worker_dict.items()):
+
+            if index in self._retiring_index_set \
+                    or index in self._retired_index_set \
+                    or index in self._dead_index_set \
+                    or self._is_alive(worker):
+                continue
+
+            if index in self._respawn_dict:
+
+                if timestamp >= self._respawn_dict[index]:
+
+                    del self._respawn_dict[index]
+
+                    logging.info("Respawning worker: %s", worker.name)
+
+                    self._task_count_list[index] = 0
+                    self._add_worker(index).start()
+                    self._dispatch()
+
+                continue
+
+            self._idle_index_dict.pop(index, None)
+            self._fail_lost_task(index)
+
+            if not self._supervisor.respawn:
+
+                logging.error("Worker died: %s - exit code: %s", worker.name, getattr(worker, 'exitcode', None))
+
+                self._dead_index_set.add(index)
+                continue
+
+            self._death_count_list[index] += 1
+
+            delay = self._supervisor.respawn_delay(self._death_count_list[index])
+
+            logging.error("Worker died: %s - exit code: %s - Respawning in seconds: %.1f",
+                          worker.name, getattr(worker, 'exitcode', None), delay)
+
+            self._respawn_dict[index] = timestamp + delay
+
+    def _watch(self, timestamp: float) -> None:
+        """Kills and replaces the workers executing a task longer than its timeout."""
+
+        for tid, index in list(self._dispatched_index_dict.items()):
+
+            timeout = self._timeout_list[index]
+
+            if not timeout or index in self._respawn_dict:
+                continue
+
+            state, executing_tid, start_timestamp = self._control_block.state(index)
+
+            if state != WorkerState.EXECUTING or executing_tid != tid or timestamp - start_timestamp <= timeout:
+                continue
+
+            # The worker has just finished the task and is about to notify its result.
+            if self._control_block.has_result(index, tid):
+                continue
+
+            worker = self._worker_dict[index]
+
+            if not self._kill(worker):
+                continue
+
+            logging.error("Killed worker on task timeout: %s - %s - timeout: %.1fs", worker.name, tid, timeout)
+
+            self._fail_lost_task(index, TaskFinished.STATUS_TIMEOUT)
+
+            # The index is released before the result is popped, since the worker is replaced right away.
+            del self._dispatched_index_dict[tid]
+            self._dispatched_tid_list[index] = None
+
+            # A worker hung in an uninterruptible system call does not exit until the call returns,
+            # but it does not run any Python code anymore, so it is not waited for.
+            self._task_count_list[index] = 0
+            self._add_worker(index).start()
+            self._dispatch()
+
+    def _kill(self, worker: BaseWorker) -> bool:
+        """Kills a worker, so it does not execute any code anymore, returns False if not supported."""
+        # pylint: disable=unused-argument
+        return False
+
+    def _fail_lost_task(self, index: int, status: str = TaskFinished.STATUS_FAILED) -> None:
+        """Reports the task in execution of a dead worker as failed or by the status by its completion ring."""
+
+        tid = self._dispatched_tid_list[index]
+
+        if not tid:
+            return
+
+        self._control_block.recover(index)
+
+        state, executing_tid, _ = self._control_block.state(index)
+
+        # Otherwise the task is still in the task queue for the respawned worker or its result has been notified.
+        if state == WorkerState.EXECUTING and executing_tid == tid:
+
+            # The worker died after pushing its result, but before setting itself ready and notifying it.
+            if self._control_block.has_result(index, tid):
+
+                logging.warning("Notifying result of dead worker: %s - %s", self._worker_dict[index].name, tid)
+
+                self._notification_pipe.notify()
+                return
+
+            logging.error("Failed task of dead worker: %s - %s - %s", self._worker_dict[index].name, tid, status)
+
+            # The worker is dead, so the controller becomes the single producer of its completion ring.
+            self._control_block.push_result(index, tid, status)
+            self._notification_pipe.notify()
+
+    def _scale(self) -> None:
+
+        for index in [index for index in self._retiring_index_set if not self._is_alive(self._worker_dict[index])]:
+
+            self._retiring_index_set.discard(index)
+            self._retired_index_set.add(index)
+
+        active_count = sum(1 for index, worker in self._worker_dict.items()
+                           if index not in self._retiring_index_set and self._is_alive(worker))
+
+        if not self._idle_index_dict:
+
+            if active_count < self._worker_count and self._autoscaler.node_has_capacity():
+
+                index = next((index for index in range(self._worker_count) if self._is_free(index)), None)
+
+                # The indexes not active might still be retiring or waiting for their respawn.
+                if index is None:
+                    return
+
+                logging.info("Growing worker pool by worker %i to worker count: %i", index, active_count + 1)
+
+                self._add_worker(index).start()
+                self._dispatch()
+
+            return
+
+        idle_timestamp = time.time() - self._autoscaler.idle_timeout
+
+        # The worker idle for the longest time is retired first.
+        for index in list(self._idle_index_dict):
+
+            if active_count <= self._autoscaler.min_worker_count:
+                break
+
+            state, _, timestamp = self._control_block.state(index)
+
+            if state != WorkerState.READY or timestamp > idle_timestamp:
+                break
+
+            logging.info("Retiring idle worker %i to worker count: %i", index, active_count - 1)
+
+            del self._idle_index_dict[index]
+            self._retiring_index_set.add(index)
+
+            self._worker_dict[index].task_queue.push(PoisonPill())
+
+            active_count -= 1
+
+    def _is_free(self, index: int) -> bool:
+        """Checks if no worker is running by the index, so a new worker can be added."""
+
+        worker = self._worker_dict.get(index)
+
+        return not (worker and self._is_alive(worker)) \
+            and index not in self._retiring_index_set \
+            and index not in self._respawn_dict \
+            and self._dispatched_tid_list[index] is None
+
+    def _add_worker(self, index: int) -> BaseWorker:
+
+        worker = self._worker_dict.get(index)
+
+        if worker:
+            task_queue = worker.task_queue
+        else:
+            task_queue = self._exit_stack.enter_context(self._task_queue_class())
+
+        worker = self._create_worker(f"WORKER_{index}", index, task_queue)
+
+        self._worker_dict[index] = worker
+        self._worker_list = list(self._worker_dict.values())
+
+        self._dead_index_set.discard(index)
+        self._retired_index_set.discard(index)
+
+        self._idle_index_dict[index] = None
+
+        return worker
+
+    def _dispatch(self) -> None:
+
+        while self._pending_task_deque and self._idle_index_dict:
+
+            task = self._pending_task_deque[0]
+            index = self._select_worker(task)
+
+            if index is None:
+                break
+
+            self._pending_task_deque.popleft()
+
+            del self._idle_index_dict[index]
+
+            self._dispatched_tid_list[index] = task.tid
+            self._timeout_list[index] = task.timeout if self._enforces_timeout(task) else None
+            self._dispatched_index_dict[task.tid] = index
+
+            if task.affinity_key:
+                self._affinity_dict[task.affinity_key] = index
+
+            self._worker_dict[index].task_queue.push(task)
+
+    def _select_worker(self, task: BaseTask) -> int:
+        """Returns the index of the idle worker the task is dispatched to or None, if no worker is idle."""
+
+        index = self._affinity_dict.get(task.affinity_key) if task.affinity_key else None
+
+        if index is not None and index in self._idle_index_dict:
+            return index
+
+        for index in list(self._idle_index_dict):
+
+            if self._is_alive(self._worker_dict[index]):
+                return index
+
+            # A worker that died does not get any tasks anymore.
+            del self._idle_index_dict[index]
+
+        return None
+
+    def _create_worker_args(self, worker_id: str, index: int, task_queue) -> tuple:
+
+        return (worker_id,
+                index,
+                self._control_block,
+                task_queue,
+                self._notification_pipe)
+
+    def _is_alive(self, worker: BaseWorker) -> bool:
+        return worker.is_alive()
+
+    def _rss(self, worker: BaseWorker) -> int:
+        """Returns the resident set size of a worker in bytes, 0 if it has no memory of its own."""
+        # pylint: disable=unused-argument
+        return 0
@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+#
+# -*- coding: utf-8 -*-
+#
+# © Copyright 2023 GSI Helmholtzzentrum für Schwerionenforschung
+#
+# This software is distributed under
+# the terms of the GNU General Public Licence version 3 (GPL Version 3),
+# copied verbatim in the file "LICENCE".
+
+"""Module for task executors"""
+
+class WorkerSupervisor:
+    """Decides on respawning dead workers and recycling workers of the worker pool of an executor.
+
+    A dead worker is respawned after a backoff doubled for each time it died again without finishing a task,
+    so a worker crashing right away does not keep the controller busy.
+
+    A worker is recycled after it has executed the max number of tasks or its memory usage exceeds the max RSS,
+    i.e. it is retired after its task and replaced by a new one right away, e.g. against leaking tasks.
+    """
+
+    def __init__(self,
+                 respawn: bool = True,
+                 backoff: float = 1,
+                 backoff_max: float = 300,
+                 max_tasks: int = 0,
+                 max_rss: int = 0) -> None:
+        """
+        Parameters
+        ----------
+        max_tasks : int
+            Max number of tasks executed by a worker, 0 for unlimited
+        max_rss : int
+            Max resident set size of a worker in bytes, 0 for unlimited
+        """
+
+        if backoff < 0 or backoff_max < backoff:
+            raise RuntimeError(f"Invalid backoff for worker supervisor: {backoff} - {backoff_max}")
+
+        if max_tasks < 0 or max_rss < 0:
+            raise RuntimeError(f"Invalid max tasks or max RSS for worker supervisor: {max_tasks} - {max_rss}")
+
+        self.respawn = respawn
+
+        self._backoff = backoff
+        self._backoff_max = backoff_max
+        self._max_tasks = max_tasks
+        self._max_rss = max_rss
+
+    def respawn_delay(self, death_count: int) -> float:
+        """Returns the seconds to wait before respawning a worker that died the number of times in a row."""
+        return min(self._backoff * 2 ** max(death_count - 1, 0), self._backoff_max)
+
+    def is_recycled(self, task_count: int, rss: int) -> bool:
+        return bool(self._max_tasks and task_count >= self._max_tasks) or bool(self._max_rss and rss > self._max_rss)
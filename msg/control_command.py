@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+#
+# -*- coding: utf-8 -*-
+#
+# © Copyright 2023 GSI Helmholtzzentrum für Schwerionenforschung
+#
+# This software is distributed under
+# the terms of the GNU General Public Licence version 3 (GPL Version 3),
+# copied verbatim in the file "LICENCE".
+
+from msg.base_message import BaseMessage
+from msg.message_type import MessageType
+
+class ControlCommand(BaseMessage):
+    """
+        Master broadcasts this message to the controllers to control them independent of the task traffic.
+
+        Supported commands:
+
+        EXIT   - Controller exits immediately.
+        DRAIN  - Controller stops requesting tasks and exits after its running tasks are finished.
+        PAUSE  - Controller stops requesting tasks until resumed.
+        RESUME - Controller requests tasks again.
+        EPOCH  - Controller reloads its config file, if the passed configuration epoch has changed.
+        CANCEL - Controller cancels the task with the passed TID, if it is in progress on the controller.
+    """
+
+    EXIT   = 'EXIT'
+    DRAIN  = 'DRAIN'
+    PAUSE  = 'PAUSE'
+    RESUME = 'RESUME'
+    EPOCH  = 'EPOCH'
+    CANCEL = 'CANCEL'
+
+    COMMANDS = (EXIT, DRAIN, PAUSE, RESUME, EPOCH, CANCEL)
+
+    def __init__(self, command, value=''):
+
+        if command not in ControlCommand.COMMANDS:
+            raise RuntimeError(f"Not supported control command: {command}")
+
+        body = command
+
+        if value:
+            body += self.field_separator + str(value)
+
+        super().__init__(MessageType.CONTROL_COMMAND(), body)
+
+    def _validate(self):
+
+        if not self.body:
+            raise RuntimeError('No body is set!')
+
+        if self.command == ControlCommand.EPOCH:
+            int(self.value)
+
+        if self.command == ControlCommand.CANCEL and not self.value:
+            raise RuntimeError('No TID is set for cancel command!')
+
+    @property
+    def command(self):
+        return self.body.split(BaseMessage.field_separator)[0]
+
+    @property
+    def value(self):
+
+        body_items = self.body.split(BaseMessage.field_separator)
+
+        if len(body_items) > 1:
+            return body_items[1]
+
+        return ''
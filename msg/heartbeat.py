@@ -15,14 +15,22 @@ class Heartbeat(BaseMessage):
     """
         Heartbeat message is send from the controller to the master to signalize that it is still alive.
         This will happen, when the worker of the controller are all busy for a longer time period.
+
+        A remote task generator sends it to the generator feed with the total number of tasks sent so far,
+        so the master can resynchronize the credit granted.
     """
 
-    def __init__(self, sender):
+    def __init__(self, sender, sent_count=None):
 
         if not sender:
             raise RuntimeError('No sender is set!')
 
-        super().__init__(MessageType.HEARTBEAT(), sender)
+        body = sender
+
+        if sent_count is not None:
+            body += self.field_separator + str(sent_count)
+
+        super().__init__(MessageType.HEARTBEAT(), body)
 
     def _validate(self):
 
@@ -31,4 +39,14 @@ class Heartbeat(BaseMessage):
 
     @property
     def sender(self):
-        return self.body
+        return self.body.split(BaseMessage.field_separator)[0]
+
+    @property
+    def sent_count(self):
+
+        body_items = self.body.split(BaseMessage.field_separator)
+
+        if len(body_items) > 1:
+            return int(body_items[1])
+
+        return None
@@ -19,6 +19,13 @@ from msg.task_finished import TaskFinished
 from msg.acknowledge import Acknowledge
 from msg.heartbeat import Heartbeat
 from msg.exit_command import ExitCommand
+from msg.task_credit import TaskCredit
+from msg.exit_notification import ExitNotification
+from msg.control_command import ControlCommand
+from msg.task_template_assign import TaskTemplateAssign
+from msg.task_delta_assign import TaskDeltaAssign
+from msg.task_return import TaskReturn
+from msg.task_finished_batch import TaskFinishedBatch
 
 class MessageFactory(metaclass=ABCMeta):
 
@@ -45,9 +52,21 @@ class MessageFactory(metaclass=ABCMeta):
         if msg_type == MessageType.TASK_REQUEST() and len_message_items == 2:
             return TaskRequest(message_items[1])
 
+        if msg_type == MessageType.TASK_REQUEST() and len_message_items == 3:
+            return TaskRequest(message_items[1], message_items[2])
+
         if msg_type == MessageType.TASK_FINISHED() and len_message_items == 3:
             return TaskFinished(message_items[1], message_items[2])
 
+        if msg_type == MessageType.TASK_FINISHED() and len_message_items == 4:
+            return TaskFinished(message_items[1], message_items[2], message_items[3])
+
+        if msg_type == MessageType.TASK_FINISHED_BATCH() and len_message_items > 3 and len_message_items % 2 == 0:
+            return TaskFinishedBatch(message_items[1], list(zip(message_items[2::2], message_items[3::2])))
+
+        if msg_type == MessageType.TASK_RETURN() and len_message_items > 2:
+            return TaskReturn(message_items[1], message_items[2:])
+
         if msg_type == MessageType.ACKNOWLEDGE() and len_message_items == 1:
             return Acknowledge()
 
@@ -57,10 +76,31 @@ class MessageFactory(metaclass=ABCMeta):
         if msg_type == MessageType.HEARTBEAT() and len_message_items == 2:
             return Heartbeat(message_items[1])
 
+        if msg_type == MessageType.HEARTBEAT() and len_message_items == 3:
+            return Heartbeat(message_items[1], message_items[2])
+
         if msg_type == MessageType.EXIT_COMMAND() and len_message_items == 1:
             return ExitCommand()
 
+        if msg_type == MessageType.TASK_CREDIT() and len_message_items == 2:
+            return TaskCredit(message_items[1])
+
+        if msg_type == MessageType.EXIT_NOTIFICATION() and len_message_items == 2:
+            return ExitNotification(message_items[1])
+
+        if msg_type == MessageType.CONTROL_COMMAND() and len_message_items == 2:
+            return ControlCommand(message_items[1])
+
+        if msg_type == MessageType.CONTROL_COMMAND() and len_message_items == 3:
+            return ControlCommand(message_items[1], message_items[2])
+
         if msg_type == MessageType.TASK_ASSIGN():
             return TaskAssign(message)
 
+        if msg_type == MessageType.TASK_TEMPLATE_ASSIGN():
+            return TaskTemplateAssign(message)
+
+        if msg_type == MessageType.TASK_DELTA_ASSIGN():
+            return TaskDeltaAssign(message)
+
         raise RuntimeError(f"No message could be created from: {message}")
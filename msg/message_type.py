@@ -42,3 +42,31 @@ class MessageType(metaclass=ABCMeta):
     @staticmethod
     def EXIT_COMMAND():
         return 'EXIT_CMD'
+
+    @staticmethod
+    def TASK_CREDIT():
+        return 'TASK_CRD'
+
+    @staticmethod
+    def EXIT_NOTIFICATION():
+        return 'EXIT_NTF'
+
+    @staticmethod
+    def CONTROL_COMMAND():
+        return 'CTRL_CMD'
+
+    @staticmethod
+    def TASK_TEMPLATE_ASSIGN():
+        return 'TASK_TPL'
+
+    @staticmethod
+    def TASK_DELTA_ASSIGN():
+        return 'TASK_DLT'
+
+    @staticmethod
+    def TASK_RETURN():
+        return 'TASK_RET'
+
+    @staticmethod
+    def TASK_FINISHED_BATCH():
+        return 'TASK_FNB'
@@ -8,6 +8,7 @@
 # the terms of the GNU General Public Licence version 3 (GPL Version 3),
 # copied verbatim in the file "LICENCE".
 
+import functools
 import inspect
 
 from msg.base_message import BaseMessage
@@ -53,6 +54,10 @@ class TaskAssign(BaseMessage):
                 task_class  + BaseMessage.field_separator + \
                 task_id
 
+            # An optional timeout follows the TID.
+            if TaskFactory.header_item_count(task_module, task_class, count_message_items, 4) == 5:
+                header += BaseMessage.field_separator + message_items[4]
+
             len_header = len(header)
 
             if len_header < len_message:
@@ -101,29 +106,39 @@ class TaskAssign(BaseMessage):
             + task_class.__name__     + BaseMessage.field_separator \
             + task.tid
 
+        # The timeout is just appended, if set, so the header is the same as without timeouts otherwise.
+        if task.timeout:
+            header += BaseMessage.field_separator + str(task.timeout)
+
         return header
 
     @staticmethod
     def _create_body(task, task_class):
 
-        body = None
+        task_args = TaskAssign.task_args(task, task_class)
 
-        args_list = inspect.getfullargspec(task_class.__init__).args
-        len_args_list = len(args_list)
+        if not task_args:
+            return None
 
-        # Skip first parameter 'self' of the __init__ method which is a convention in Python for that method.
-        if len_args_list > 1:
+        return BaseMessage.field_separator.join(task_args)
 
-            body = str(getattr(task, args_list[1]))
+    @staticmethod
+    def task_args(task, task_class=None) -> list[str]:
+        """Returns the values of the arguments of the __init__ method of the task as strings."""
+
+        if not task_class:
+            task_class = task.__class__
 
-            if len_args_list > 2:
+        # Ordering of the arguments from the __init__ method is relevant!
+        # getattr throws an exception if an argument is not found in the task object.
+        return [str(getattr(task, arg_name)) for arg_name in TaskAssign._init_arg_names(task_class)]
 
-                # Ordering of the arguments from the __init__ method is relevant!
-                # getattr throws an exception if an argument is not found in the task object.
-                for index in range(2, len(args_list)):
-                    body += BaseMessage.field_separator + str(getattr(task, args_list[index]))
+    @staticmethod
+    @functools.lru_cache(maxsize=None)
+    def _init_arg_names(task_class) -> tuple:
 
-        return body
+        # Skip first parameter 'self' of the __init__ method which is a convention in Python for that method.
+        return tuple(inspect.getfullargspec(task_class.__init__).args[1:])
 
     def to_task(self):
         return TaskFactory.create_from_message(BaseMessage(self.header, self.body))
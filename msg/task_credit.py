@@ -0,0 +1,36 @@
+#!/usr/bin/env python3
+#
+# -*- coding: utf-8 -*-
+#
+# © Copyright 2023 GSI Helmholtzzentrum für Schwerionenforschung
+#
+# This software is distributed under
+# the terms of the GNU General Public Licence version 3 (GPL Version 3),
+# copied verbatim in the file "LICENCE".
+
+from msg.base_message import BaseMessage
+from msg.message_type import MessageType
+
+class TaskCredit(BaseMessage):
+    """
+        Master sends this message to a remote task generator connected to the generator feed
+        to allow sending tasks until the given total number of tasks sent is reached.
+
+        Tasks are kept by the remote task generator until credit is granted,
+        so the master just buffers a small window of tasks of each remote task generator.
+    """
+
+    def __init__(self, count):
+        super().__init__(MessageType.TASK_CREDIT(), str(count))
+
+    def _validate(self):
+
+        if not self.body:
+            raise RuntimeError('No body is set!')
+
+        if int(self.body) < 1:
+            raise RuntimeError(f"Invalid task credit count: {self.body}")
+
+    @property
+    def count(self):
+        return int(self.body)
@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+#
+# -*- coding: utf-8 -*-
+#
+# © Copyright 2023 GSI Helmholtzzentrum für Schwerionenforschung
+#
+# This software is distributed under
+# the terms of the GNU General Public Licence version 3 (GPL Version 3),
+# copied verbatim in the file "LICENCE".
+
+from msg.base_message import BaseMessage
+from msg.message_type import MessageType
+
+class TaskDeltaAssign(BaseMessage):
+    """The Master sends this message to a controller to assign a task by a template cached on the controller.
+
+    The body contains pairs of argument index and value for the arguments differing from the template.
+    """
+
+    """
+        The __init__ method can take two different types of arguments:
+
+        1. A string based object - if the controller retrieves this message from the master.
+        2. A template id with the task id and a dict of the differing arguments by index
+           - if the master sends this message to a controller.
+    """
+    def __init__(self, value, tid=None, delta=None):
+
+        header = None
+        body = None
+
+        if not value:
+            raise RuntimeError("No value object has been passed!")
+
+        # Initialization by a passed string based object.
+        if tid is None:
+
+            message_items = value.split(BaseMessage.field_separator)
+
+            if len(message_items) < 3:
+                raise RuntimeError(f"Invalid header size found in message: '{value}'")
+
+            if len(message_items) % 2 == 0:
+                raise RuntimeError(f"Incomplete delta found in message: '{value}'")
+
+            header = BaseMessage.field_separator.join(message_items[:3])
+
+            if len(message_items) > 3:
+                body = BaseMessage.field_separator.join(message_items[3:])
+
+        # Initialization by a passed template id, task id and delta.
+        else:
+
+            header = \
+                MessageType.TASK_DELTA_ASSIGN() + BaseMessage.field_separator \
+                + str(value) + BaseMessage.field_separator \
+                + tid
+
+            if delta:
+
+                body = BaseMessage.field_separator.join(
+                    f"{index}{BaseMessage.field_separator}{arg}" for index, arg in delta.items())
+
+        super().__init__(header, body)
+
+    @property
+    def template_id(self):
+        return self.header.split(BaseMessage.field_separator)[1]
+
+    @property
+    def tid(self):
+        return self.header.split(BaseMessage.field_separator)[2]
+
+    @property
+    def delta(self) -> dict[int, str]:
+
+        if not self.body:
+            return {}
+
+        body_items = self.body.split(BaseMessage.field_separator)
+
+        return {int(body_items[i]): body_items[i + 1] for i in range(0, len(body_items), 2)}
+
+    def to_task(self, template):
+        """Creates the task from the TaskTemplateAssign cached by the controller."""
+
+        if template.template_id != self.template_id:
+            raise RuntimeError(f"Template mismatch for task: {self.tid}")
+
+        args = template.args
+
+        for index, arg in self.delta.items():
+            args[index] = arg
+
+        return template.create_task(self.tid, args)
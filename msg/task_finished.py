@@ -14,7 +14,13 @@ from msg.message_type import MessageType
 class TaskFinished(BaseMessage):
     """Controller sends this message to the master when a task is finished."""
 
-    def __init__(self, sender, tid):
+    STATUS_OK        = 'OK'
+    STATUS_FAILED    = 'FAILED'
+    STATUS_CANCELLED = 'CANCELLED'
+    STATUS_TIMEOUT   = 'TIMEOUT'
+
+    def __init__(self, sender, tid, status=None):
+        """The optional status tells whether the task execution failed, was cancelled or timed out, otherwise it is taken as ok."""
 
         if not sender:
             raise RuntimeError('No sender is set!')
@@ -24,6 +30,9 @@ class TaskFinished(BaseMessage):
 
         body = sender + self.field_separator + tid
 
+        if status:
+            body += self.field_separator + status
+
         super().__init__(MessageType.TASK_FINISHED(), body)
 
     def _validate(self):
@@ -38,3 +47,25 @@ class TaskFinished(BaseMessage):
     @property
     def tid(self):
         return self.body.split(BaseMessage.field_separator)[1]
+
+    @property
+    def status(self):
+
+        body_items = self.body.split(BaseMessage.field_separator)
+
+        if len(body_items) > 2:
+            return body_items[2]
+
+        return TaskFinished.STATUS_OK
+
+    @property
+    def failed(self):
+        return self.status == TaskFinished.STATUS_FAILED
+
+    @property
+    def cancelled(self):
+        return self.status == TaskFinished.STATUS_CANCELLED
+
+    @property
+    def timed_out(self):
+        return self.status == TaskFinished.STATUS_TIMEOUT
@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+#
+# -*- coding: utf-8 -*-
+#
+# © Copyright 2023 GSI Helmholtzzentrum für Schwerionenforschung
+#
+# This software is distributed under
+# the terms of the GNU General Public Licence version 3 (GPL Version 3),
+# copied verbatim in the file "LICENCE".
+
+from msg.base_message import BaseMessage
+from msg.message_type import MessageType
+
+class TaskFinishedBatch(BaseMessage):
+    """Controller sends this message to the master when several tasks are finished.
+
+    Each finished task is given by its TID and its status as for the TaskFinished message,
+    so the controller reports a batch of finished tasks by a single exchange with the master.
+    """
+
+    def __init__(self, sender, items):
+        """The items are tuples of the TID and the status of each finished task."""
+
+        if not sender:
+            raise RuntimeError('No sender is set!')
+
+        if not items:
+            raise RuntimeError('No items are set!')
+
+        body = sender
+
+        for tid, status in items:
+
+            if not tid or not status:
+                raise RuntimeError(f"Invalid item in task finished batch: {tid} - {status}")
+
+            body += self.field_separator + tid + self.field_separator + status
+
+        super().__init__(MessageType.TASK_FINISHED_BATCH(), body)
+
+    def _validate(self):
+
+        if not self.body:
+            raise RuntimeError('No body is set!')
+
+    @property
+    def sender(self):
+        return self.body.split(BaseMessage.field_separator)[0]
+
+    @property
+    def items(self):
+
+        body_items = self.body.split(BaseMessage.field_separator)
+
+        return list(zip(body_items[1::2], body_items[2::2]))
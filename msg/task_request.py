@@ -14,12 +14,18 @@ from msg.message_type import MessageType
 class TaskRequest(BaseMessage):
     """Controller sends this message to the master for requesting a task."""
 
-    def __init__(self, sender):
+    def __init__(self, sender, session=None):
+        """The optional session identifies the task templates cached by the controller."""
 
         if not sender:
             raise RuntimeError('No sender is set!')
 
-        super().__init__(MessageType.TASK_REQUEST(), sender)
+        body = sender
+
+        if session:
+            body += BaseMessage.field_separator + session
+
+        super().__init__(MessageType.TASK_REQUEST(), body)
 
     def _validate(self):
 
@@ -28,4 +34,14 @@ class TaskRequest(BaseMessage):
 
     @property
     def sender(self):
-        return self.body
+        return self.body.split(BaseMessage.field_separator)[0]
+
+    @property
+    def session(self):
+
+        body_items = self.body.split(BaseMessage.field_separator)
+
+        if len(body_items) > 1:
+            return body_items[1]
+
+        return None
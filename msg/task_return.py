@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+#
+# -*- coding: utf-8 -*-
+#
+# © Copyright 2023 GSI Helmholtzzentrum für Schwerionenforschung
+#
+# This software is distributed under
+# the terms of the GNU General Public Licence version 3 (GPL Version 3),
+# copied verbatim in the file "LICENCE".
+
+from msg.base_message import BaseMessage
+from msg.message_type import MessageType
+
+class TaskReturn(BaseMessage):
+    """Controller sends this message to the master to return assigned tasks not executed.
+
+    Tasks are returned e.g. if they are prefetched by the controller on shutdown or expired before execution,
+    so the master dispatches them again or drops them if expired.
+
+    A range task executed partially is returned by its TID and the RangeSet of its tasks not finished,
+    joined by the index range separator, so the master dispatches just these tasks again.
+    """
+
+    # Status of a task returned by a worker without execution.
+    STATUS_RETURNED = 'RETURNED'
+
+    index_range_separator = '='
+
+    def __init__(self, sender, tids):
+
+        if not sender:
+            raise RuntimeError('No sender is set!')
+
+        if not tids:
+            raise RuntimeError('No tids are set!')
+
+        body = sender + self.field_separator + self.field_separator.join(tids)
+
+        super().__init__(MessageType.TASK_RETURN(), body)
+
+    def _validate(self):
+
+        if not self.body:
+            raise RuntimeError('No body is set!')
+
+    @property
+    def sender(self):
+        return self.body.split(BaseMessage.field_separator)[0]
+
+    @property
+    def tids(self):
+        return self.body.split(BaseMessage.field_separator)[1:]
+
+    @staticmethod
+    def range_item(tid: str, index_range: str) -> str:
+        """Returns the item to return a range task partially by its TID and the range of its tasks not finished."""
+        return tid + TaskReturn.index_range_separator + index_range
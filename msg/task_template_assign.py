@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+#
+# -*- coding: utf-8 -*-
+#
+# © Copyright 2023 GSI Helmholtzzentrum für Schwerionenforschung
+#
+# This software is distributed under
+# the terms of the GNU General Public Licence version 3 (GPL Version 3),
+# copied verbatim in the file "LICENCE".
+
+from msg.base_message import BaseMessage
+from msg.message_type import MessageType
+from msg.task_assign import TaskAssign
+from task.task_factory import TaskFactory
+
+class TaskTemplateAssign(BaseMessage):
+    """The Master sends this message to a controller to assign a task and to register its arguments as template.
+
+    Following tasks of the same template are sent as TaskDeltaAssign with just the differing arguments,
+    they get the timeout of the template.
+    """
+
+    """
+        The __init__ method can take two different types of arguments:
+
+        1. A string based object - if the controller retrieves this message from the master.
+        2. A template id and a task based object - if the master sends this message to a controller.
+    """
+    def __init__(self, value, task=None):
+
+        header = None
+        body = None
+
+        if not value:
+            raise RuntimeError("No value object has been passed!")
+
+        # Initialization by a passed string based object.
+        if type(value) == str and task is None:
+
+            message_items = value.split(BaseMessage.field_separator)
+
+            if len(message_items) < 5:
+                raise RuntimeError(f"Invalid header size found in message: '{value}'")
+
+            # An optional timeout follows the TID.
+            len_header_items = \
+                TaskFactory.header_item_count(message_items[2], message_items[3], len(message_items), 5)
+
+            header = BaseMessage.field_separator.join(message_items[:len_header_items])
+
+            if len(message_items) > len_header_items:
+                body = BaseMessage.field_separator.join(message_items[len_header_items:])
+
+        # Initialization by a passed template id and task based object.
+        else:
+
+            task_header_items = TaskAssign(task).header.split(BaseMessage.field_separator)
+
+            header = \
+                MessageType.TASK_TEMPLATE_ASSIGN() + BaseMessage.field_separator \
+                + str(value) + BaseMessage.field_separator \
+                + BaseMessage.field_separator.join(task_header_items[1:])
+
+            body = BaseMessage.field_separator.join(TaskAssign.task_args(task))
+
+        super().__init__(header, body)
+
+    @property
+    def template_id(self):
+        return self.header.split(BaseMessage.field_separator)[1]
+
+    @property
+    def tid(self):
+        return self.header.split(BaseMessage.field_separator)[4]
+
+    @property
+    def timeout(self):
+        """Timeout of the tasks of the template or None, if not set."""
+
+        header_items = self.header.split(BaseMessage.field_separator)
+
+        if len(header_items) > 5:
+            return header_items[5]
+
+        return None
+
+    @property
+    def args(self) -> list[str]:
+
+        if self.body:
+            return self.body.split(BaseMessage.field_separator)
+
+        return []
+
+    def create_task(self, tid, args):
+        """Creates a task of the template with the given task id and arguments."""
+
+        header_items = self.header.split(BaseMessage.field_separator)
+
+        header = \
+            MessageType.TASK_ASSIGN() + BaseMessage.field_separator \
+            + header_items[2] + BaseMessage.field_separator \
+            + header_items[3] + BaseMessage.field_separator \
+            + tid
+
+        if self.timeout:
+            header += BaseMessage.field_separator + self.timeout
+
+        return TaskFactory.create_from_message(BaseMessage(header, BaseMessage.field_separator.join(args)))
+
+    def to_task(self):
+        return self.create_task(self.tid, self.args)
@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+#
+# -*- coding: utf-8 -*-
+#
+# © Copyright 2023 GSI Helmholtzzentrum für Schwerionenforschung
+#
+# This software is distributed under
+# the terms of the GNU General Public Licence version 3 (GPL Version 3),
+# copied verbatim in the file "LICENCE".
+
+"""Module for scheduling policies"""
+
+import abc
+
+from ctrl.critical_section import CriticalSection
+from ctrl.task_source import TaskSource
+from task.base_task import BaseTask
+
+class BaseScheduler(metaclass=abc.ABCMeta):
+    """Base class of the scheduling policies deciding which task is dispatched next to a controller.
+
+    The TaskDispatcher feeds the scheduler with events: task requests by next_task,
+    dispatched and finished tasks, heartbeats of controllers and periodic timer events.
+    Limits, expired deadlines and task resends are still handled by the TaskDispatcher,
+    so a policy just has to pick the next task from the task sources.
+
+    Tasks are popped on demand from the task sources, a policy might buffer a window of them to choose from.
+    """
+
+    def __init__(self) -> None:
+
+        self._next_task_source_index = 0
+
+        # Set by popping from the task sources, so the TaskDispatcher can stop the task distribution.
+        self.task_sources_alive = True
+
+    @abc.abstractmethod
+    def next_task(self, controller: str, task_sources: list[TaskSource]) -> tuple:
+        """Returns the next task for the controller and its task source, otherwise (None, None)."""
+        raise NotImplementedError('Must be implemented in subclass!')
+
+    def pending_count(self) -> int:
+        """Returns the number of tasks buffered by the scheduler."""
+        return 0
+
+    def on_dispatch(self, controller: str, task: BaseTask, task_source: TaskSource) -> None:
+        pass
+
+    def on_finish(self, controller: str, tid: str, task_source_name: str) -> None:
+        pass
+
+    def on_heartbeat(self, controller: str) -> None:
+        pass
+
+    def on_timer(self, timestamp: float) -> None:
+        pass
+
+    def forget(self, controller: str) -> None:
+        pass
+
+    def _pop_source_task(self, task_sources: list[TaskSource]) -> tuple:
+        """Pops the next task from the task sources in a round-robin way.
+
+        Returns
+        -------
+        tuple
+            the task and its task source, otherwise (None, None) if no task is available.
+        """
+
+        len_task_sources = len(task_sources)
+
+        found_alive_task_source = False
+
+        for i in range(len_task_sources):
+
+            task_source = task_sources[(self._next_task_source_index + i) % len_task_sources]
+
+            task, alive = BaseScheduler._pop_from(task_source)
+
+            if task:
+
+                self._next_task_source_index = (self._next_task_source_index + i + 1) % len_task_sources
+                self.task_sources_alive = True
+
+                return task, task_source
+
+            if alive:
+                found_alive_task_source = True
+
+        self.task_sources_alive = found_alive_task_source
+
+        return None, None
+
+    @staticmethod
+    def _pop_from(task_source: TaskSource) -> tuple:
+        """Pops a task from the task source.
+
+        Returns
+        -------
+        tuple
+            the task or None and if the task source might provide further tasks.
+        """
+
+        with CriticalSection(task_source.task_queue.lock, timeout=1) as critical_section:
+
+            if not critical_section.is_locked():
+                return None, True
+
+            if not task_source.task_queue.is_empty():
+
+                task = task_source.task_queue.pop_nowait()
+
+                if task:
+                    return task, True
+
+            return None, task_source.is_alive()
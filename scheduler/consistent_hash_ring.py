@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+#
+# -*- coding: utf-8 -*-
+#
+# © Copyright 2023 GSI Helmholtzzentrum für Schwerionenforschung
+#
+# This software is distributed under
+# the terms of the GNU General Public Licence version 3 (GPL Version 3),
+# copied verbatim in the file "LICENCE".
+
+"""Module for scheduling policies"""
+
+import bisect
+import hashlib
+
+class ConsistentHashRing:
+    """Maps keys to nodes by a consistent hash ring.
+
+    Each node is placed on the ring multiple times as virtual nodes for an even distribution of the keys.
+    Adding or removing a node just remaps the keys of the neighbouring virtual nodes,
+    so most keys stay on their node.
+
+    A stable hash is used instead of the builtin hash, which is randomized per process.
+    """
+
+    def __init__(self, replicas: int = 100) -> None:
+
+        if replicas < 1:
+            raise RuntimeError(f"Invalid number of replicas for consistent hash ring: {replicas}")
+
+        self._replicas = replicas
+
+        self._hash_list = []
+        self._hash_node_dict = dict[int, str]()
+        self._nodes = set[str]()
+
+    def __contains__(self, node: str) -> bool:
+        return node in self._nodes
+
+    def __len__(self) -> int:
+        return len(self._nodes)
+
+    @staticmethod
+    def _hash(value: str) -> int:
+        return int.from_bytes(hashlib.md5(value.encode()).digest()[:8], 'big')
+
+    def add(self, node: str) -> None:
+
+        if node in self._nodes:
+            return
+
+        self._nodes.add(node)
+
+        for i in range(self._replicas):
+
+            node_hash = ConsistentHashRing._hash(f"{node}#{i}")
+
+            # Collisions of virtual nodes are very unlikely, the first node keeps the position.
+            if node_hash in self._hash_node_dict:
+                continue
+
+            bisect.insort(self._hash_list, node_hash)
+            self._hash_node_dict[node_hash] = node
+
+    def remove(self, node: str) -> None:
+
+        if node not in self._nodes:
+            return
+
+        self._nodes.remove(node)
+
+        self._hash_list = [node_hash for node_hash in self._hash_list if self._hash_node_dict[node_hash] != node]
+        self._hash_node_dict = {node_hash: self._hash_node_dict[node_hash] for node_hash in self._hash_list}
+
+    def node(self, key: str) -> str:
+        """Returns the node of the key, otherwise None if the ring is empty."""
+
+        if not self._hash_list:
+            return None
+
+        index = bisect.bisect(self._hash_list, ConsistentHashRing._hash(key)) % len(self._hash_list)
+
+        return self._hash_node_dict[self._hash_list[index]]
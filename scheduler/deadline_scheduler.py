@@ -0,0 +1,22 @@
+#!/usr/bin/env python3
+#
+# -*- coding: utf-8 -*-
+#
+# © Copyright 2023 GSI Helmholtzzentrum für Schwerionenforschung
+#
+# This software is distributed under
+# the terms of the GNU General Public Licence version 3 (GPL Version 3),
+# copied verbatim in the file "LICENCE".
+
+"""Module for scheduling policies"""
+
+import math
+
+from scheduler.ordered_scheduler import OrderedScheduler
+from task.base_task import BaseTask
+
+class DeadlineScheduler(OrderedScheduler):
+    """Dispatches the buffered tasks in order of the earliest deadline first, tasks without deadline last."""
+
+    def _order_key(self, task: BaseTask):
+        return task.deadline if task.deadline is not None else math.inf
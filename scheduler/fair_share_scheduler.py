@@ -0,0 +1,228 @@
+#!/usr/bin/env python3
+#
+# -*- coding: utf-8 -*-
+#
+# © Copyright 2023 GSI Helmholtzzentrum für Schwerionenforschung
+#
+# This software is distributed under
+# the terms of the GNU General Public Licence version 3 (GPL Version 3),
+# copied verbatim in the file "LICENCE".
+
+"""Module for scheduling policies"""
+
+import heapq
+import time
+
+from ctrl.task_source import TaskSource
+from scheduler.base_scheduler import BaseScheduler
+from task.base_task import BaseTask
+
+class FairShareScheduler(BaseScheduler):
+    """Dispatches from the most under-served task source by its recently consumed worker-seconds.
+
+    The usage of a task source is the runtime of its tasks from dispatch until finish,
+    including the time running tasks are in flight so far, decayed by a half-life, so past usage counts less.
+    The time in flight is accrued to the usage of a task source on each change of its tasks in flight
+    and on each decay, so the runtime of long running tasks is decayed as well.
+
+    Task sources are tried in order of the lowest usage relative to their share by a heap,
+    so e.g. a long running migration campaign does not starve the routine OST monitoring.
+    Just the entry of the task source that changed is pushed again, the heap is rebuilt on decay only.
+
+    Shares are weights keyed by the lower-case name of the task source, 1 by default.
+    """
+
+    # Min seconds between decays, which rebuild the heap.
+    DECAY_INTERVAL = 1
+
+    def __init__(self, shares: dict[str, float] = None, half_life: float = 3600) -> None:
+
+        super().__init__()
+
+        if half_life <= 0:
+            raise RuntimeError(f"Invalid half-life for fair-share scheduler: {half_life}")
+
+        self._shares = shares if shares else {}
+        self._half_life = half_life
+
+        # Per task source the decayed usage accrued until its accrual timestamp and its number of tasks in flight.
+        self._usage_dict = dict[str, float]()
+        self._accrual_timestamp_dict = dict[str, float]()
+        self._in_flight_dict = dict[str, int]()
+        self._decay_timestamp = time.time()
+
+        self._tid_dict = dict[str, tuple[str, str]]()
+
+        # Heap of the task sources by their relative usage, entries not matching the version of a source are stale.
+        # Versions are kept for task sources gone, so their entries stay stale, if they are added again.
+        self._heap = []
+        self._version_dict = dict[str, int]()
+        self._task_source_dict = dict[str, TaskSource]()
+
+    def next_task(self, controller: str, task_sources: list[TaskSource]) -> tuple:
+
+        timestamp = time.time()
+
+        if timestamp - self._decay_timestamp >= FairShareScheduler.DECAY_INTERVAL:
+            self._decay(timestamp)
+
+        self._sync(task_sources)
+
+        tried_entry_list = []
+        task = None
+        task_source = None
+        found_alive_task_source = False
+
+        while self._heap:
+
+            entry = heapq.heappop(self._heap)
+
+            if entry[2] not in self._task_source_dict or self._version_dict[entry[2]] != entry[3]:
+                continue
+
+            tried_entry_list.append(entry)
+
+            task, alive = BaseScheduler._pop_from(self._task_source_dict[entry[2]])
+
+            if task:
+
+                task_source = self._task_source_dict[entry[2]]
+                break
+
+            if alive:
+                found_alive_task_source = True
+
+        # The entries tried are still valid, the entry of the task source dispatched from is replaced on dispatch.
+        for entry in tried_entry_list:
+            heapq.heappush(self._heap, entry)
+
+        self.task_sources_alive = bool(task) or found_alive_task_source
+
+        return task, task_source
+
+    def on_dispatch(self, controller: str, task: BaseTask, task_source: TaskSource) -> None:
+
+        # A resent task is still accounted once from its first dispatch.
+        if task.tid in self._tid_dict:
+            return
+
+        self._accrue(task_source.name, time.time())
+
+        self._tid_dict[task.tid] = (task_source.name, controller)
+        self._in_flight_dict[task_source.name] = self._in_flight_dict.get(task_source.name, 0) + 1
+
+        self._push(task_source.name)
+
+    def on_finish(self, controller: str, tid: str, task_source_name: str) -> None:
+        self._account(tid, time.time())
+
+    def on_timer(self, timestamp: float) -> None:
+        self._decay(timestamp)
+
+    def forget(self, controller: str) -> None:
+        """Accounts the tasks in flight of a controller that is gone, so they do not consume further."""
+
+        timestamp = time.time()
+
+        for tid, (_, tid_controller) in list(self._tid_dict.items()):
+
+            if tid_controller == controller:
+                self._account(tid, timestamp)
+
+    def share(self, task_source_name: str) -> float:
+        return self._shares.get(task_source_name.lower(), 1.0)
+
+    def usage(self, task_source_name: str, timestamp: float) -> float:
+        """Returns the decayed usage in worker-seconds of the task source including its tasks in flight."""
+
+        usage = self._usage_dict.get(task_source_name, 0.0)
+        in_flight = self._in_flight_dict.get(task_source_name, 0)
+
+        if in_flight:
+            usage += in_flight * (timestamp - self._accrual_timestamp_dict[task_source_name])
+
+        return usage
+
+    def in_flight(self, task_source_name: str) -> int:
+        return self._in_flight_dict.get(task_source_name, 0)
+
+    def _account(self, tid: str, timestamp: float) -> None:
+
+        item = self._tid_dict.pop(tid, None)
+
+        if not item:
+            return
+
+        task_source_name = item[0]
+
+        self._accrue(task_source_name, timestamp)
+
+        in_flight = self._in_flight_dict[task_source_name] - 1
+
+        if in_flight:
+            self._in_flight_dict[task_source_name] = in_flight
+        else:
+            del self._in_flight_dict[task_source_name]
+
+        self._push(task_source_name)
+
+    def _accrue(self, task_source_name: str, timestamp: float) -> None:
+        """Adds the time in flight since the last accrual to the usage of the task source."""
+
+        self._usage_dict[task_source_name] = self.usage(task_source_name, timestamp)
+        self._accrual_timestamp_dict[task_source_name] = timestamp
+
+    def _decay(self, timestamp: float) -> None:
+
+        elapsed = timestamp - self._decay_timestamp
+
+        if elapsed <= 0:
+            return
+
+        factor = 0.5 ** (elapsed / self._half_life)
+
+        for task_source_name in self._usage_dict:
+
+            self._accrue(task_source_name, timestamp)
+            self._usage_dict[task_source_name] *= factor
+
+        self._decay_timestamp = timestamp
+
+        self._heap = []
+
+        for task_source_name in self._task_source_dict:
+            self._push(task_source_name)
+
+    def _sync(self, task_sources: list[TaskSource]) -> None:
+        """Adds task sources not known yet to the heap and drops the task sources gone."""
+
+        for task_source in task_sources:
+
+            if self._task_source_dict.get(task_source.name) is not task_source:
+
+                self._task_source_dict[task_source.name] = task_source
+                self._push(task_source.name)
+
+        if len(self._task_source_dict) > len(task_sources):
+
+            task_source_name_set = {task_source.name for task_source in task_sources}
+
+            for task_source_name in list(self._task_source_dict):
+
+                if task_source_name not in task_source_name_set:
+
+                    del self._task_source_dict[task_source_name]
+
+    def _push(self, task_source_name: str) -> None:
+        """Pushes the current entry of the task source to the heap, which replaces its previous entry."""
+
+        if task_source_name not in self._task_source_dict:
+            return
+
+        version = self._version_dict.get(task_source_name, 0) + 1
+        self._version_dict[task_source_name] = version
+
+        relative_usage = self._usage_dict.get(task_source_name, 0.0) / self.share(task_source_name)
+
+        # Without usage yet, task sources with fewer tasks in flight are served first.
+        heapq.heappush(self._heap, (relative_usage, self.in_flight(task_source_name), task_source_name, version))
@@ -0,0 +1,20 @@
+#!/usr/bin/env python3
+#
+# -*- coding: utf-8 -*-
+#
+# © Copyright 2023 GSI Helmholtzzentrum für Schwerionenforschung
+#
+# This software is distributed under
+# the terms of the GNU General Public Licence version 3 (GPL Version 3),
+# copied verbatim in the file "LICENCE".
+
+"""Module for scheduling policies"""
+
+from ctrl.task_source import TaskSource
+from scheduler.base_scheduler import BaseScheduler
+
+class FifoScheduler(BaseScheduler):
+    """Dispatches the tasks in order of the task queues, alternating between the task sources."""
+
+    def next_task(self, controller: str, task_sources: list[TaskSource]) -> tuple:
+        return self._pop_source_task(task_sources)
@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+#
+# -*- coding: utf-8 -*-
+#
+# © Copyright 2023 GSI Helmholtzzentrum für Schwerionenforschung
+#
+# This software is distributed under
+# the terms of the GNU General Public Licence version 3 (GPL Version 3),
+# copied verbatim in the file "LICENCE".
+
+"""Module for scheduling policies"""
+
+import fnmatch
+
+from ctrl.task_source import TaskSource
+from scheduler.base_scheduler import BaseScheduler
+
+class LocalityScheduler(BaseScheduler):
+    """Buffers a window of tasks and prefers the tasks with a locality matching the requesting controller.
+
+    The locality of a task is a shell-style pattern of controller FQDNs e.g. of hosts with local access to the data.
+    Without a matching task a controller gets the oldest task without locality, otherwise the oldest task,
+    so tasks are not starved if no matching controller is requesting.
+    """
+
+    def __init__(self, window: int) -> None:
+
+        super().__init__()
+
+        if window < 1:
+            raise RuntimeError(f"Invalid window for scheduler: {window}")
+
+        self._window = window
+        self._buffer = []
+
+    def next_task(self, controller: str, task_sources: list[TaskSource]) -> tuple:
+
+        while len(self._buffer) < self._window:
+
+            task, task_source = self._pop_source_task(task_sources)
+
+            if not task:
+                break
+
+            self._buffer.append((task, task_source))
+
+        if not self._buffer:
+            return None, None
+
+        selected_index = None
+
+        for index, (task, _) in enumerate(self._buffer):
+
+            if task.locality is None:
+
+                if selected_index is None:
+                    selected_index = index
+
+            elif fnmatch.fnmatch(controller, task.locality):
+
+                selected_index = index
+                break
+
+        if selected_index is None:
+            selected_index = 0
+
+        return self._buffer.pop(selected_index)
+
+    def pending_count(self) -> int:
+        return len(self._buffer)
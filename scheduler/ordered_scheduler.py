@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+#
+# -*- coding: utf-8 -*-
+#
+# © Copyright 2023 GSI Helmholtzzentrum für Schwerionenforschung
+#
+# This software is distributed under
+# the terms of the GNU General Public Licence version 3 (GPL Version 3),
+# copied verbatim in the file "LICENCE".
+
+"""Module for scheduling policies"""
+
+import abc
+import heapq
+import itertools
+
+from ctrl.task_source import TaskSource
+from scheduler.base_scheduler import BaseScheduler
+from task.base_task import BaseTask
+
+class OrderedScheduler(BaseScheduler):
+    """Buffers a window of tasks from the task sources and dispatches them in order of a key.
+
+    Tasks with the same key are dispatched in the order they were popped from the task sources.
+    """
+
+    def __init__(self, window: int) -> None:
+
+        super().__init__()
+
+        if window < 1:
+            raise RuntimeError(f"Invalid window for scheduler: {window}")
+
+        self._window = window
+        self._heap = []
+        self._counter = itertools.count()
+
+    @abc.abstractmethod
+    def _order_key(self, task: BaseTask):
+        raise NotImplementedError('Must be implemented in subclass!')
+
+    def next_task(self, controller: str, task_sources: list[TaskSource]) -> tuple:
+
+        while len(self._heap) < self._window:
+
+            task, task_source = self._pop_source_task(task_sources)
+
+            if not task:
+                break
+
+            heapq.heappush(self._heap, (self._order_key(task), next(self._counter), task, task_source))
+
+        if not self._heap:
+            return None, None
+
+        _, _, task, task_source = heapq.heappop(self._heap)
+
+        return task, task_source
+
+    def pending_count(self) -> int:
+        return len(self._heap)
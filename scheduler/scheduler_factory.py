@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+#
+# -*- coding: utf-8 -*-
+#
+# © Copyright 2023 GSI Helmholtzzentrum für Schwerionenforschung
+#
+# This software is distributed under
+# the terms of the GNU General Public Licence version 3 (GPL Version 3),
+# copied verbatim in the file "LICENCE".
+
+"""Module for scheduling policies"""
+
+from scheduler.base_scheduler import BaseScheduler
+from scheduler.deadline_scheduler import DeadlineScheduler
+from scheduler.fair_share_scheduler import FairShareScheduler
+from scheduler.fifo_scheduler import FifoScheduler
+from scheduler.locality_scheduler import LocalityScheduler
+from scheduler.priority_scheduler import PriorityScheduler
+from scheduler.sticky_scheduler import StickyScheduler
+
+class SchedulerFactory:
+
+    POLICY_FIFO = 'fifo'
+    POLICY_DEADLINE = 'deadline'
+    POLICY_PRIORITY = 'priority'
+    POLICY_FAIR_SHARE = 'fair_share'
+    POLICY_LOCALITY = 'locality'
+    POLICY_STICKY = 'sticky'
+
+    POLICIES = (POLICY_FIFO, POLICY_DEADLINE, POLICY_PRIORITY, POLICY_FAIR_SHARE, POLICY_LOCALITY, POLICY_STICKY)
+
+    def __init__(self):
+        pass
+
+    @staticmethod
+    def create(policy: str,
+               window: int,
+               shares: dict[str, float] = None,
+               half_life: float = 3600,
+               sticky_wait: float = 2) -> BaseScheduler:
+        """Creates the scheduler of the policy.
+
+        The window is the number of tasks buffered by a policy,
+        shares and half-life of the usage are used by the fair-share policy
+        and the sticky wait in seconds by the sticky policy.
+        """
+
+        if policy == SchedulerFactory.POLICY_FIFO:
+            return FifoScheduler()
+
+        if policy == SchedulerFactory.POLICY_DEADLINE:
+            return DeadlineScheduler(window)
+
+        if policy == SchedulerFactory.POLICY_PRIORITY:
+            return PriorityScheduler(window)
+
+        if policy == SchedulerFactory.POLICY_FAIR_SHARE:
+            return FairShareScheduler(shares, half_life)
+
+        if policy == SchedulerFactory.POLICY_LOCALITY:
+            return LocalityScheduler(window)
+
+        if policy == SchedulerFactory.POLICY_STICKY:
+            return StickyScheduler(window, sticky_wait)
+
+        raise RuntimeError(f"Not supported scheduling policy: {policy}")
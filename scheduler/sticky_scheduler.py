@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+#
+# -*- coding: utf-8 -*-
+#
+# © Copyright 2023 GSI Helmholtzzentrum für Schwerionenforschung
+#
+# This software is distributed under
+# the terms of the GNU General Public Licence version 3 (GPL Version 3),
+# copied verbatim in the file "LICENCE".
+
+"""Module for scheduling policies"""
+
+import time
+
+from ctrl.task_source import TaskSource
+from scheduler.base_scheduler import BaseScheduler
+from scheduler.consistent_hash_ring import ConsistentHashRing
+
+class StickyScheduler(BaseScheduler):
+    """Buffers a window of tasks and assigns tasks with the same affinity key to the same controller.
+
+    The affinity keys are mapped to the controllers by a consistent hash ring,
+    so controllers joining or leaving just move the keys of their neighbours on the ring,
+    while other controllers keep their warm state e.g. cached stripe layouts or pre-created probe files.
+
+    A task waits for its controller up to the sticky wait in seconds,
+    afterwards it is dispatched to any requesting controller. Tasks without affinity key are not waiting.
+
+    Controllers join the ring on requests and heartbeats. They leave it on exit, if their heartbeat is lost,
+    or if they have not been seen for the member timeout.
+    """
+
+    MEMBER_TIMEOUT = 300
+
+    def __init__(self, window: int, sticky_wait: float) -> None:
+
+        super().__init__()
+
+        if window < 1:
+            raise RuntimeError(f"Invalid window for scheduler: {window}")
+
+        if sticky_wait < 0:
+            raise RuntimeError(f"Invalid sticky wait for scheduler: {sticky_wait}")
+
+        self._window = window
+        self._sticky_wait = sticky_wait
+
+        self._buffer = []
+        self._ring = ConsistentHashRing()
+        self._owner_dict = dict[str, str]()
+        self._last_seen_dict = dict[str, float]()
+
+    def next_task(self, controller: str, task_sources: list[TaskSource]) -> tuple:
+
+        timestamp = time.time()
+
+        self._touch(controller, timestamp)
+
+        while len(self._buffer) < self._window:
+
+            task, task_source = self._pop_source_task(task_sources)
+
+            if not task:
+                break
+
+            self._buffer.append((task, task_source, timestamp))
+
+        selected_index = None
+
+        for index, (task, _, buffer_timestamp) in enumerate(self._buffer):
+
+            if task.affinity_key is None:
+
+                if selected_index is None:
+                    selected_index = index
+
+            elif self.owner(task.affinity_key) == controller:
+
+                selected_index = index
+                break
+
+            elif selected_index is None and timestamp - buffer_timestamp >= self._sticky_wait:
+                selected_index = index
+
+        if selected_index is None:
+            return None, None
+
+        task, task_source, _ = self._buffer.pop(selected_index)
+
+        return task, task_source
+
+    def pending_count(self) -> int:
+        return len(self._buffer)
+
+    def on_heartbeat(self, controller: str) -> None:
+        self._touch(controller, time.time())
+
+    def on_finish(self, controller: str, tid: str, task_source_name: str) -> None:
+        self._touch(controller, time.time())
+
+    def on_timer(self, timestamp: float) -> None:
+
+        threshold = timestamp - StickyScheduler.MEMBER_TIMEOUT
+
+        for controller, last_seen in list(self._last_seen_dict.items()):
+
+            if last_seen < threshold:
+                self.forget(controller)
+
+    def forget(self, controller: str) -> None:
+
+        self._last_seen_dict.pop(controller, None)
+
+        if controller in self._ring:
+
+            self._ring.remove(controller)
+            self._owner_dict.clear()
+
+    def owner(self, affinity_key) -> str:
+        """Returns the controller the affinity key is mapped to, cached until the controllers change."""
+
+        owner = self._owner_dict.get(affinity_key)
+
+        if owner is None:
+
+            owner = self._ring.node(str(affinity_key))
+            self._owner_dict[affinity_key] = owner
+
+        return owner
+
+    def _touch(self, controller: str, timestamp: float) -> None:
+
+        self._last_seen_dict[controller] = timestamp
+
+        if controller not in self._ring:
+
+            self._ring.add(controller)
+            self._owner_dict.clear()
@@ -9,6 +9,7 @@
 # copied verbatim in the file "LICENCE".
 
 import abc
+import time
 
 class BaseTask(metaclass=abc.ABCMeta):
     """Base task class to be implemented so a task can be executed by a worker."""
@@ -20,11 +21,111 @@ class BaseTask(metaclass=abc.ABCMeta):
         super().__init__()
 
         self._tid = None
+        self._deadline = None
+        self._timeout = None
+        self._priority = 0
+        self._locality = None
 
     @abc.abstractmethod
     def execute(self):
         raise NotImplementedError('Must be implemented in subclass!')
 
+    async def execute_async(self):
+        """Optional asynchronous execution of the task e.g. for tasks waiting on the network or on subprocesses.
+
+        The asyncio executor of the controller awaits it instead of calling execute,
+        so many of such tasks are executed concurrently on its event loop.
+        Other executors call execute, which might just run it by asyncio.run.
+        """
+        raise NotImplementedError('Must be implemented in subclass!')
+
+    @property
+    def is_async(self):
+        """Tells whether the task implements the asynchronous execution."""
+        return type(self).execute_async is not BaseTask.execute_async
+
+    def on_cancel(self):
+        """Called by the worker after the execution of the task has been cancelled e.g. for cleaning up partial results.
+
+        The execution is interrupted by a TaskCancelledError that is not derived from Exception,
+        so it is not caught by exception handlers of the task catching Exception.
+        """
+
+    @property
+    def deadline(self):
+        """Optional point in time as UNIX timestamp after which the task is dropped by the master instead of dispatched."""
+        return self._deadline
+
+    @deadline.setter
+    def deadline(self, deadline):
+
+        if deadline is None:
+            self._deadline = None
+        else:
+            self._deadline = float(deadline)
+
+    def set_ttl(self, ttl):
+        """Sets the deadline of the task to the given number of seconds from now on."""
+
+        if float(ttl) <= 0:
+            raise ValueError(f"Argument ttl must be greater than 0: {ttl}")
+
+        self._deadline = time.time() + float(ttl)
+
+    def is_expired(self, timestamp):
+        return self._deadline is not None and timestamp >= self._deadline
+
+    @property
+    def timeout(self):
+        """Optional max seconds of the execution, after which the controller kills the worker and reports a timeout."""
+        return self._timeout
+
+    @timeout.setter
+    def timeout(self, timeout):
+
+        if timeout is None:
+            self._timeout = None
+            return
+
+        if float(timeout) <= 0:
+            raise ValueError(f"Timeout must be greater than 0: {timeout}")
+
+        self._timeout = float(timeout)
+
+    @property
+    def priority(self):
+        """Priority of the task used by the priority scheduling policy of the master, higher is dispatched first."""
+        return self._priority
+
+    @priority.setter
+    def priority(self, priority):
+        self._priority = int(priority)
+
+    @property
+    def locality(self):
+        """Optional shell-style pattern of controller FQDNs preferred by the locality scheduling policy of the master."""
+        return self._locality
+
+    @locality.setter
+    def locality(self, locality):
+        self._locality = locality
+
+    @property
+    def affinity_key(self):
+        """Optional key of state on a controller the task benefits from e.g. the probed OST,
+        used by the sticky scheduling policy of the master to assign tasks with the same key to the same controller."""
+        return None
+
+    @property
+    def class_name(self):
+        """Name of the task class, which the master limits the task dispatch by."""
+        return self.__class__.__name__
+
+    @property
+    def resource_key(self):
+        """Optional key of a resource the task puts load on, used by the master for limiting the task dispatch."""
+        return None
+
     @property
     def tid(self):
         return self._tid
@@ -0,0 +1,34 @@
+#!/usr/bin/env python3
+#
+# -*- coding: utf-8 -*-
+#
+# © Copyright 2023 GSI Helmholtzzentrum für Schwerionenforschung
+#
+# This software is distributed under
+# the terms of the GNU General Public Licence version 3 (GPL Version 3),
+# copied verbatim in the file "LICENCE".
+
+from task.base_task import BaseTask
+
+class CancelTask(BaseTask):
+    """CancelTask is pushed by a task generator into its task queue to retract a task pushed before.
+
+    The master does not dispatch it, but cancels the task with the TID to cancel instead.
+    A task not dispatched yet is dropped, a task running on a controller is cancelled there.
+    In both cases the TID of the cancelled task is pushed to the result queue of the task generator.
+    """
+
+    TID_PREFIX = 'CANCEL:'
+
+    def __init__(self, cancel_tid):
+
+        super().__init__()
+
+        if not cancel_tid:
+            raise ValueError('Argument cancel_tid must be set!')
+
+        self.cancel_tid = str(cancel_tid)
+        self.tid = CancelTask.TID_PREFIX + self.cancel_tid
+
+    def execute(self):
+        raise RuntimeError(f"CancelTask must not be executed: {self.cancel_tid}")
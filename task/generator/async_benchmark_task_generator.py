@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+#
+# -*- coding: utf-8 -*-
+#
+# © Copyright 2023 GSI Helmholtzzentrum für Schwerionenforschung
+#
+# This software is distributed under
+# the terms of the GNU General Public Licence version 3 (GPL Version 3),
+# copied verbatim in the file "LICENCE".
+
+"""Module for task generator"""
+
+import logging
+import time
+
+from conf.config_value_error import ConfigValueOutOfRangeError
+from ctrl.local_queue import LocalQueue
+from task.benchmark_task import BenchmarkTask
+from task.generator.base_async_task_generator import BaseAsyncTaskGenerator
+
+class AsyncBenchmarkTaskGenerator(BaseAsyncTaskGenerator):
+    """Class for Benchmark Task Generator running as coroutine within the asyncio master engine"""
+
+    def __init__(self, task_queue: LocalQueue, result_queue: LocalQueue, config_file: str) -> None:
+
+        super().__init__(task_queue, result_queue, config_file)
+
+        self._num_tasks = self._config.getint('control', 'num_tasks')
+        self._poll_time_ms = self._config.getint('control', 'poll_time_ms')
+
+    def validate_config(self) -> None:
+
+        min_num_tasks = 1
+        max_num_tasks = 100000000
+
+        if not min_num_tasks <= self._num_tasks <= max_num_tasks:
+            raise ConfigValueOutOfRangeError("num_tasks", min_num_tasks, max_num_tasks)
+
+        min_poll_time_ms = 1
+        max_poll_time_ms = 1000
+
+        if not min_poll_time_ms <= self._poll_time_ms <= max_poll_time_ms:
+            raise ConfigValueOutOfRangeError("poll_time_ms", min_poll_time_ms, max_poll_time_ms)
+
+    async def run(self) -> None:
+
+        logging.info(f"{self._name} active!")
+
+        task_list = list[BenchmarkTask]()
+
+        for i in range(self._num_tasks):
+
+            task = BenchmarkTask()
+            task.tid = str(i)
+            task_list.append(task)
+
+        self._task_queue.fill(task_list)
+
+        completed_tasks = 0
+        start_time = None
+
+        while self._run_flag and completed_tasks < self._num_tasks:
+
+            if completed_tasks == 1:
+                start_time = time.time() * 1000.0
+
+            # No polling interval required while results are available, since no IPC is involved.
+            tid = self._result_queue.pop_nowait()
+
+            if tid:
+                completed_tasks += 1
+                logging.debug("Task completed with TID: %s", tid)
+            else:
+                await self._sleep(self._poll_time_ms / 1000.0)
+
+        if start_time:
+
+            end_time = time.time() * 1000.0
+            duration = (end_time - start_time) / 1000.0
+            logging.info(f"Count of completed tasks: {completed_tasks} - It took: {duration}s")
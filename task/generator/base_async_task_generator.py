@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+#
+# -*- coding: utf-8 -*-
+#
+# © Copyright 2023 GSI Helmholtzzentrum für Schwerionenforschung
+#
+# This software is distributed under
+# the terms of the GNU General Public Licence version 3 (GPL Version 3),
+# copied verbatim in the file "LICENCE".
+
+"""Module for task generator"""
+
+import abc
+import asyncio
+import configparser
+import logging
+
+from ctrl.local_queue import LocalQueue
+
+class BaseAsyncTaskGenerator(metaclass=abc.ABCMeta):
+    """Base class for Task Generator running as coroutine inside the event loop of the asyncio master engine.
+
+    In contrast to the BaseTaskGenerator no process is forked, so tasks are passed
+    by LocalQueue objects to the master without any IPC involved.
+    """
+
+    def __init__(self, task_queue: LocalQueue, result_queue: LocalQueue, config_file: str) -> None:
+
+        super().__init__()
+
+        self._task_queue = task_queue
+        self._result_queue = result_queue
+
+        self._config = configparser.ConfigParser()
+        self._config.read_file(open(config_file))
+
+        self._name = self.__class__.__name__
+        self._run_flag = False
+
+        self._task : asyncio.Task = None
+        self._wakeup = asyncio.Event()
+
+    def start(self) -> None:
+        """Schedule the generator coroutine on the running event loop of the master."""
+
+        self.validate_config()
+
+        logging.info("%s started!", self._name)
+        self._run_flag = True
+        self._task = asyncio.get_running_loop().create_task(self._run_wrapper(), name=self._name)
+
+    def stop(self) -> None:
+
+        logging.info("%s received signal to terminate", self._name)
+        self._run_flag = False
+        self._wakeup.set()
+
+    def is_alive(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    async def join(self, timeout: float = None) -> None:
+        """Wait for the generator coroutine to finish and cancel it, if it does not finish in time."""
+
+        if self._task:
+
+            _, pending = await asyncio.wait([self._task], timeout=timeout)
+
+            if pending:
+                self._task.cancel()
+
+    @abc.abstractmethod
+    async def run(self) -> None:
+        raise NotImplementedError("Must be implemented in specific TaskGenerator class!")
+
+    @abc.abstractmethod
+    def validate_config(self) -> None:
+        raise NotImplementedError("Must be implemented in specific TaskGenerator class!")
+
+    async def _sleep(self, seconds: float) -> None:
+        """Sleep that returns early if the generator is stopped."""
+
+        try:
+            await asyncio.wait_for(self._wakeup.wait(), timeout=seconds)
+        except asyncio.TimeoutError:
+            pass
+
+    async def _run_wrapper(self) -> None:
+
+        try:
+            await self.run()
+        except Exception:
+            logging.exception("Caught exception in %s", self._name)
+            logging.info("%s exited!", self._name)
+            return
+
+        logging.info("%s finished!", self._name)
@@ -21,6 +21,7 @@ from ctrl.critical_section import CriticalSection
 from ctrl.shared_queue import SharedQueue
 from ctrl.shared_queue_str import SharedQueueStr
 from task.base_task import BaseTask
+from task.range_task import RangeTask
 from task.xml.task_xml_reader import TaskXmlReader
 from task.task_factory import TaskFactory
 from task.generator.base_task_generator import BaseTaskGenerator
@@ -35,6 +36,10 @@ class LustreOstMonitoringTaskGenerator(BaseTaskGenerator):
 
         self.local_mode = self._config.getboolean('control', 'local_mode')
         self.measure_interval = self._config.getint('control', 'measure_interval')
+        self.range_chunk_size = self._config.getint('control', 'range_chunk_size', fallback=0)
+
+        if self.range_chunk_size < 0:
+            raise RuntimeError(f"Invalid range chunk size: {self.range_chunk_size}")
 
         self.task_file = self._config.get('task', 'task_file')
         self.task_name = self._config.get('task', 'task_name')
@@ -101,6 +106,10 @@ class LustreOstMonitoringTaskGenerator(BaseTaskGenerator):
 
         task_skeleton = TaskFactory().create_from_xml_info(task_xml_info)
 
+        # Measurements are outdated with the next interval, so the master drops them if not dispatched in time.
+        if task_skeleton.deadline is None:
+            task_skeleton.set_ttl(self.measure_interval)
+
         task_list = list[BaseTask]()
 
         logging.debug("Creating task list...")
@@ -112,6 +121,21 @@ class LustreOstMonitoringTaskGenerator(BaseTaskGenerator):
             else:
                 logging.debug("Empty OST index list!")
 
+        # Chunks of the OST indexes are dispatched as a range task each, expanded by the controller.
+        if self.range_chunk_size:
+
+            ost_idx_list = sorted(ost_idx_set)
+
+            for i in range(0, len(ost_idx_list), self.range_chunk_size):
+
+                range_task = RangeTask.create(task_skeleton, 'ost_idx', ost_idx_list[i:i + self.range_chunk_size])
+
+                logging.debug("Create range task for OST indexes: %s", range_task.index_range)
+
+                task_list.append(range_task)
+
+            return task_list
+
         # Create tasks and set up runtime determined information
         # e.g. task ID and Lustre specific OST index
         for ost_idx in ost_idx_set:
@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+#
+# -*- coding: utf-8 -*-
+#
+# © Copyright 2023 GSI Helmholtzzentrum für Schwerionenforschung
+#
+# This software is distributed under
+# the terms of the GNU General Public Licence version 3 (GPL Version 3),
+# copied verbatim in the file "LICENCE".
+
+"""Module for task generator"""
+
+import asyncio
+import logging
+import os
+import signal
+import time
+
+from task.generator.base_task_generator import BaseTaskGenerator
+
+class ProcessTaskGeneratorAdapter:
+    """Adapter providing the lifecycle interface of the BaseAsyncTaskGenerator for a BaseTaskGenerator.
+
+    The wrapped task generator keeps running out of process as before,
+    so existing task generators can be used by each master engine.
+    """
+
+    STOP_WAIT_SECONDS = 10
+
+    def __init__(self, task_generator: BaseTaskGenerator) -> None:
+        self._task_generator = task_generator
+
+    def start(self) -> None:
+        self._task_generator.start()
+
+    def is_alive(self) -> bool:
+        return self._task_generator.is_alive()
+
+    def stop(self) -> None:
+        """Request the task generator process to finish by SIGUSR1 (non-blocking)."""
+
+        if self._task_generator.is_alive():
+            os.kill(self._task_generator.pid, signal.SIGUSR1)
+
+    def shutdown(self, timeout: int = STOP_WAIT_SECONDS) -> None:
+        """Stop the task generator process and terminate it, if it does not finish in time (blocking)."""
+
+        self.stop()
+
+        for _ in range(0, timeout, 1):
+
+            if self._task_generator.is_alive():
+                logging.debug('Waiting for Task Generator to finish...')
+                time.sleep(1)
+            else:
+                break
+
+        if self._task_generator.is_alive():
+            self._task_generator.terminate()
+            self._task_generator.join()
+
+    async def join(self, timeout: float = STOP_WAIT_SECONDS) -> None:
+        """Shutdown the task generator process without blocking the event loop."""
+        await asyncio.get_running_loop().run_in_executor(None, self.shutdown, int(timeout))
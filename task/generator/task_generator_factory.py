@@ -0,0 +1,40 @@
+#!/usr/bin/env python3
+#
+# -*- coding: utf-8 -*-
+#
+# © Copyright 2023 GSI Helmholtzzentrum für Schwerionenforschung
+#
+# This software is distributed under
+# the terms of the GNU General Public Licence version 3 (GPL Version 3),
+# copied verbatim in the file "LICENCE".
+
+"""Module for task generator"""
+
+import importlib
+
+from task.generator.base_async_task_generator import BaseAsyncTaskGenerator
+from task.generator.base_task_generator import BaseTaskGenerator
+
+class TaskGeneratorFactory:
+
+    def __init__(self):
+        pass
+
+    @staticmethod
+    def load_class(module_name: str, class_name: str) -> type:
+
+        dynamic_module = importlib.import_module(module_name)
+        dynamic_class = getattr(dynamic_module, class_name)
+
+        if not (issubclass(dynamic_class, BaseTaskGenerator) or issubclass(dynamic_class, BaseAsyncTaskGenerator)):
+            raise RuntimeError(f"Class is not a task generator: '{module_name}.{class_name}'")
+
+        return dynamic_class
+
+    @staticmethod
+    def is_async(dynamic_class: type) -> bool:
+        return issubclass(dynamic_class, BaseAsyncTaskGenerator)
+
+    @staticmethod
+    def create(dynamic_class: type, task_queue, result_queue, config_file: str):
+        return dynamic_class(task_queue, result_queue, config_file)
@@ -8,6 +8,7 @@
 # the terms of the GNU General Public Licence version 3 (GPL Version 3),
 # copied verbatim in the file "LICENCE".
 
+import asyncio
 import logging
 import os
 
@@ -16,9 +17,10 @@ from datetime import datetime
 from ClusterShell.RangeSet import RangeSet
 from lfsutils.lib import LfsUtils
 
-from comm.task_handler import TaskCommHandler
+from comm.task_async_handler import TaskAsyncCommHandler
 from prometheus.lustre_file_creation_check import LustreFileCreationCheckResult, LustreFileCreationCheckState
 from task.base_task import BaseTask
+from util.async_command import run_command
 from util.auto_remove_file import AutoRemoveFile
 from util.type_conv_with_none import conv_int
 
@@ -50,74 +52,85 @@ class LustreFileCreationCheckTask(BaseTask):
         for mdt_idx in RangeSet(mdt_index_rangeset).striter():
             self._mdt_index_list.append(int(mdt_idx))
 
+    @property
+    def affinity_key(self):
+        # Repeated checks of an OST use the same MDT directories.
+        return f"{self.lfs_target}:{self.target_base_dir}:{self.ost_idx}"
+
     def execute(self) -> None:
+        asyncio.run(self.execute_async())
+
+    async def execute_async(self) -> None:
 
         try:
 
             str_ost_idx = str(self.ost_idx)
 
-            if self._lfs_utils.is_ost_idx_active(self.lfs_target, self.ost_idx):
+            # The OST states are parsed by the lfsutils, so just this call is run in a thread.
+            if await asyncio.to_thread(self._lfs_utils.is_ost_idx_active, self.lfs_target, self.ost_idx):
 
                 logging.debug("Found active OST-IDX: %s", str_ost_idx)
 
-                comm_handler = TaskCommHandler(self.pushgateway_client_name, self.pushgateway_client_port, self.pushgateway_client_timeout)
-                comm_handler.connect()
-
-                # TODO: Could run in parallel for each MDT or be a seperate task for each MDT+OST...
-                for mdt_idx in self._mdt_index_list:
-
-                    try:
+                with TaskAsyncCommHandler(self.pushgateway_client_name,
+                                          self.pushgateway_client_port,
+                                          self.pushgateway_client_timeout) as comm_handler:
 
-                        elapsed_time = None
+                    comm_handler.connect()
 
-                        str_mdt_idx = str(mdt_idx)
+                    # The MDTs are checked concurrently by lfs subprocesses, which are killed on cancellation.
+                    check_result_list = \
+                        await asyncio.gather(*[self._check_mdt(mdt_idx) for mdt_idx in self._mdt_index_list])
 
-                        file_path = f"{self.target_base_dir}{os.path.sep}{self.target_mdt_sub_dir}{str_mdt_idx}{os.path.sep}{str_ost_idx}_file_creation_check.tmp"
+                    for check_result in check_result_list:
 
-                        with AutoRemoveFile(file_path):
+                        logging.debug("Sending check result to pushgateway: %s", check_result)
 
-                            if os.path.exists(file_path):
-                                os.remove(file_path)
+                        await comm_handler.send_string(check_result.to_string())
 
-                            start_time = datetime.now()
-                            self._lfs_utils.set_ost_file_stripe(file_path, self.ost_idx)
-                            elapsed_time = datetime.now() - start_time
+            else:
+                logging.debug("%s|%s|%s", self.lfs_target, LustreFileCreationCheckState.IGNORED, str_ost_idx)
 
-                            current_ost_idx = int(self._lfs_utils.stripe_info(file_path).index)
+        except Exception:
+            logging.exception('Caught exception during task execution')
 
-                            if self.ost_idx == current_ost_idx:
+    async def _check_mdt(self, mdt_idx: int) -> LustreFileCreationCheckResult:
 
-                                state = LustreFileCreationCheckState.OK
+        elapsed_time = None
 
-                                logging.debug("%s|%s|%s|%s|%s|%s", self.lfs_target, state, file_path, str_mdt_idx, str_ost_idx, elapsed_time)
+        str_mdt_idx = str(mdt_idx)
+        str_ost_idx = str(self.ost_idx)
 
-                                check_result = LustreFileCreationCheckResult(self.lfs_target, state, mdt_idx, self.ost_idx)
+        file_path = f"{self.target_base_dir}{os.path.sep}{self.target_mdt_sub_dir}{str_mdt_idx}{os.path.sep}{str_ost_idx}_file_creation_check.tmp"
 
-                            else:
+        try:
 
-                                state = LustreFileCreationCheckState.FAILED
+            with AutoRemoveFile(file_path):
 
-                                logging.debug("%s|%s|%s|%s|%s|%s", self.lfs_target, state, file_path, str_mdt_idx, str_ost_idx, elapsed_time)
+                if os.path.exists(file_path):
+                    os.remove(file_path)
 
-                                check_result = LustreFileCreationCheckResult(self.lfs_target, state, mdt_idx, self.ost_idx)
+                start_time = datetime.now()
+                await run_command([self._lfs_utils.lfs, 'setstripe', '-i', str_ost_idx, file_path])
+                elapsed_time = datetime.now() - start_time
 
-                    except Exception:
+                current_ost_idx = int(
+                    (await run_command([self._lfs_utils.lfs, 'getstripe', '-i', file_path])).split()[0])
 
-                        state = LustreFileCreationCheckState.ERROR
+                if self.ost_idx == current_ost_idx:
+                    state = LustreFileCreationCheckState.OK
+                else:
+                    state = LustreFileCreationCheckState.FAILED
 
-                        if file_path and str_mdt_idx:
-                            logging.debug("%s|%s|%s|%s|%s|%s", self.lfs_target, state, file_path, str_mdt_idx, str_ost_idx, elapsed_time)
+                logging.debug("%s|%s|%s|%s|%s|%s", self.lfs_target, state, file_path, str_mdt_idx, str_ost_idx, elapsed_time)
 
-                        logging.exception('Caught exception in LustreFileCreationCheckTask during inner loop')
+                return LustreFileCreationCheckResult(self.lfs_target, state, mdt_idx, self.ost_idx)
 
-                        check_result = LustreFileCreationCheckResult(self.lfs_target, state)
+        except Exception:
 
-                    logging.debug("Sending check result to pushgateway: %s", check_result)
+            state = LustreFileCreationCheckState.ERROR
 
-                    comm_handler.send_string(check_result.to_string())
+            logging.debug("%s|%s|%s|%s|%s|%s", self.lfs_target, state, file_path, str_mdt_idx, str_ost_idx, elapsed_time)
 
-            else:
-                logging.debug("%s|%s|%s", self.lfs_target, LustreFileCreationCheckState.IGNORED, str_ost_idx)
+            logging.exception('Caught exception in LustreFileCreationCheckTask during MDT check')
 
-        except Exception:
-            logging.exception('Caught exception during task execution')
+            return LustreFileCreationCheckResult(self.lfs_target, state)
@@ -8,14 +8,15 @@
 # the terms of the GNU General Public Licence version 3 (GPL Version 3),
 # copied verbatim in the file "LICENCE".
 
+import asyncio
 import datetime
 import logging
 import os
 import time
-import zmq
 
 from lfsutils.lib import LfsUtils
 
+from comm.task_async_handler import TaskAsyncCommHandler
 from task.base_task import BaseTask
 from db.ost_perf_result import OSTPerfResult
 from util.auto_remove_file import AutoRemoveFile
@@ -83,75 +84,79 @@ class LustreIOTask(BaseTask):
         else:
             self._ost_idx = None
 
+    @property
+    def affinity_key(self):
+        # Repeated probes of an OST share the probe files and stripe layouts of the target directory.
+        return f"{self.lfs_target}:{self.target_dir}:{self.ost_idx}"
+
     def execute(self):
+        asyncio.run(self.execute_async())
 
-        try:
+    async def execute_async(self):
 
-            if self.lfs_utils.is_ost_idx_active(self.lfs_target, self.ost_idx):
+        try:
 
-                str_ost_idx = str(self.ost_idx)
+            # The measurement is bound to blocking file I/O, so it is thread-backed,
+            # just sending the result to the db-proxy does not hold the thread.
+            ost_perf_result = await asyncio.to_thread(self._measure)
 
-                logging.debug("Found active OST-IDX: %s", str_ost_idx)
+            if ost_perf_result:
 
-                self._initialize_payload()
+                if logging.root.isEnabledFor(logging.DEBUG):
+                    logging.debug("ost_perf_result.to_csv_list: %s", ost_perf_result.to_csv_list())
 
-                file_path = self.target_dir + os.path.sep + str_ost_idx + "_perf_test.tmp"
+                if self.db_proxy_endpoint:
 
-                with AutoRemoveFile(file_path):
+                    with TaskAsyncCommHandler(self.db_proxy_target, int(self.db_proxy_port), 1000) as comm_handler:
 
-                    if os.path.exists(file_path):
-                        os.remove(file_path)
+                        comm_handler.connect()
 
-                    self.lfs_utils.set_ost_file_stripe(file_path, self.ost_idx)
+                        await comm_handler.send_string(ost_perf_result.to_csv_list())
 
-                    write_timestamp = datetime.datetime.fromtimestamp(time.time()).strftime('%Y-%m-%d %H:%M:%S')
-                    write_duration, write_throughput = self._write_file(file_path)
+                    logging.debug('Sent ost_perf_result to db-proxy.')
 
-                    read_timestamp = datetime.datetime.fromtimestamp(time.time()).strftime('%Y-%m-%d %H:%M:%S')
-                    read_duration, read_throughput = self._read_file(file_path)
+        except Exception:
+            logging.exception('Caught exception during task execution')
 
-                    ost_perf_result = \
-                        OSTPerfResult(read_timestamp,
-                                      write_timestamp,
-                                      str_ost_idx,
-                                      self.total_size_bytes,
-                                      read_throughput,
-                                      write_throughput,
-                                      read_duration,
-                                      write_duration)
-            else:
+    def _measure(self):
 
-                logging.debug("Found non-active OST: %s", str_ost_idx)
+        str_ost_idx = str(self.ost_idx)
 
-                timestamp = datetime.datetime.fromtimestamp(time.time()).strftime('%Y-%m-%d %H:%M:%S')
+        if self.lfs_utils.is_ost_idx_active(self.lfs_target, self.ost_idx):
 
-                ost_perf_result = \
-                    OSTPerfResult(timestamp, timestamp, str_ost_idx, self.total_size_bytes, 0, 0, 0, 0)
+            logging.debug("Found active OST-IDX: %s", str_ost_idx)
 
-            if ost_perf_result:
+            self._initialize_payload()
 
-                if logging.root.isEnabledFor(logging.DEBUG):
-                    logging.debug("ost_perf_result.to_csv_list: %s", ost_perf_result.to_csv_list())
+            file_path = self.target_dir + os.path.sep + str_ost_idx + "_perf_test.tmp"
 
-                if self.db_proxy_endpoint:
+            with AutoRemoveFile(file_path):
 
-                    timeout = 1000
+                if os.path.exists(file_path):
+                    os.remove(file_path)
 
-                    context = zmq.Context()
+                self.lfs_utils.set_ost_file_stripe(file_path, self.ost_idx)
 
-                    sock = context.socket(zmq.PUSH)
+                write_timestamp = datetime.datetime.fromtimestamp(time.time()).strftime('%Y-%m-%d %H:%M:%S')
+                write_duration, write_throughput = self._write_file(file_path)
 
-                    sock.setsockopt(zmq.LINGER, timeout)
-                    sock.SNDTIMEO = timeout
+                read_timestamp = datetime.datetime.fromtimestamp(time.time()).strftime('%Y-%m-%d %H:%M:%S')
+                read_duration, read_throughput = self._read_file(file_path)
 
-                    sock.connect(self.db_proxy_endpoint)
+                return OSTPerfResult(read_timestamp,
+                                     write_timestamp,
+                                     str_ost_idx,
+                                     self.total_size_bytes,
+                                     read_throughput,
+                                     write_throughput,
+                                     read_duration,
+                                     write_duration)
 
-                    sock.send_string(ost_perf_result.to_csv_list())
+        logging.debug("Found non-active OST: %s", str_ost_idx)
 
-                    logging.debug('Sent ost_perf_result to db-proxy.')
+        timestamp = datetime.datetime.fromtimestamp(time.time()).strftime('%Y-%m-%d %H:%M:%S')
 
-        except Exception:
-            logging.exception('Caught exception during task execution')
+        return OSTPerfResult(timestamp, timestamp, str_ost_idx, self.total_size_bytes, 0, 0, 0, 0)
 
     def _initialize_payload(self):
 
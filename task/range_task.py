@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+#
+# -*- coding: utf-8 -*-
+#
+# © Copyright 2023 GSI Helmholtzzentrum für Schwerionenforschung
+#
+# This software is distributed under
+# the terms of the GNU General Public Licence version 3 (GPL Version 3),
+# copied verbatim in the file "LICENCE".
+
+import copy
+import json
+
+from ClusterShell.RangeSet import RangeSet
+
+from msg.base_message import BaseMessage
+from msg.message_type import MessageType
+from msg.task_assign import TaskAssign
+from task.base_task import BaseTask
+from task.task_factory import TaskFactory
+
+class RangeTask(BaseTask):
+    """Task standing for a range of tasks created from a skeleton task e.g. a monitoring wave over OST indexes.
+
+    The master dispatches and tracks a range task as a single task with a single TID.
+    The controller expands it into a task per index of the RangeSet, with the index set
+    on the index argument and as TID, and reports the range task finished after all its tasks are finished.
+
+    The arguments of the skeleton task are kept as JSON list, so the range task is sent by a common TaskAssign.
+    """
+
+    def __init__(self, task_module, task_class, task_args, index_arg, index_range):
+
+        super().__init__()
+
+        self.task_module = task_module
+        self.task_class = task_class
+        self.task_args = task_args
+        self.index_arg = index_arg
+        self.index_range = index_range
+
+    @staticmethod
+    def create(skeleton: BaseTask, index_arg: str, indexes) -> 'RangeTask':
+        """Creates a range task over the indexes with the folded RangeSet as TID and the deadline and timeout of the skeleton."""
+
+        index_range = str(RangeSet.fromlist([str(index) for index in indexes]))
+
+        if not index_range:
+            raise RuntimeError('No indexes set for range task!')
+
+        range_task = RangeTask(skeleton.__class__.__module__,
+                               skeleton.__class__.__name__,
+                               json.dumps(TaskAssign.task_args(skeleton)),
+                               index_arg,
+                               index_range)
+
+        range_task.tid = index_range
+        range_task.deadline = skeleton.deadline
+        range_task.timeout = skeleton.timeout
+
+        return range_task
+
+    @property
+    def class_name(self):
+        """Name of the class of the tasks in the range, so they are limited as if dispatched one by one."""
+        return self.task_class
+
+    def execute(self):
+        raise RuntimeError('Range task must be expanded by the controller!')
+
+    def expand(self) -> list[BaseTask]:
+
+        header = \
+            MessageType.TASK_ASSIGN() + BaseMessage.field_separator \
+            + self.task_module        + BaseMessage.field_separator \
+            + self.task_class         + BaseMessage.field_separator \
+            + self.tid
+
+        body = BaseMessage.field_separator.join(json.loads(self.task_args))
+
+        skeleton = TaskFactory.create_from_message(BaseMessage(header, body))
+        skeleton.timeout = self.timeout
+
+        task_list = list[BaseTask]()
+
+        for index in RangeSet(self.index_range).striter():
+
+            task = copy.copy(skeleton)
+
+            setattr(task, self.index_arg, index)
+            task.tid = index
+
+            task_list.append(task)
+
+        return task_list
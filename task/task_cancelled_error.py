@@ -0,0 +1,20 @@
+#!/usr/bin/env python3
+#
+# -*- coding: utf-8 -*-
+#
+# © Copyright 2023 GSI Helmholtzzentrum für Schwerionenforschung
+#
+# This software is distributed under
+# the terms of the GNU General Public Licence version 3 (GPL Version 3),
+# copied verbatim in the file "LICENCE".
+
+class TaskCancelledError(BaseException):
+    """Raised in a worker executing a task that has been cancelled by the master."""
+
+    def __init__(self, tid=None):
+        """The TID is not known, if the error is raised asynchronously in the thread executing the task."""
+
+        if tid:
+            super().__init__(f"Task has been cancelled: {tid}")
+        else:
+            super().__init__('Task has been cancelled')
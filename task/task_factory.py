@@ -8,6 +8,7 @@
 # the terms of the GNU General Public Licence version 3 (GPL Version 3),
 # copied verbatim in the file "LICENCE".
 
+import functools
 import importlib
 import inspect
 
@@ -62,7 +63,16 @@ class TaskFactory:
         # For Python 3, so the values can be accessed via indexes later...
         body_items = list(xml_info.class_properties.values())
 
-        return TaskFactory._create_task(dynamic_class, body_items, len_body_items)
+        task = TaskFactory._create_task(dynamic_class, body_items, len_body_items)
+
+        # Deadline starts on creation, so tasks copied from a skeleton share the same deadline.
+        if xml_info.ttl:
+            task.set_ttl(xml_info.ttl)
+
+        if xml_info.timeout:
+            task.timeout = xml_info.timeout
+
+        return task
 
     @staticmethod
     def create_from_message(message):
@@ -72,12 +82,14 @@ class TaskFactory:
 
         header_items = message.header.split(BaseMessage.field_separator)
 
-        if len(header_items) != 4:
+        # The timeout is just appended to the header, if set.
+        if len(header_items) not in (4, 5):
             raise RuntimeError(f"Invalid message header for a task creation found: {message}")
 
         task_module = header_items[1]
         task_class = header_items[2]
         task_id = header_items[3]
+        task_timeout = header_items[4] if len(header_items) == 5 else None
 
         body_items = None
         len_body_items = 0
@@ -95,8 +107,42 @@ class TaskFactory:
         task = TaskFactory._create_task(dynamic_class, body_items, len_body_items)
         task.tid = task_id
 
+        if task_timeout:
+            task.timeout = task_timeout
+
         return task
 
+    @staticmethod
+    def header_item_count(task_module, task_class, item_count, header_item_count):
+        """Returns the number of header items of a task message with the optional timeout appended to the header.
+
+        The timeout is found by the item following the TID besides the arguments of the __init__ method,
+        since all of them are sent in the body. Without a loadable task class no timeout is taken,
+        since the task cannot be created from the message anyway.
+        """
+
+        if item_count == header_item_count:
+            return header_item_count
+
+        try:
+            init_arg_count = TaskFactory._init_arg_count(task_module, task_class)
+        except (ImportError, AttributeError, TypeError, ValueError):
+            return header_item_count
+
+        if item_count == header_item_count + init_arg_count + 1:
+            return header_item_count + 1
+
+        return header_item_count
+
+    @staticmethod
+    @functools.lru_cache(maxsize=None)
+    def _init_arg_count(task_module, task_class) -> int:
+
+        dynamic_class = getattr(importlib.import_module(task_module), task_class)
+
+        # Skip first parameter 'self' of the __init__ method.
+        return len(inspect.getfullargspec(dynamic_class.__init__).args) - 1
+
     @staticmethod
     def _create_task(dynamic_class, body_items, len_body_items):
 
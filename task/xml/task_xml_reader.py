@@ -20,12 +20,14 @@ class TaskXmlReaderError(Exception):
 
 class TaskXmlInfo:
 
-    def __init__(self, class_module, class_name, class_properties):
+    def __init__(self, class_module, class_name, class_properties, ttl=None, timeout=None):
 
         #TODO: Check required and optional!
         self.class_module = class_module
         self.class_name = class_name
         self.class_properties = class_properties
+        self.ttl = ttl
+        self.timeout = timeout
 
 class TaskXmlReader:
 
@@ -43,6 +45,8 @@ class TaskXmlReader:
             class_module = None
             class_name = None
             class_properties = OrderedDict()
+            ttl = None
+            timeout = None
 
             tree = ElementTree.parse(file_path)
             root = tree.getroot()
@@ -67,6 +71,16 @@ class TaskXmlReader:
                     else:
                         found_task = True
 
+                    ttl = child.get('ttl')
+
+                    if ttl is not None and float(ttl) <= 0:
+                        raise RuntimeError(f"Invalid ttl found for task: '{ttl}'")
+
+                    timeout = child.get('timeout')
+
+                    if timeout is not None and float(timeout) <= 0:
+                        raise RuntimeError(f"Invalid timeout found for task: '{timeout}'")
+
                     class_def = child.find('class')
 
                     if class_def is None:
@@ -99,7 +113,7 @@ class TaskXmlReader:
             if not found_task:
                 raise RuntimeError(f"No task definition found for: '{task_name}'")
 
-            return TaskXmlInfo(class_module, class_name, class_properties)
+            return TaskXmlInfo(class_module, class_name, class_properties, ttl, timeout)
 
         except Exception as err:
             raise TaskXmlReaderError(f"{err}")
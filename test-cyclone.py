@@ -8,13 +8,57 @@
 # the terms of the GNU General Public Licence version 3 (GPL Version 3),
 # copied verbatim in the file "LICENCE".
 
+import asyncio
+import os
+import subprocess
+import tempfile
+import threading
+import time
 import unittest
+import unittest.mock
 
+from ctrl.broadcast_channel import BroadcastChannel
+from ctrl.controller_group import ControllerGroup
+from ctrl.controller_group import ControllerGroupQuota
+from ctrl.controller_health import ControllerHealth
+from ctrl.controller_health import ControllerState
+from ctrl.generator_feed import GeneratorFeed
+from executor.executor_factory import ExecutorFactory
+from executor.worker_autoscaler import WorkerAutoscaler
+from executor.worker_supervisor import WorkerSupervisor
+from ctrl.local_queue import LocalQueue
+from ctrl.master_frontend import MasterFrontend
+from ctrl.notification_pipe import NotificationPipe
+from ctrl.range_task_tracker import RangeTaskTracker
+from ctrl.task_cancellation import TaskCancellation
+from ctrl.task_dispatcher import TaskDispatcher
+from ctrl.task_limiter import TaskLimiter
+from ctrl.task_source import TaskSource
+from ctrl.task_templates import TaskTemplates
+from ctrl.worker_control_block import RING_SIZE
+from ctrl.worker_control_block import TID_SIZE
+from ctrl.worker_control_block import WorkerControlBlock
 from msg.base_message import BaseMessage
+from msg.control_command import ControlCommand
+from msg.exit_command import ExitCommand
+from msg.heartbeat import Heartbeat
+from msg.message_factory import MessageFactory
+from msg.message_type import MessageType
 from msg.task_assign import TaskAssign
+from msg.task_credit import TaskCredit
+from msg.task_delta_assign import TaskDeltaAssign
+from msg.task_finished import TaskFinished
+from msg.task_finished_batch import TaskFinishedBatch
+from msg.task_request import TaskRequest
+from msg.task_return import TaskReturn
+from scheduler.consistent_hash_ring import ConsistentHashRing
+from scheduler.scheduler_factory import SchedulerFactory
+from task.cancel_task import CancelTask
 from task.empty_task import EmptyTask
+from task.range_task import RangeTask
 from task.task_factory import TaskFactory
 from task.xml.task_xml_reader import TaskXmlReader
+from worker import WorkerState
 
 class TestTaskAssign(unittest.TestCase):
 
@@ -31,6 +75,23 @@ class TestTaskAssign(unittest.TestCase):
         self.assertEqual(task_assign.body, body)
         self.assertEqual(task_assign.to_string(), header)
 
+    def test_timeout_from_str(self):
+
+        task = RangeTask('task.empty_task', 'EmptyTask', '[]', 'tid', '1-2')
+        task.tid = '0'
+
+        # The timeout is just appended to the header, if set.
+        self.assertEqual(TaskAssign(task).header, "TASK_ASS|task.range_task|RangeTask|0")
+        self.assertIsNone(MessageFactory.create(TaskAssign(task).to_string()).to_task().timeout)
+
+        task.timeout = 30
+
+        task_assign = MessageFactory.create(TaskAssign(task).to_string())
+
+        self.assertEqual(task_assign.header, "TASK_ASS|task.range_task|RangeTask|0|30.0")
+        self.assertEqual(task_assign.to_task().timeout, 30)
+        self.assertEqual(task_assign.to_task().index_range, '1-2')
+
     def test_lustre_io_task_from_str(self):
 
         header_task_type   = "TASK_ASS"
@@ -100,5 +161,1448 @@ class TestTaskXmlReader(unittest.TestCase):
 
         self.assertEqual(task.pushgateway_client_timeout, 10000)
 
+    def test_empty_task_with_ttl(self):
+
+        task_fd, task_file = tempfile.mkstemp(suffix='.xml')
+
+        with os.fdopen(task_fd, 'w') as xml_file:
+            xml_file.write('<tasks><task name="EmptyTask" ttl="60"><class module="task.empty_task" name="EmptyTask"/></task></tasks>')
+
+        try:
+            task = TaskFactory().create_from_xml_info(TaskXmlReader.read_task_definition(task_file, 'EmptyTask'))
+        finally:
+            os.remove(task_file)
+
+        self.assertIsNotNone(task.deadline)
+        self.assertFalse(task.is_expired(time.time()))
+        self.assertTrue(task.is_expired(task.deadline))
+
+    def test_empty_task_with_timeout(self):
+
+        task_fd, task_file = tempfile.mkstemp(suffix='.xml')
+
+        with os.fdopen(task_fd, 'w') as xml_file:
+            xml_file.write('<tasks><task name="EmptyTask" timeout="30"><class module="task.empty_task" name="EmptyTask"/></task></tasks>')
+
+        try:
+            task = TaskFactory().create_from_xml_info(TaskXmlReader.read_task_definition(task_file, 'EmptyTask'))
+        finally:
+            os.remove(task_file)
+
+        self.assertEqual(task.timeout, 30)
+
+        with self.assertRaises(ValueError):
+            task.timeout = 0
+
+class TestLocalQueue(unittest.TestCase):
+
+    def test_fill_and_pop(self):
+
+        with LocalQueue() as local_queue:
+
+            local_queue.fill(['0', '1'])
+            local_queue.push('2')
+
+            self.assertEqual(local_queue.pop_nowait(), '0')
+            self.assertEqual(local_queue.pop(), '1')
+            self.assertEqual(local_queue.pop_nowait(), '2')
+            self.assertEqual(local_queue.pop_nowait(), None)
+            self.assertTrue(local_queue.is_empty())
+
+class TestTaskCredit(unittest.TestCase):
+
+    def test_task_credit_from_str(self):
+
+        task_credit = MessageFactory.create(TaskCredit(8).to_string())
+
+        self.assertEqual(task_credit.type(), MessageType.TASK_CREDIT())
+        self.assertEqual(task_credit.count, 8)
+
+    def test_invalid_task_credit(self):
+
+        with self.assertRaises(RuntimeError):
+            TaskCredit(0)
+
+class TestHeartbeat(unittest.TestCase):
+
+    def test_heartbeat_from_str(self):
+
+        heartbeat = MessageFactory.create(Heartbeat('host').to_string())
+
+        self.assertEqual(heartbeat.sender, 'host')
+        self.assertEqual(heartbeat.sent_count, None)
+
+        heartbeat = MessageFactory.create(Heartbeat('host', 0).to_string())
+
+        self.assertEqual(heartbeat.sender, 'host')
+        self.assertEqual(heartbeat.sent_count, 0)
+
+class _GeneratorFeedCommHandler:
+
+    def __init__(self, target, port, timeout):
+
+        self.fqdn = 'master'
+        self.recv_list = []
+        self.sent_list = []
+
+    def recv_message(self):
+
+        if self.recv_list:
+            return self.recv_list.pop(0)
+
+        return None, None
+
+    def send_message(self, identity, message):
+        self.sent_list.append((identity, MessageFactory.create(message)))
+
+class TestGeneratorFeed(unittest.TestCase):
+
+    @staticmethod
+    def _create_task(tid):
+
+        task = EmptyTask()
+        task.tid = tid
+
+        return task
+
+    def _create_feed(self, timeout=60):
+
+        with unittest.mock.patch('ctrl.generator_feed.GeneratorFeedCommHandler', _GeneratorFeedCommHandler):
+            generator_feed = GeneratorFeed('localhost', 5555, 4, timeout)
+
+        return generator_feed, generator_feed._comm_handler
+
+    def test_credit_in_transit(self):
+
+        generator_feed, comm_handler = self._create_feed()
+
+        comm_handler.recv_list.append(('gen', Heartbeat('gen', 0).to_string()))
+        generator_feed.process_events()
+
+        self.assertEqual(comm_handler.sent_list.pop()[1].count, 4)
+
+        # Tasks still in transit are accounted on further heartbeats, so no credit is granted beyond the window.
+        comm_handler.recv_list.append(('gen', TaskAssign(self._create_task('0')).to_string()))
+        comm_handler.recv_list.append(('gen', Heartbeat('gen', 1).to_string()))
+        comm_handler.recv_list.append(('gen', TaskAssign(self._create_task('1')).to_string()))
+        comm_handler.recv_list.append(('gen', Heartbeat('gen', 2).to_string()))
+        generator_feed.process_events()
+
+        self.assertEqual([message.count for _, message in comm_handler.sent_list], [4, 4])
+        comm_handler.sent_list.clear()
+
+        task_source = generator_feed.task_sources[0]
+        task_source.task_queue.pop_nowait()
+        task_source.task_queue.pop_nowait()
+
+        generator_feed.process_events()
+
+        self.assertEqual(comm_handler.sent_list.pop()[1].count, 6)
+
+    def test_resync_credit(self):
+
+        generator_feed, comm_handler = self._create_feed()
+
+        comm_handler.recv_list.append(('gen', Heartbeat('gen', 0).to_string()))
+        comm_handler.recv_list.append(('gen', TaskAssign(self._create_task('0')).to_string()))
+        comm_handler.recv_list.append(('gen', TaskAssign(self._create_task('1')).to_string()))
+        generator_feed.process_events()
+        comm_handler.sent_list.clear()
+
+        # Restart of the remote task generator, the tasks buffered are still accounted.
+        comm_handler.recv_list.append(('gen', Heartbeat('gen', 0).to_string()))
+        generator_feed.process_events()
+
+        self.assertEqual(comm_handler.sent_list.pop()[1].count, 2)
+
+    def test_drop_invalid_message(self):
+
+        generator_feed, comm_handler = self._create_feed()
+
+        comm_handler.recv_list.append(('bad', 'INVALID|FRAME'))
+        comm_handler.recv_list.append(('gen', ExitCommand().to_string()))
+        comm_handler.recv_list.append(('gen', Heartbeat('gen', 0).to_string()))
+        comm_handler.recv_list.append(('gen', TaskAssign(self._create_task('0')).to_string()))
+
+        with self.assertLogs(level='ERROR') as captured:
+            generator_feed.process_events()
+
+        self.assertEqual(len(captured.records), 2)
+        self.assertEqual(len(generator_feed.task_sources), 1)
+        self.assertEqual(generator_feed.task_sources[0].task_queue.pop_nowait().tid, '0')
+
+    def test_timeout_in_flight(self):
+
+        generator_feed, comm_handler = self._create_feed(timeout=0)
+
+        comm_handler.recv_list.append(('gen', Heartbeat('gen', 0).to_string()))
+        comm_handler.recv_list.append(('gen', TaskAssign(self._create_task('0')).to_string()))
+        comm_handler.recv_list.append(('gen', TaskAssign(self._create_task('1')).to_string()))
+        generator_feed.process_events()
+        comm_handler.sent_list.clear()
+
+        # The task source of the timed out remote task generator is kept until its tasks are finished.
+        task_source = generator_feed.task_sources[0]
+
+        self.assertEqual(task_source.task_queue.pop_nowait().tid, '0')
+
+        task_source.result_queue.push('0')
+        generator_feed.process_events()
+
+        self.assertEqual(len(generator_feed.task_sources), 1)
+        self.assertEqual(comm_handler.sent_list.pop()[1].tid, '0')
+
+        self.assertEqual(task_source.task_queue.pop_nowait().tid, '1')
+
+        task_source.result_queue.push('1')
+        generator_feed.process_events()
+
+        self.assertEqual(generator_feed.task_sources, [])
+        self.assertEqual(comm_handler.sent_list.pop()[1].tid, '1')
+
+class TestControlCommand(unittest.TestCase):
+
+    def test_control_command_from_str(self):
+
+        control_command = MessageFactory.create(ControlCommand(ControlCommand.EPOCH, 7).to_string())
+
+        self.assertEqual(control_command.type(), MessageType.CONTROL_COMMAND())
+        self.assertEqual(control_command.command, ControlCommand.EPOCH)
+        self.assertEqual(control_command.value, '7')
+
+        control_command = MessageFactory.create(ControlCommand(ControlCommand.DRAIN).to_string())
+
+        self.assertEqual(control_command.command, ControlCommand.DRAIN)
+        self.assertEqual(control_command.value, '')
+
+class _BroadcastCommHandler:
+
+    TOPIC_ALL = 'ALL'
+
+    def __init__(self, target, port, timeout):
+        self.sent_list = []
+
+    def send_message(self, topic, message):
+        self.sent_list.append((topic, MessageFactory.create(message).command))
+
+@unittest.mock.patch('ctrl.broadcast_channel.BroadcastCommHandler', _BroadcastCommHandler)
+@unittest.mock.patch.object(BroadcastChannel, 'COMMAND_FILE_CHECK_INTERVAL', 0)
+class TestBroadcastChannel(unittest.TestCase):
+
+    def setUp(self):
+
+        command_fd, self.command_file = tempfile.mkstemp(suffix='.cmd')
+        os.close(command_fd)
+
+    def tearDown(self):
+
+        if os.path.isfile(self.command_file):
+            os.remove(self.command_file)
+
+    def _check(self, broadcast_channel, commands=None):
+
+        if commands is not None:
+            with open(self.command_file, 'w', encoding='UTF-8') as command_file:
+                command_file.write(commands)
+
+        broadcast_channel._comm_handler.sent_list.clear()
+        broadcast_channel.check(True)
+
+        # Just the control commands without the configuration epoch repeated.
+        return [item for item in broadcast_channel._comm_handler.sent_list if item[1] != ControlCommand.EPOCH]
+
+    def test_repeat_targeted_command(self):
+
+        broadcast_channel = BroadcastChannel('*', 5555, 0.01, self.command_file)
+
+        self.assertEqual(self._check(broadcast_channel, "pause node1.example.org\n"),
+                         [('node1.example.org', ControlCommand.PAUSE)])
+
+        # A controller connected later gets the command repeated on the next interval.
+        time.sleep(0.02)
+        self.assertEqual(self._check(broadcast_channel), [('node1.example.org', ControlCommand.PAUSE)])
+
+        self._check(broadcast_channel, "resume node1.example.org\n")
+
+        time.sleep(0.02)
+        self.assertEqual(self._check(broadcast_channel), [])
+
+    def test_malformed_command_file(self):
+
+        broadcast_channel = BroadcastChannel('*', 5555, 0.01, self.command_file)
+
+        with self.assertLogs(level='ERROR') as captured:
+            sent_list = self._check(broadcast_channel, "\n# comment\nunknown node1.example.org\ncancel\ndrain node2.example.org\n")
+
+        self.assertEqual(len(captured.records), 2)
+        self.assertEqual(sent_list, [('node2.example.org', ControlCommand.DRAIN)])
+        self.assertFalse(os.path.isfile(self.command_file))
+
+        # A drain is kept on resuming all controllers.
+        self._check(broadcast_channel, "resume\n")
+
+        time.sleep(0.02)
+        self.assertEqual(self._check(broadcast_channel), [('node2.example.org', ControlCommand.DRAIN)])
+
+class TestTaskLimiter(unittest.TestCase):
+
+    def setUp(self):
+
+        limits_fd, self.limits_file = tempfile.mkstemp(suffix='.conf')
+
+        with os.fdopen(limits_fd, 'w') as limits_file:
+            limits_file.write("[EmptyTask]\nmax_in_flight = 2\n")
+
+    def tearDown(self):
+        os.remove(self.limits_file)
+
+    @staticmethod
+    def _create_task(tid):
+
+        task = EmptyTask()
+        task.tid = tid
+
+        return task
+
+    def test_max_in_flight(self):
+
+        task_limiter = TaskLimiter(self.limits_file)
+
+        self.assertTrue(task_limiter.acquire(self._create_task('0')))
+        self.assertTrue(task_limiter.acquire(self._create_task('1')))
+        self.assertFalse(task_limiter.acquire(self._create_task('2')))
+        self.assertEqual(task_limiter.limited_key(self._create_task('2')), 'EmptyTask')
+
+        # Resending a task in flight is not limited.
+        self.assertTrue(task_limiter.acquire(self._create_task('1')))
+        self.assertEqual(task_limiter.in_flight('EmptyTask'), 2)
+
+        task_limiter.release('0')
+
+        self.assertTrue(task_limiter.acquire(self._create_task('2')))
+
+    def test_deferred_per_request(self):
+
+        task_queue = LocalQueue()
+
+        for i in range(100):
+            task_queue.push(self._create_task(str(i)))
+
+        dispatcher = TaskDispatcher([TaskSource('a', task_queue, LocalQueue())], None, 10, 1, 3600,
+                                    task_limiter=TaskLimiter(self.limits_file))
+
+        self.assertEqual(dispatcher.dispatch(TaskRequest('node1')).tid, '0')
+        self.assertEqual(dispatcher.dispatch(TaskRequest('node1')).tid, '1')
+
+        # A request defers just a few tasks, while the limit is saturated.
+        self.assertEqual(dispatcher.dispatch(TaskRequest('node1')).type(), MessageType.WAIT_COMMAND())
+        self.assertEqual(len(task_queue), 98 - TaskDispatcher.MAX_REQUEST_DEFERRED_TASK_COUNT)
+
+    def test_acquire_on_assign(self):
+
+        task_queue = LocalQueue()
+
+        task_queue.push(self._create_task('0'))
+        task_queue.push(self._create_task('0'))
+
+        range_task = RangeTask('task.empty_task', 'EmptyTask', '[]', 'tid', '1-2')
+        range_task.tid = '1-2'
+        task_queue.push(range_task)
+
+        task_queue.push(self._create_task('3'))
+
+        task_limiter = TaskLimiter(self.limits_file)
+
+        dispatcher = TaskDispatcher([TaskSource('a', task_queue, LocalQueue())], None, 10, 1, 3600,
+                                    task_limiter=task_limiter)
+
+        self.assertEqual(dispatcher.dispatch(TaskRequest('node1')).tid, '0')
+
+        # A task resent while in flight is not assigned, so it does not count again.
+        self.assertEqual(dispatcher.dispatch(TaskRequest('node2')).type(), MessageType.WAIT_COMMAND())
+        self.assertEqual(task_limiter.in_flight('EmptyTask'), 1)
+
+        # A range task counts by the class of its tasks.
+        self.assertEqual(dispatcher.dispatch(TaskRequest('node2')).tid, '1-2')
+        self.assertEqual(task_limiter.in_flight('EmptyTask'), 2)
+        self.assertEqual(dispatcher.dispatch(TaskRequest('node2')).type(), MessageType.WAIT_COMMAND())
+
+class TestControllerGroupQuota(unittest.TestCase):
+
+    def test_class_max_in_flight(self):
+
+        controller_group_quota = \
+            ControllerGroupQuota([ControllerGroup('login', ['login*.example.org'], 0, {'emptytask': 1})])
+
+        first_task = TestTaskLimiter._create_task('0')
+        second_task = TestTaskLimiter._create_task('1')
+
+        controller_group_quota.acquire('login1.example.org', first_task)
+
+        self.assertEqual(controller_group_quota.in_flight('login', 'EmptyTask'), 1)
+        self.assertEqual(controller_group_quota.limited_key('login2.example.org', second_task), 'login:EmptyTask')
+        self.assertIsNone(controller_group_quota.limited_key('dm1.example.org', second_task))
+
+        controller_group_quota.release('0')
+
+        self.assertIsNone(controller_group_quota.limited_key('login2.example.org', second_task))
+
+    def test_group_capped(self):
+
+        task_queue = LocalQueue()
+
+        for i in range(3):
+            task_queue.push(TestTaskLimiter._create_task(str(i)))
+
+        controller_group_quota = ControllerGroupQuota([ControllerGroup('login', ['login*.example.org'], 1, {})])
+
+        dispatcher = TaskDispatcher([TaskSource('a', task_queue, LocalQueue())], None, 10, 1, 3600,
+                                    controller_group_quota=controller_group_quota)
+
+        self.assertEqual(dispatcher.dispatch(TaskRequest('login1.example.org')).tid, '0')
+        self.assertTrue(controller_group_quota.is_capped('login2.example.org'))
+
+        # No task is deferred for a capped group, so the tasks keep their order for other controllers.
+        self.assertEqual(dispatcher.dispatch(TaskRequest('login2.example.org')).type(), MessageType.WAIT_COMMAND())
+        self.assertEqual(len(task_queue), 2)
+        self.assertEqual(dispatcher.dispatch(TaskRequest('dm1.example.org')).tid, '1')
+
+class TestMasterFrontend(unittest.TestCase):
+
+    def test_encode_decision(self):
+
+        task = EmptyTask()
+        task.tid = "0"
+
+        self.assertEqual(MasterFrontend.encode(task), TaskAssign(task).to_string())
+        self.assertEqual(MasterFrontend.encode(ExitCommand()), ExitCommand().to_string())
+
+        with self.assertRaises(RuntimeError):
+            MasterFrontend.encode(None)
+
+    def test_decode_forwarded(self):
+
+        exit_command = MasterFrontend.decode_forwarded(ExitCommand().to_string())
+
+        self.assertEqual(exit_command.type(), MessageType.EXIT_COMMAND())
+
+class TestTaskTemplates(unittest.TestCase):
+
+    def test_template_per_session(self):
+
+        task_templates = TaskTemplates()
+
+        first_task = TestTaskLimiter._create_task('0')
+        second_task = TestTaskLimiter._create_task('1')
+
+        template_msg = MessageFactory.create(task_templates.encode('node1', 'a', first_task).to_string())
+        delta_msg = MessageFactory.create(task_templates.encode('node1', 'a', second_task).to_string())
+
+        self.assertEqual(template_msg.type(), MessageType.TASK_TEMPLATE_ASSIGN())
+        self.assertEqual(template_msg.to_task().tid, '0')
+        self.assertEqual(delta_msg.type(), MessageType.TASK_DELTA_ASSIGN())
+        self.assertEqual(delta_msg.to_task(template_msg).tid, '1')
+
+        # A new session of the controller gets the template again.
+        self.assertEqual(task_templates.encode('node1', 'b', second_task).type(), MessageType.TASK_TEMPLATE_ASSIGN())
+
+        # Controllers without session get the complete task.
+        self.assertEqual(task_templates.encode('node2', None, second_task).type(), MessageType.TASK_ASSIGN())
+
+    def test_timeout(self):
+
+        task_templates = TaskTemplates()
+
+        first_task = TestTaskLimiter._create_task('0')
+        second_task = TestTaskLimiter._create_task('1')
+        second_task.timeout = 30
+
+        third_task = TestTaskLimiter._create_task('2')
+        third_task.timeout = 30
+
+        task_templates.encode('node1', 'a', first_task)
+
+        # The template is sent again for another timeout, following tasks get the timeout of the template.
+        template_msg = MessageFactory.create(task_templates.encode('node1', 'a', second_task).to_string())
+        delta_msg = MessageFactory.create(task_templates.encode('node1', 'a', third_task).to_string())
+
+        self.assertEqual(template_msg.type(), MessageType.TASK_TEMPLATE_ASSIGN())
+        self.assertEqual(template_msg.to_task().timeout, 30)
+        self.assertEqual(delta_msg.type(), MessageType.TASK_DELTA_ASSIGN())
+        self.assertEqual(delta_msg.to_task(template_msg).timeout, 30)
+
+        self.assertEqual(MessageFactory.create(TaskAssign(second_task).to_string()).to_task().timeout, 30)
+        self.assertIsNone(MessageFactory.create(TaskAssign(first_task).to_string()).to_task().timeout)
+
+    def test_delta_from_str(self):
+
+        delta_msg = MessageFactory.create(TaskDeltaAssign('1', '7', {0: '12', 3: '/lustre/ost'}).to_string())
+
+        self.assertEqual(delta_msg.to_string(), 'TASK_DLT|1|7|0|12|3|/lustre/ost')
+        self.assertEqual(delta_msg.template_id, '1')
+        self.assertEqual(delta_msg.tid, '7')
+        self.assertEqual(delta_msg.delta, {0: '12', 3: '/lustre/ost'})
+
+class TestRangeTaskTracker(unittest.TestCase):
+
+    def test_finish_range(self):
+
+        range_task_tracker = RangeTaskTracker()
+
+        range_task_tracker.add('0-1', [TestTaskLimiter._create_task('0'), TestTaskLimiter._create_task('1')])
+        range_task_tracker.add('1-2', [TestTaskLimiter._create_task('1'), TestTaskLimiter._create_task('2')])
+
+        self.assertIsNone(range_task_tracker.finish('1'))
+        self.assertEqual(range_task_tracker.finish('0'), '0-1')
+        self.assertIsNone(range_task_tracker.finish('2'))
+        self.assertEqual(range_task_tracker.finish('1'), '1-2')
+
+        # Tasks not expanded from a range task are reported as before.
+        self.assertEqual(range_task_tracker.finish('1'), '1')
+
+class TestControllerHealth(unittest.TestCase):
+
+    def test_quarantine(self):
+
+        controller_health = ControllerHealth(window=10, min_samples=5, quarantine=60, probation=120)
+
+        for i in range(5):
+
+            for controller in ('node1', 'node2', 'node3', 'node4'):
+
+                tid = f"{controller}:{i}"
+
+                controller_health.on_dispatch(controller, TestTaskLimiter._create_task(tid))
+                controller_health.on_finish(controller, tid, controller == 'node4')
+
+        timestamp = time.time()
+
+        controller_health.check(timestamp)
+
+        self.assertTrue(controller_health.is_quarantined('node4'))
+        self.assertFalse(controller_health.is_quarantined('node1'))
+
+        controller_health.check(timestamp + 60)
+        self.assertEqual(controller_health.state('node4'), ControllerState.PROBATION)
+
+        controller_health.check(timestamp + 180)
+        self.assertEqual(controller_health.state('node4'), ControllerState.HEALTHY)
+
+    def test_task_finished_status(self):
+
+        task_finished = MessageFactory.create(TaskFinished('node1', '1', TaskFinished.STATUS_FAILED).to_string())
+
+        self.assertTrue(task_finished.failed)
+        self.assertTrue(MessageFactory.create(TaskFinished('node1', '1', TaskFinished.STATUS_TIMEOUT).to_string()).timed_out)
+
+        # Controllers not sending a status are taken as ok.
+        self.assertFalse(MessageFactory.create(TaskFinished('node1', '1').to_string()).failed)
+
+class TestTaskCancellation(unittest.TestCase):
+
+    def test_drop_not_dispatched(self):
+
+        task_queue, result_queue = LocalQueue(), LocalQueue()
+
+        task_queue.push(TestTaskLimiter._create_task('1'))
+        task_queue.push(CancelTask('1'))
+        task_queue.push(TestTaskLimiter._create_task('2'))
+
+        dispatcher = TaskDispatcher([TaskSource('a', task_queue, result_queue)], None, 10, 1, 3600)
+
+        self.assertEqual(dispatcher.dispatch(TaskRequest('node1')).tid, '1')
+
+        # Cancelling the dispatched task requires the broadcast channel, while the next task is dispatched.
+        self.assertEqual(dispatcher.dispatch(TaskRequest('node1')).tid, '2')
+
+        dispatcher.cancel('3')
+        task_queue.push(TestTaskLimiter._create_task('3'))
+
+        self.assertEqual(dispatcher.dispatch(TaskRequest('node1')).type(), MessageType.WAIT_COMMAND())
+        self.assertEqual(dispatcher.cancelled_task_count, 1)
+        self.assertEqual(result_queue.pop_nowait(), '3')
+
+    def test_request_in_progress(self):
+
+        task_cancellation = TaskCancellation()
+        task_cancellation.add('1')
+
+        self.assertFalse(task_cancellation.request('2'))
+        self.assertTrue(task_cancellation.request('1'))
+        self.assertTrue(task_cancellation.pending)
+
+        # A finished task is not cancelled anymore.
+        task_cancellation.finish('1')
+
+        self.assertFalse(task_cancellation.pending)
+        self.assertFalse(task_cancellation.pop_request('1'))
+
+    def test_range_status(self):
+
+        range_task_tracker = RangeTaskTracker()
+        range_task_tracker.add('0-1', [TestTaskLimiter._create_task('0'), TestTaskLimiter._create_task('1')])
+
+        self.assertEqual(sorted(range_task_tracker.task_tids('0-1')), ['0', '1'])
+
+        range_task_tracker.finish('0', TaskFinished.STATUS_CANCELLED)
+        range_task_tracker.finish('1', TaskFinished.STATUS_FAILED)
+
+        self.assertEqual(range_task_tracker.pop_status('0-1'), TaskFinished.STATUS_CANCELLED)
+        self.assertEqual(range_task_tracker.pop_status('0-1'), TaskFinished.STATUS_OK)
+
+class TestNotificationPipe(unittest.TestCase):
+
+    def test_clear(self):
+
+        with NotificationPipe() as notification_pipe:
+
+            notification_pipe.notify()
+            notification_pipe.notify()
+
+            self.assertEqual(notification_pipe.clear(), 2)
+            self.assertEqual(notification_pipe.clear(), 0)
+
+class TestWorkerControlBlock(unittest.TestCase):
+
+    def test_state(self):
+
+        control_block = WorkerControlBlock(3)
+
+        control_block.set_state(0, WorkerState.READY)
+        control_block.set_state(1, WorkerState.EXECUTING, '42')
+        control_block.set_state(2, WorkerState.READY)
+
+        self.assertEqual(control_block.count(WorkerState.READY), 2)
+        self.assertEqual(control_block.count(WorkerState.EXECUTING), 1)
+        self.assertEqual(control_block.state(1)[:2], (WorkerState.EXECUTING, '42'))
+        self.assertEqual(control_block.state(0)[:2], (WorkerState.READY, ''))
+
+    def test_completion_ring(self):
+
+        control_block = WorkerControlBlock(2)
+
+        self.assertIsNone(control_block.pop_result())
+
+        # The ring counters wrap around after several rounds.
+        for i in range(3 * RING_SIZE):
+
+            control_block.push_result(i % 2, str(i), TaskFinished.STATUS_OK)
+
+            self.assertEqual(control_block.pop_result(), (str(i), TaskFinished.STATUS_OK))
+
+        for i in range(RING_SIZE):
+            control_block.push_result(1, str(i), TaskFinished.STATUS_FAILED)
+
+        self.assertEqual([control_block.pop_result() for _ in range(RING_SIZE)],
+                         [(str(i), TaskFinished.STATUS_FAILED) for i in range(RING_SIZE)])
+        self.assertIsNone(control_block.pop_result())
+
+    def test_has_result(self):
+
+        control_block = WorkerControlBlock(2)
+
+        control_block.push_result(1, '42', TaskFinished.STATUS_OK)
+
+        self.assertTrue(control_block.has_result(1, '42'))
+        self.assertFalse(control_block.has_result(0, '42'))
+
+        control_block.pop_result()
+
+        self.assertFalse(control_block.has_result(1, '42'))
+
+    def test_tid_exceeds_slot(self):
+
+        control_block = WorkerControlBlock(1)
+
+        control_block.set_state(0, WorkerState.EXECUTING, '42')
+
+        with self.assertRaises(RuntimeError):
+            control_block.set_state(0, WorkerState.EXECUTING, 'x' * (TID_SIZE + 1))
+
+        with self.assertRaises(RuntimeError):
+            control_block.push_result(0, 'x' * (TID_SIZE + 1), TaskFinished.STATUS_OK)
+
+        # The slot is still readable and unchanged.
+        self.assertEqual(control_block.state(0)[:2], (WorkerState.EXECUTING, '42'))
+        self.assertIsNone(control_block.pop_result())
+
+class TestTaskFinishedBatch(unittest.TestCase):
+
+    def test_message(self):
+
+        items = [('1', TaskFinished.STATUS_OK), ('2', TaskFinished.STATUS_FAILED)]
+
+        task_finished_batch = MessageFactory.create(TaskFinishedBatch('node1', items).to_string())
+
+        self.assertEqual(task_finished_batch.type(), MessageType.TASK_FINISHED_BATCH())
+        self.assertEqual(task_finished_batch.sender, 'node1')
+        self.assertEqual(task_finished_batch.items, items)
+
+    def test_dispatch(self):
+
+        task_queue, result_queue = LocalQueue(), LocalQueue()
+
+        for i in range(3):
+            task_queue.push(TestTaskLimiter._create_task(str(i)))
+
+        dispatcher = TaskDispatcher([TaskSource('a', task_queue, result_queue)], None, 10, 1, 3600)
+
+        for _ in range(3):
+            dispatcher.dispatch(TaskRequest('node1'))
+
+        items = [('0', TaskFinished.STATUS_OK), ('1', TaskFinished.STATUS_FAILED), ('2', TaskFinished.STATUS_CANCELLED)]
+
+        self.assertEqual(dispatcher.dispatch(TaskFinishedBatch('node1', items)).type(), MessageType.ACKNOWLEDGE())
+
+        self.assertEqual(dispatcher.finished_task_count, 2)
+        self.assertEqual(dispatcher.failed_task_count, 1)
+        self.assertEqual(dispatcher.cancelled_task_count, 1)
+        self.assertEqual([result_queue.pop_nowait() for _ in range(3)], ['0', '1', '2'])
+
+    def test_dispatch_again(self):
+
+        task_queue, result_queue = LocalQueue(), LocalQueue()
+
+        for i in range(2):
+            task_queue.push(TestTaskLimiter._create_task(str(i)))
+
+        dispatcher = TaskDispatcher([TaskSource('a', task_queue, result_queue)], None, 10, 1, 3600)
+
+        for _ in range(2):
+            dispatcher.dispatch(TaskRequest('node1'))
+
+        items = [('0', TaskFinished.STATUS_OK), ('1', TaskFinished.STATUS_OK)]
+
+        # Reported again by the controller after a lost response.
+        dispatcher.dispatch(TaskFinishedBatch('node1', items))
+        dispatcher.dispatch(TaskFinishedBatch('node1', items))
+
+        self.assertEqual(dispatcher.finished_task_count, 2)
+        self.assertEqual(len(result_queue), 2)
+
+class TestTaskReturn(unittest.TestCase):
+
+    def test_message(self):
+
+        task_return = MessageFactory.create(TaskReturn('node1', ['1', '2']).to_string())
+
+        self.assertEqual(task_return.type(), MessageType.TASK_RETURN())
+        self.assertEqual(task_return.sender, 'node1')
+        self.assertEqual(task_return.tids, ['1', '2'])
+
+    def test_dispatch_again(self):
+
+        task_queue, result_queue = LocalQueue(), LocalQueue()
+
+        task_queue.push(TestTaskLimiter._create_task('1'))
+        task_queue.push(TestTaskLimiter._create_task('2'))
+
+        dispatcher = TaskDispatcher([TaskSource('a', task_queue, result_queue)], None, 10, 1, 3600)
+
+        self.assertEqual(dispatcher.dispatch(TaskRequest('node1')).tid, '1')
+
+        # Just the controller the task is assigned to can return it.
+        dispatcher.dispatch(TaskReturn('node2', ['1']))
+        self.assertEqual(dispatcher.returned_task_count, 0)
+
+        dispatcher.dispatch(TaskReturn('node1', ['1']))
+        self.assertEqual(dispatcher.returned_task_count, 1)
+
+        # Returned tasks are dispatched again before other tasks.
+        self.assertEqual(dispatcher.dispatch(TaskRequest('node2')).tid, '1')
+        self.assertEqual(dispatcher.dispatch(TaskRequest('node2')).tid, '2')
+
+        dispatcher.dispatch(TaskFinished('node2', '1'))
+        self.assertEqual(result_queue.pop_nowait(), '1')
+
+    def test_range_return(self):
+
+        range_task_tracker = RangeTaskTracker()
+        range_task_tracker.add('0-2', [TestTaskLimiter._create_task(str(i)) for i in range(3)])
+
+        self.assertEqual(range_task_tracker.return_task('5'), '5')
+        self.assertEqual(range_task_tracker.return_task('1'), '0-2')
+        self.assertIsNone(range_task_tracker.return_task('2'))
+
+        # Tasks of the returned range task still executing are not reported finished.
+        self.assertIsNone(range_task_tracker.finish('0'))
+        self.assertEqual(range_task_tracker.task_tids('0-2'), ['0-2'])
+
+    def test_partial_range_return(self):
+
+        range_task_tracker = RangeTaskTracker()
+        range_task_tracker.add('0-3', [TestTaskLimiter._create_task(str(i)) for i in range(4)])
+
+        self.assertIsNone(range_task_tracker.finish('0'))
+
+        # Just the tasks not finished are returned including the ones still executing.
+        self.assertEqual(range_task_tracker.return_task('2'), TaskReturn.range_item('0-3', '1-3'))
+        self.assertIsNone(range_task_tracker.return_task('3'))
+        self.assertIsNone(range_task_tracker.finish('1'))
+
+    def test_dispatch_partial_range(self):
+
+        task_queue = LocalQueue()
+
+        range_task = RangeTask('task.empty_task', 'EmptyTask', '[]', 'tid', '0-3')
+        range_task.tid = '0-3'
+        task_queue.push(range_task)
+
+        dispatcher = TaskDispatcher([TaskSource('a', task_queue, LocalQueue())], None, 10, 1, 3600)
+
+        self.assertEqual(dispatcher.dispatch(TaskRequest('node1')).tid, '0-3')
+
+        dispatcher.dispatch(TaskReturn('node1', [TaskReturn.range_item('0-3', '1-3')]))
+        self.assertEqual(dispatcher.returned_task_count, 1)
+
+        # The range task keeps its TID, so the task generator is notified on the whole range finished.
+        task = dispatcher.dispatch(TaskRequest('node2'))
+
+        self.assertEqual(task.tid, '0-3')
+        self.assertEqual([expanded_task.tid for expanded_task in task.expand()], ['1', '2', '3'])
+
+class TestExecutor(unittest.TestCase):
+
+    class _LoopTask(EmptyTask):
+
+        def execute(self):
+
+            timeout = time.time() + 5
+
+            while time.time() < timeout:
+                time.sleep(0.01)
+
+    class _SleepTask(EmptyTask):
+
+        def __init__(self, duration):
+
+            super().__init__()
+
+            self.duration = duration
+
+        def execute(self):
+            asyncio.run(self.execute_async())
+
+        async def execute_async(self):
+            await asyncio.sleep(self.duration)
+
+    class _AffinityTask(EmptyTask):
+
+        worker_thread_list = []
+
+        @property
+        def affinity_key(self):
+            return 'OST0001'
+
+        def execute(self):
+            TestExecutor._AffinityTask.worker_thread_list.append(threading.current_thread())
+
+    class _SubprocessTask(EmptyTask):
+
+        def __init__(self, pid_file):
+
+            super().__init__()
+
+            self.pid_file = pid_file
+
+        def execute(self):
+
+            with subprocess.Popen(['sleep', '30']) as process:
+
+                with open(self.pid_file, 'w', encoding='UTF-8') as pid_file:
+                    pid_file.write(str(process.pid))
+
+                process.wait()
+
+    class _ExitAfterResultTask(EmptyTask):
+        """Dies after pushing its result, before the worker sets itself ready and notifies it."""
+
+        # Inherited by the forked worker processes.
+        control_block = None
+
+        def execute(self):
+
+            TestExecutor._ExitAfterResultTask.control_block.push_result(0, self.tid, TaskFinished.STATUS_OK)
+
+            time.sleep(2)
+            os._exit(1)
+
+    class _ExitTask(EmptyTask):
+
+        def execute(self):
+            os._exit(1)
+
+    @staticmethod
+    def _process_results(executor, notification_pipe, count):
+        """Pops the results while processing the executor, e.g. for its supervision."""
+
+        result_list = []
+        timeout = time.time() + 10
+
+        while len(result_list) < count and time.time() < timeout:
+
+            executor.process(TaskCancellation())
+
+            for _ in range(notification_pipe.clear()):
+                result_list.append(executor.pop_result())
+
+            time.sleep(0.01)
+
+        return result_list
+
+    @staticmethod
+    def _is_running(pid):
+
+        try:
+            with open(f"/proc/{pid}/stat", 'r', encoding='UTF-8') as stat_file:
+                return stat_file.read().rsplit(')', 1)[1].split()[0] != 'Z'
+        except FileNotFoundError:
+            return False
+
+    @staticmethod
+    def _pop_results(executor, notification_pipe, count):
+
+        result_list = []
+        timeout = time.time() + 5
+
+        while len(result_list) < count and time.time() < timeout:
+
+            for _ in range(notification_pipe.clear()):
+                result_list.append(executor.pop_result())
+
+            time.sleep(0.01)
+
+        return result_list
+
+    def test_execute(self):
+
+        for name in (ExecutorFactory.EXECUTOR_THREAD, ExecutorFactory.EXECUTOR_INLINE, ExecutorFactory.EXECUTOR_ASYNCIO):
+
+            with NotificationPipe() as notification_pipe, \
+                    ExecutorFactory.create(name, 2, notification_pipe) as executor:
+
+                self.assertTrue(executor.start())
+
+                for i in range(3):
+                    executor.push(TestTaskLimiter._create_task(str(i)))
+
+                executor.process(TaskCancellation())
+
+                self.assertEqual(sorted(TestExecutor._pop_results(executor, notification_pipe, 3)),
+                                 [(str(i), TaskFinished.STATUS_OK) for i in range(3)], name)
+                self.assertFalse(executor.is_executing())
+
+    def test_reject_tid_exceeding_slot(self):
+
+        for name in (ExecutorFactory.EXECUTOR_THREAD, ExecutorFactory.EXECUTOR_INLINE, ExecutorFactory.EXECUTOR_ASYNCIO):
+
+            with NotificationPipe() as notification_pipe, \
+                    ExecutorFactory.create(name, 1, notification_pipe) as executor:
+
+                self.assertTrue(executor.start())
+
+                tid = 'x' * (TID_SIZE + 1)
+
+                executor.push(TestTaskLimiter._create_task(tid))
+                executor.push(TestTaskLimiter._create_task('1'))
+
+                executor.process(TaskCancellation())
+
+                self.assertEqual(sorted(TestExecutor._pop_results(executor, notification_pipe, 2)),
+                                 [('1', TaskFinished.STATUS_OK), (tid, TaskFinished.STATUS_FAILED)], name)
+
+    def test_cancel_thread(self):
+
+        with NotificationPipe() as notification_pipe, \
+                ExecutorFactory.create(ExecutorFactory.EXECUTOR_THREAD, 1, notification_pipe) as executor:
+
+            self.assertTrue(executor.start())
+
+            task = TestExecutor._LoopTask()
+            task.tid = '1'
+
+            task_cancellation = TaskCancellation()
+            task_cancellation.add(task.tid)
+            executor.push(task)
+
+            timeout = time.time() + 5
+
+            while not executor.is_executing() and time.time() < timeout:
+                time.sleep(0.01)
+
+            task_cancellation.request(task.tid)
+
+            # Like the controller loop the cancel is retried, until the worker has started the task.
+            while task_cancellation.pending and time.time() < timeout:
+
+                executor.cancel(task_cancellation)
+                time.sleep(0.01)
+
+            self.assertEqual(TestExecutor._pop_results(executor, notification_pipe, 1),
+                             [('1', TaskFinished.STATUS_CANCELLED)])
+
+    def test_dispatch(self):
+
+        with NotificationPipe() as notification_pipe, \
+                ExecutorFactory.create(ExecutorFactory.EXECUTOR_THREAD, 2, notification_pipe) as executor:
+
+            self.assertTrue(executor.start())
+
+            for i in range(3):
+
+                task = TestExecutor._SleepTask(0.2)
+                task.tid = str(i)
+                executor.push(task)
+
+            # Just a task per idle worker is dispatched, the other one waits in the controller.
+            self.assertTrue(executor.has_queued())
+
+            self.assertEqual(sorted(TestExecutor._pop_results(executor, notification_pipe, 3)),
+                             [(str(i), TaskFinished.STATUS_OK) for i in range(3)])
+            self.assertFalse(executor.has_queued())
+
+            TestExecutor._AffinityTask.worker_thread_list.clear()
+
+            for i in range(4):
+
+                task = TestExecutor._AffinityTask()
+                task.tid = str(i)
+                executor.push(task)
+
+                self.assertEqual(TestExecutor._pop_results(executor, notification_pipe, 1),
+                                 [(str(i), TaskFinished.STATUS_OK)])
+
+            self.assertEqual(len(set(TestExecutor._AffinityTask.worker_thread_list)), 1)
+
+    def test_reject_duplicate_tid(self):
+
+        with NotificationPipe() as notification_pipe, \
+                ExecutorFactory.create(ExecutorFactory.EXECUTOR_THREAD, 1, notification_pipe) as executor:
+
+            self.assertTrue(executor.start())
+
+            for _ in range(2):
+
+                task = TestExecutor._SleepTask(0.2)
+                task.tid = '1'
+                executor.push(task)
+
+            self.assertEqual(TestExecutor._pop_results(executor, notification_pipe, 2),
+                             [('1', TaskFinished.STATUS_FAILED), ('1', TaskFinished.STATUS_OK)])
+
+            # The worker is idle again after the task in execution has finished.
+            executor.push(TestTaskLimiter._create_task('2'))
+
+            self.assertEqual(TestExecutor._pop_results(executor, notification_pipe, 1),
+                             [('2', TaskFinished.STATUS_OK)])
+
+    def test_autoscale(self):
+
+        autoscaler = WorkerAutoscaler(1, max_load=1000, min_mem_available=0, idle_timeout=0, interval=0)
+
+        with NotificationPipe() as notification_pipe, \
+                ExecutorFactory.create(ExecutorFactory.EXECUTOR_THREAD, 3, notification_pipe, autoscaler) as executor:
+
+            self.assertTrue(executor.start())
+            self.assertEqual(executor.alive_count(), 1)
+
+            task = TestExecutor._SleepTask(0.5)
+            task.tid = '1'
+            executor.push(task)
+
+            # Grows by a worker per check, while all workers are busy.
+            executor.process(TaskCancellation())
+            self.assertEqual(executor.alive_count(), 2)
+
+            task = TestExecutor._SleepTask(0.5)
+            task.tid = '2'
+            executor.push(task)
+
+            executor.process(TaskCancellation())
+            self.assertEqual(executor.alive_count(), 3)
+
+            self.assertEqual(len(TestExecutor._pop_results(executor, notification_pipe, 2)), 2)
+
+            time.sleep(0.1)
+            executor.process(TaskCancellation())
+
+            timeout = time.time() + 5
+
+            while executor.alive_count() > 1 and time.time() < timeout:
+                time.sleep(0.01)
+
+            self.assertEqual(executor.alive_count(), 1)
+
+            # The supervisor does not respawn retired workers.
+            timeout = time.time() + 2.5
+
+            while time.time() < timeout:
+
+                executor.process(TaskCancellation())
+                self.assertEqual(executor.alive_count(), 1)
+
+                time.sleep(0.01)
+
+    def test_autoscale_respawn_backoff(self):
+
+        autoscaler = WorkerAutoscaler(1, max_load=1000, min_mem_available=0, idle_timeout=60, interval=0)
+
+        with NotificationPipe() as notification_pipe, \
+                ExecutorFactory.create(ExecutorFactory.EXECUTOR_PROCESS,
+                                       2,
+                                       notification_pipe,
+                                       autoscaler,
+                                       WorkerSupervisor(backoff=60)) as executor:
+
+            self.assertTrue(executor.start())
+
+            task = TestExecutor._SleepTask(3)
+            task.tid = '1'
+            executor.push(task)
+
+            executor.process(TaskCancellation())
+            self.assertEqual(executor.alive_count(), 2)
+
+            task = TestExecutor._ExitTask()
+            task.tid = '2'
+            executor.push(task)
+
+            # No index is free to grow the pool, while the dead worker waits for its respawn.
+            self.assertEqual(TestExecutor._process_results(executor, notification_pipe, 1),
+                             [('2', TaskFinished.STATUS_FAILED)])
+
+            executor.process(TaskCancellation())
+            self.assertEqual(executor.alive_count(), 2)
+
+    def test_respawn(self):
+
+        with NotificationPipe() as notification_pipe, \
+                ExecutorFactory.create(ExecutorFactory.EXECUTOR_PROCESS,
+                                       1,
+                                       notification_pipe,
+                                       supervisor=WorkerSupervisor(backoff=0)) as executor:
+
+            self.assertTrue(executor.start())
+
+            task = TestExecutor._ExitTask()
+            task.tid = '1'
+            executor.push(task)
+
+            # The task of the dead worker is reported as failed and the worker is respawned.
+            self.assertEqual(TestExecutor._process_results(executor, notification_pipe, 1),
+                             [('1', TaskFinished.STATUS_FAILED)])
+
+            executor.push(TestTaskLimiter._create_task('2'))
+
+            self.assertEqual(TestExecutor._process_results(executor, notification_pipe, 1),
+                             [('2', TaskFinished.STATUS_OK)])
+            self.assertEqual(executor.alive_count(), 1)
+
+    def test_timeout(self):
+
+        with NotificationPipe() as notification_pipe, \
+                ExecutorFactory.create(ExecutorFactory.EXECUTOR_PROCESS, 1, notification_pipe) as executor:
+
+            self.assertTrue(executor.start())
+
+            pid_fd, pid_file = tempfile.mkstemp()
+            os.close(pid_fd)
+
+            task = TestExecutor._SubprocessTask(pid_file)
+            task.tid = '1'
+            task.timeout = 1
+            executor.push(task)
+
+            # The worker is killed and replaced by the watchdog.
+            self.assertEqual(TestExecutor._process_results(executor, notification_pipe, 1),
+                             [('1', TaskFinished.STATUS_TIMEOUT)])
+
+            try:
+                with open(pid_file, 'r', encoding='UTF-8') as pid_file_obj:
+                    pid = int(pid_file_obj.read())
+            finally:
+                os.remove(pid_file)
+
+            # The subprocess of the task is killed together with the worker, it might just not be reaped yet.
+            timeout = time.time() + 5
+
+            while TestExecutor._is_running(pid) and time.time() < timeout:
+                time.sleep(0.01)
+
+            self.assertFalse(TestExecutor._is_running(pid))
+
+            executor.push(TestTaskLimiter._create_task('2'))
+
+            self.assertEqual(TestExecutor._process_results(executor, notification_pipe, 1),
+                             [('2', TaskFinished.STATUS_OK)])
+            self.assertEqual(executor.alive_count(), 1)
+
+    def test_timeout_after_result(self):
+
+        with NotificationPipe() as notification_pipe, \
+                ExecutorFactory.create(ExecutorFactory.EXECUTOR_PROCESS,
+                                       1,
+                                       notification_pipe,
+                                       supervisor=WorkerSupervisor(backoff=0)) as executor:
+
+            TestExecutor._ExitAfterResultTask.control_block = executor._control_block
+
+            self.assertTrue(executor.start())
+
+            task = TestExecutor._ExitAfterResultTask()
+            task.tid = '1'
+            task.timeout = 1
+            executor.push(task)
+
+            self.assertEqual(TestExecutor._process_results(executor, notification_pipe, 1),
+                             [('1', TaskFinished.STATUS_OK)])
+
+            # The result already pushed is neither reported as timed out nor as failed before the next one.
+            executor.push(TestTaskLimiter._create_task('2'))
+
+            self.assertEqual(TestExecutor._process_results(executor, notification_pipe, 1),
+                             [('2', TaskFinished.STATUS_OK)])
+
+    def test_recycle(self):
+
+        with NotificationPipe() as notification_pipe, \
+                ExecutorFactory.create(ExecutorFactory.EXECUTOR_THREAD,
+                                       1,
+                                       notification_pipe,
+                                       supervisor=WorkerSupervisor(max_tasks=1)) as executor:
+
+            self.assertTrue(executor.start())
+
+            for i in range(2):
+
+                task = TestExecutor._AffinityTask()
+                task.tid = str(i)
+                executor.push(task)
+
+                self.assertEqual(TestExecutor._process_results(executor, notification_pipe, 1),
+                                 [(str(i), TaskFinished.STATUS_OK)])
+
+            # Each task is executed by a new worker thread.
+            self.assertEqual(len(set(TestExecutor._AffinityTask.worker_thread_list[-2:])), 2)
+
+    def test_execute_async(self):
+
+        for name in (ExecutorFactory.EXECUTOR_INLINE, ExecutorFactory.EXECUTOR_ASYNCIO):
+
+            with NotificationPipe() as notification_pipe, \
+                    ExecutorFactory.create(name, 3, notification_pipe) as executor:
+
+                self.assertTrue(executor.start())
+
+                for i in range(3):
+
+                    task = TestExecutor._SleepTask(0.5)
+                    task.tid = str(i)
+                    executor.push(task)
+
+                executor.process(TaskCancellation())
+
+                self.assertEqual(sorted(TestExecutor._pop_results(executor, notification_pipe, 3)),
+                                 [(str(i), TaskFinished.STATUS_OK) for i in range(3)], name)
+
+    def test_timeout_async(self):
+
+        with NotificationPipe() as notification_pipe, \
+                ExecutorFactory.create(ExecutorFactory.EXECUTOR_ASYNCIO, 1, notification_pipe) as executor:
+
+            self.assertTrue(executor.start())
+
+            task = TestExecutor._SleepTask(5)
+            task.tid = '1'
+            task.timeout = 0.2
+            executor.push(task)
+
+            self.assertEqual(TestExecutor._pop_results(executor, notification_pipe, 1),
+                             [('1', TaskFinished.STATUS_TIMEOUT)])
+
+    def test_timeout_not_enforced(self):
+
+        with NotificationPipe() as notification_pipe, \
+                ExecutorFactory.create(ExecutorFactory.EXECUTOR_INLINE, 1, notification_pipe) as executor:
+
+            self.assertTrue(executor.start())
+
+            task = TestTaskLimiter._create_task('1')
+            task.timeout = 1
+
+            with self.assertLogs(level='WARNING'):
+                executor.push(task)
+
+            executor.process(TaskCancellation())
+
+            self.assertEqual(TestExecutor._pop_results(executor, notification_pipe, 1),
+                             [('1', TaskFinished.STATUS_OK)])
+
+    def test_cancel_async(self):
+
+        with NotificationPipe() as notification_pipe, \
+                ExecutorFactory.create(ExecutorFactory.EXECUTOR_ASYNCIO, 1, notification_pipe) as executor:
+
+            self.assertTrue(executor.start())
+
+            task = TestExecutor._SleepTask(5)
+            task.tid = '1'
+
+            task_cancellation = TaskCancellation()
+            task_cancellation.add(task.tid)
+            executor.push(task)
+
+            timeout = time.time() + 5
+
+            while not executor.is_executing() and time.time() < timeout:
+                time.sleep(0.01)
+
+            task_cancellation.request(task.tid)
+            executor.cancel(task_cancellation)
+
+            self.assertEqual(TestExecutor._pop_results(executor, notification_pipe, 1),
+                             [('1', TaskFinished.STATUS_CANCELLED)])
+
+class TestScheduler(unittest.TestCase):
+
+    @staticmethod
+    def _create_task_source(name, task_list):
+
+        task_queue = LocalQueue()
+
+        for task in task_list:
+            task_queue.push(task)
+
+        return TaskSource(name, task_queue, LocalQueue())
+
+    def test_priority(self):
+
+        task_list = [TestTaskLimiter._create_task(str(i)) for i in range(3)]
+        task_list[2].priority = 1
+
+        scheduler = SchedulerFactory.create(SchedulerFactory.POLICY_PRIORITY, 10)
+        task_sources = [TestScheduler._create_task_source('a', task_list)]
+
+        self.assertEqual([scheduler.next_task('node1', task_sources)[0].tid for _ in range(3)], ['2', '0', '1'])
+        self.assertEqual(scheduler.next_task('node1', task_sources), (None, None))
+
+    def test_fair_share(self):
+
+        scheduler = SchedulerFactory.create(SchedulerFactory.POLICY_FAIR_SHARE, 10, {'b': 3.0})
+
+        task_sources = \
+            [TestScheduler._create_task_source('a', [TestTaskLimiter._create_task(f"a{i}") for i in range(3)]),
+             TestScheduler._create_task_source('b', [TestTaskLimiter._create_task(f"b{i}") for i in range(3)])]
+
+        task, task_source = scheduler.next_task('node1', task_sources)
+        scheduler.on_dispatch('node1', task, task_source)
+
+        # Without usage yet the task source with fewer tasks in flight is served.
+        task, task_source = scheduler.next_task('node2', task_sources)
+        scheduler.on_dispatch('node2', task, task_source)
+
+        self.assertEqual(task.tid, 'b0')
+
+        time.sleep(0.01)
+
+        scheduler.on_finish('node1', 'a0', 'a')
+        scheduler.on_finish('node2', 'b0', 'b')
+
+        # Both used the same worker-seconds, but the share of task source b is higher.
+        self.assertGreater(scheduler.usage('a', time.time()), 0)
+        self.assertEqual(scheduler.next_task('node1', task_sources)[0].tid, 'b1')
+
+    def test_fair_share_decay_in_flight(self):
+
+        scheduler = SchedulerFactory.create(SchedulerFactory.POLICY_FAIR_SHARE, 10, {}, half_life=0.05)
+
+        task_sources = [TestScheduler._create_task_source('a', [TestTaskLimiter._create_task('a0')])]
+
+        task, task_source = scheduler.next_task('node1', task_sources)
+        scheduler.on_dispatch('node1', task, task_source)
+
+        timeout = time.time() + 0.3
+
+        while time.time() < timeout:
+
+            scheduler.on_timer(time.time())
+            time.sleep(0.01)
+
+        scheduler.on_finish('node1', 'a0', 'a')
+
+        # The runtime of the task is decayed while in flight, not added completely on its finish.
+        self.assertLess(scheduler.usage('a', time.time()), 0.15)
+
+    def test_locality(self):
+
+        task_list = [TestTaskLimiter._create_task(str(i)) for i in range(3)]
+        task_list[0].locality = 'dm*.example.org'
+        task_list[2].locality = 'login*.example.org'
+
+        scheduler = SchedulerFactory.create(SchedulerFactory.POLICY_LOCALITY, 10)
+        task_sources = [TestScheduler._create_task_source('a', task_list)]
+
+        self.assertEqual(scheduler.next_task('login1.example.org', task_sources)[0].tid, '2')
+        self.assertEqual(scheduler.next_task('login1.example.org', task_sources)[0].tid, '1')
+        self.assertEqual(scheduler.next_task('login1.example.org', task_sources)[0].tid, '0')
+
+    def test_sticky(self):
+
+        class AffinityTask(EmptyTask):
+
+            @property
+            def affinity_key(self):
+                return self.tid
+
+        task_list = [AffinityTask() for i in range(3)]
+
+        for i, task in enumerate(task_list):
+            task.tid = str(i)
+
+        scheduler = SchedulerFactory.create(SchedulerFactory.POLICY_STICKY, 10, sticky_wait=60)
+        task_sources = [TestScheduler._create_task_source('a', task_list)]
+
+        scheduler.on_heartbeat('node1')
+        scheduler.on_heartbeat('node2')
+
+        node1_tid_list = [tid for tid in ('0', '1', '2') if scheduler.owner(tid) == 'node1']
+
+        task = scheduler.next_task('node1', task_sources)[0]
+
+        if node1_tid_list:
+            self.assertEqual(task.tid, node1_tid_list[0])
+        else:
+            self.assertIsNone(task)
+
+        # Tasks of a controller that left are dispatched to the remaining controller.
+        scheduler.forget('node1')
+
+        self.assertEqual(len([scheduler.next_task('node2', task_sources)[0] for _ in range(3 - len(node1_tid_list[:1]))]),
+                         3 - len(node1_tid_list[:1]))
+
+class TestConsistentHashRing(unittest.TestCase):
+
+    def test_minimal_rebalance(self):
+
+        ring = ConsistentHashRing()
+
+        for i in range(4):
+            ring.add(f"node{i}.example.org")
+
+        key_list = [f"ost:{i}" for i in range(1000)]
+        node_dict = {key: ring.node(key) for key in key_list}
+
+        ring.add('node4.example.org')
+
+        moved_key_list = [key for key in key_list if ring.node(key) != node_dict[key]]
+
+        # Just keys moving to the new node are remapped.
+        self.assertTrue(all(ring.node(key) == 'node4.example.org' for key in moved_key_list))
+        self.assertLess(len(moved_key_list), 400)
+
+        ring.remove('node4.example.org')
+
+        self.assertEqual({key: ring.node(key) for key in key_list}, node_dict)
+
 if __name__ == '__main__':
     unittest.main()
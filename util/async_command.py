@@ -0,0 +1,37 @@
+#!/usr/bin/env python3
+#
+# -*- coding: utf-8 -*-
+#
+# © Copyright 2023 GSI Helmholtzzentrum für Schwerionenforschung
+#
+# This software is distributed under
+# the terms of the GNU General Public Licence version 3 (GPL Version 3),
+# copied verbatim in the file "LICENCE".
+
+import asyncio
+
+async def run_command(args: list[str], timeout: float = None) -> str:
+    """Runs a command as subprocess without blocking the event loop and returns its standard output.
+
+    The subprocess is killed, if the timeout in seconds passes or the awaiting task is cancelled.
+    """
+
+    process = await asyncio.create_subprocess_exec(*args,
+                                                   stdout=asyncio.subprocess.PIPE,
+                                                   stderr=asyncio.subprocess.PIPE)
+
+    try:
+        stdout, stderr = await asyncio.wait_for(process.communicate(), timeout)
+    except BaseException:
+
+        if process.returncode is None:
+            process.kill()
+            await process.wait()
+
+        raise
+
+    if process.returncode:
+        raise RuntimeError(f"Command {args[0]} failed with exit code {process.returncode}: "
+                           f"{stderr.decode().strip()}")
+
+    return stdout.decode()
@@ -9,6 +9,8 @@
 # copied verbatim in the file "LICENCE".
 
 import multiprocessing
+import threading
+import asyncio
 import logging
 import signal
 import ctypes
@@ -17,7 +19,10 @@ import sys
 import abc
 import os
 
-from ctrl.critical_section import CriticalSection
+from msg.task_finished import TaskFinished
+from msg.task_return import TaskReturn
+from task.poison_pill import PoisonPill
+from task.task_cancelled_error import TaskCancelledError
 
 class WorkerState:
 
@@ -39,110 +44,237 @@ class WorkerState:
         else:
             raise RuntimeError(f"Not supported worker state detected: {state}")
 
-class WorkerStateTableItem:
+class BaseWorker:
+    """Executes the tasks popped from the task queue and pushes their TID and status to its completion ring.
 
-    def __init__(self):
-
-        # # RETURNS STDOUT: self._state = "TEXT" + str(NUMBER)
-        # # RETURNS BAD VALUE: self._timestamp.value = 1234567890.99
-        # self._state = multiprocessing.RawValue(ctypes.c_char_p)
-        # self._tid = multiprocessing.RawValue(ctypes.c_char_p)
-        # self._timestamp = multiprocessing.RawValue(ctypes.c_float)
-
-        self._state = multiprocessing.RawValue(ctypes.c_int, WorkerState.NOT_READY)
-        self._tid = multiprocessing.RawArray('c', 64)
-        self._timestamp = multiprocessing.RawValue(ctypes.c_uint, 0)
-
-    # TODO: Use Properties... see OSTInfo
-    @property
-    def get_state(self):
-        return self._state.value
-
-    @property
-    def get_tid(self):
-        return self._tid.value.decode()
-
-    @property
-    def get_timestamp(self):
-        return self._timestamp.value
-
-    def set_state(self, state):
-        self._state.value = state
-
-    def set_tid(self, task_name):
-        self._tid.value = task_name.encode()
-
-    def set_timestamp(self, timestamp):
-        self._timestamp.value = timestamp
-
-class Worker(multiprocessing.Process):
+    The execution of a task is shared by the worker processes, worker threads and the other executors,
+    each worker keeps its state in its slot of the worker control block by its index.
+    """
 
     def __init__(self,
                  name,
-                 worker_state_table_item,
-                 lock_worker_state_table,
+                 index,
+                 control_block,
                  task_queue,
-                 result_queue, cond_result_queue):
+                 notification_pipe):
 
         super().__init__()
 
         self.name = name
 
-        self.worker_state_table_item = worker_state_table_item
-        self.lock_worker_state_table = lock_worker_state_table
+        self.index = index
+        self.control_block = control_block
 
         self.task_queue = task_queue
 
-        self.result_queue = result_queue
-        self.cond_result_queue = cond_result_queue
+        self.notification_pipe = notification_pipe
 
         self.run_flag = False
 
+        # The controller signals a cancel for the task in execution.
+        self.cancel_flag = False
+        self.executing_tid = None
+
+        self._cancel_lock = threading.Lock()
+        self._thread_ident = None
+
     def start(self):
 
         self.run_flag = True
 
         super().start()
 
-    def run(self):
+    def cancel(self):
+        """Cancels the task in execution."""
+        raise NotImplementedError(f"No cancel supported by worker: {self.__class__.__name__}")
 
-        try:
+    def shutdown(self):
+        """Lets the worker quit after the task in execution, a PoisonPill frees it from waiting on the task queue."""
+        raise NotImplementedError(f"No shutdown supported by worker: {self.__class__.__name__}")
 
-            signal.signal(signal.SIGUSR1, self.signal_handler_shutdown)
-            signal.siginterrupt(signal.SIGUSR1, True)
+    def set_ready(self):
+        self.control_block.set_state(self.index, WorkerState.READY)
 
-            logging.debug("Started Worker: %s", self.name)
+    def process_tasks(self):
+
+        while self.run_flag:
+
+            task = self.task_queue.pop()
+
+            # Just frees the worker from waiting on the task queue, e.g. for being retired.
+            if isinstance(task, PoisonPill):
+                break
 
-            with CriticalSection(self.lock_worker_state_table):
+            self.process_task(task)
 
-                self.worker_state_table_item.set_state(WorkerState.READY)
-                self.worker_state_table_item.set_timestamp(int(time.time()))
+        self.control_block.set_state(self.index, WorkerState.NOT_READY)
 
-            while self.run_flag:
+    def process_task(self, task, cancelled=False):
+        """Executes the task and reports its result, a task already cancelled is not executed."""
 
-                task = self.task_queue.pop()
+        self._begin_task(task, cancelled)
+        self._finish_task(task, self.execute(task))
 
-                with CriticalSection(self.lock_worker_state_table):
+    async def process_task_async(self, task):
+        """Executes the task asynchronously on the running event loop and reports its result."""
 
-                    self.worker_state_table_item.set_state(WorkerState.EXECUTING)
-                    self.worker_state_table_item.set_tid(task.tid)
-                    self.worker_state_table_item.set_timestamp(int(time.time()))
+        self._begin_task(task, False)
+        self._finish_task(task, await self.execute_async(task))
+
+    def execute(self, task):
+        """Executes the task and returns its status."""
+
+        status = TaskFinished.STATUS_OK
+
+        try:
 
-                try:
+            try:
+
+                if self._begin_execution(task):
                     task.execute()
-                except Exception:
-                    logging.exception(f"Caught exception in worker[{self.name}] during task execution")
+                else:
+                    status = TaskReturn.STATUS_RETURNED
+
+            finally:
+                self._end_execution()
+
+        except TaskCancelledError:
+            status = self._cancelled(task)
+
+        except Exception:
+            status = self._failed()
+
+        return status
+
+    async def execute_async(self, task):
+        """Awaits the asynchronous execution of the task and returns its status.
 
-                with CriticalSection(self.cond_result_queue):
+        The task is cancelled by cancelling the asyncio task awaiting it.
+        A task exceeding its timeout is cancelled as well, but reported as timed out.
+        """
+
+        status = TaskFinished.STATUS_OK
+
+        try:
+
+            try:
+
+                if not self._begin_execution(task):
+                    status = TaskReturn.STATUS_RETURNED
+                elif task.timeout:
+                    await asyncio.wait_for(task.execute_async(), task.timeout)
+                else:
+                    await task.execute_async()
+
+            finally:
+                self._end_execution()
+
+        except (TaskCancelledError, asyncio.CancelledError):
+            status = self._cancelled(task)
+
+        except asyncio.TimeoutError:
+
+            logging.error(f"Timed out task in worker[{self.name}]: {task.tid} - timeout: {task.timeout:.1f}s")
+            status = TaskFinished.STATUS_TIMEOUT
+
+        except Exception:
+            status = self._failed()
+
+        return status
+
+    def _begin_task(self, task, cancelled):
+
+        # Reset before the task is visible as executing, so a cancel can just be signaled for this task.
+        self.cancel_flag = cancelled
+
+        self.control_block.set_state(self.index, WorkerState.EXECUTING, task.tid)
+
+    def _finish_task(self, task, status):
+
+        self.control_block.push_result(self.index, task.tid, status)
+
+        self.set_ready()
+
+        # Notified after being ready, so the controller can request the next task right away.
+        self.notification_pipe.notify()
+
+    def _begin_execution(self, task):
+        """Returns True, if the task is to be executed, otherwise it is returned to the master."""
+
+        with self._cancel_lock:
+            self.executing_tid = task.tid
+            self._thread_ident = threading.get_ident()
+
+        # The task was cancelled before its execution started.
+        if self.cancel_flag:
+            raise TaskCancelledError(task.tid)
+
+        # A task prefetched by the controller is returned to the master, if it expired meanwhile.
+        return not task.is_expired(time.time())
+
+    def _end_execution(self):
+
+        with self._cancel_lock:
+            self.executing_tid = None
+
+    def _cancelled(self, task):
+
+        logging.info(f"Cancelled task in worker[{self.name}]: {task.tid}")
+
+        try:
+            task.on_cancel()
+        except Exception:
+            logging.exception(f"Caught exception in worker[{self.name}] during task cancellation")
 
-                    self.result_queue.push(task.tid)
-                    self.cond_result_queue.notify()
+        return TaskFinished.STATUS_CANCELLED
 
-                with CriticalSection(self.lock_worker_state_table):
+    def _failed(self):
 
-                    self.worker_state_table_item.set_state(WorkerState.READY)
-                    self.worker_state_table_item.set_tid('')
-                    self.worker_state_table_item.set_timestamp(int(time.time()))
+        logging.exception(f"Caught exception in worker[{self.name}] during task execution")
+
+        return TaskFinished.STATUS_FAILED
+
+    def _raise_cancel(self):
+        """Raises the TaskCancelledError asynchronously in the thread executing a task.
+
+        The error is raised once the thread runs Python code again, e.g. not before a blocking call returns.
+        """
+
+        with self._cancel_lock:
+
+            self.cancel_flag = True
+
+            if self.executing_tid and self._thread_ident:
+                ctypes.pythonapi.PyThreadState_SetAsyncExc(ctypes.c_ulong(self._thread_ident),
+                                                           ctypes.py_object(TaskCancelledError))
+
+class Worker(BaseWorker, multiprocessing.Process):
+    """Worker process executing tasks, forked by the process executor of the controller."""
+
+    def cancel(self):
+        os.kill(self.pid, signal.SIGUSR2)
+
+    def shutdown(self):
+        os.kill(self.pid, signal.SIGUSR1)
+
+    def run(self):
+
+        try:
+
+            # Own process group, so subprocesses of a task are killed together with the worker on a task timeout.
+            os.setpgrp()
+
+            signal.signal(signal.SIGUSR1, self.signal_handler_shutdown)
+            signal.siginterrupt(signal.SIGUSR1, True)
+
+            signal.signal(signal.SIGUSR2, self.signal_handler_cancel)
+            signal.siginterrupt(signal.SIGUSR2, True)
+
+            logging.debug("Started Worker: %s", self.name)
+
+            self.set_ready()
+
+            self.process_tasks()
 
             logging.debug("Exiting worker: %s", self.name)
 
@@ -155,3 +287,69 @@ class Worker(multiprocessing.Process):
     def signal_handler_shutdown(self, signal, frame):
         # pylint: disable=unused-argument
         self.run_flag = False
+
+    def signal_handler_cancel(self, signal, frame):
+        # pylint: disable=unused-argument
+
+        self.cancel_flag = True
+
+        if self.executing_tid:
+            raise TaskCancelledError(self.executing_tid)
+
+class SlotWorker(BaseWorker):
+    """Slot for executing a task in a thread of an executor not owning the thread, e.g. of a thread pool.
+
+    A task executed asynchronously is cancelled by its asyncio task set by the executor.
+    """
+
+    def __init__(self, *args):
+
+        super().__init__(*args)
+
+        self.async_task : asyncio.Task = None
+
+    def cancel(self):
+
+        async_task = self.async_task
+
+        if async_task:
+
+            self.cancel_flag = True
+            async_task.get_loop().call_soon_threadsafe(async_task.cancel)
+
+        else:
+            self._raise_cancel()
+
+    def shutdown(self):
+        self.run_flag = False
+
+class ThreadWorker(BaseWorker, threading.Thread):
+    """Worker thread executing tasks within the controller process, used by the thread executor."""
+
+    def __init__(self, *args):
+
+        super().__init__(*args)
+
+        # A thread blocked in a task does not keep the controller from exiting.
+        self.daemon = True
+
+    def cancel(self):
+        self._raise_cancel()
+
+    def shutdown(self):
+        self.run_flag = False
+
+    def run(self):
+
+        try:
+
+            logging.debug("Started Worker: %s", self.name)
+
+            self.set_ready()
+
+            self.process_tasks()
+
+            logging.debug("Exiting worker: %s", self.name)
+
+        except Exception:
+            logging.exception(f"Caught exception in worker[{self.name}] during run loop")